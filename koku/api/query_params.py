@@ -21,11 +21,14 @@ from api.models import Tenant
 from api.models import User
 from api.provider.models import Provider
 from api.report.queries import ReportQueryHandler
+from koku.cache import get_cached_tag_keys
 from reporting.models import OCPAllCostLineItemDailySummary
 from reporting.provider.aws.models import AWSOrganizationalUnit
 
 LOG = logging.getLogger(__name__)
 
+TAG_PARAM_PREFIXES = ("tag:", "and:tag:", "or:tag:")
+
 
 class QueryParameters:
     """Query parameter container object.
@@ -73,10 +76,10 @@ class QueryParameters:
         self.query_handler = caller.query_handler
         self.tag_handler = caller.tag_handler
 
-        self.tag_keys = []
+        self.tag_keys = set()
         if self.report_type != "tags":
             for tag_model in self.tag_handler:
-                self.tag_keys.extend(self._get_tag_keys(tag_model))
+                self.tag_keys.update(self._get_tag_keys(tag_model))
 
         self._validate()  # sets self.parameters
 
@@ -106,27 +109,28 @@ class QueryParameters:
         return pformat(self.__repr__())
 
     def _get_tag_keys(self, model):
-        """Get a list of tag keys to validate filters."""
-        with tenant_context(self.tenant):
-            tags = model.objects.values("key")
-            tag_list = [":".join(["tag", tag.get("key")]) for tag in tags]
-            tag_list.extend([":".join(["and:tag", tag.get("key")]) for tag in tags])
-            tag_list.extend([":".join(["or:tag", tag.get("key")]) for tag in tags])
-        return tag_list
+        """Get the set of tag keys to validate filters."""
+        return get_cached_tag_keys(self.tenant.schema_name, model)
+
+    def _is_tag_param(self, param):
+        """Return True if param is a tag:, and:tag: or or:tag: parameter for a known tag key."""
+        if not isinstance(param, str):
+            return False
+        for prefix in TAG_PARAM_PREFIXES:
+            if param.startswith(prefix) and param.replace(prefix, "", 1) in self.tag_keys:
+                return True
+        return False
 
     def _process_tag_query_params(self, query_params):
-        """Reduce the set of tag keys based on those being queried."""
-        tag_key_set = set(self.tag_keys)
+        """Reduce the set of tag keys to the tag parameters being queried."""
         param_tag_keys = set()
         for key, value in query_params.items():
+            params = [key]
             if isinstance(value, (dict, list)):
-                for inner_key in value:
-                    if inner_key in tag_key_set:
-                        param_tag_keys.add(inner_key)
-            elif value in tag_key_set:
-                param_tag_keys.add(value)
-            if key in tag_key_set:
-                param_tag_keys.add(key)
+                params.extend(value)
+            else:
+                params.append(value)
+            param_tag_keys.update(param for param in params if self._is_tag_param(param))
         return param_tag_keys
 
     def _configure_access_params(self, caller):
@@ -21,6 +21,10 @@ LOG = logging.getLogger(__name__)
 class OCPInfrastructureReportQueryHandlerBase(AWSReportQueryHandler):
     """Base class for OCP on Infrastructure."""
 
+    def format_csv_rows(self, rows):
+        """Return the rows of a streamed CSV export, which keep their account fields."""
+        return rows
+
     def execute_query(self):  # noqa: C901
         """Execute query and return provided data.
 
@@ -47,38 +51,42 @@ class OCPInfrastructureReportQueryHandlerBase(AWSReportQueryHandler):
                     account_alias=Coalesce(F(self._mapper.provider_map.get("alias")), "usage_account_id")
                 )
 
-            if self._limit and query_data:
+            if self._limit and query_data.exists():
                 query_data = self._group_by_ranks(query, query_data)
                 if not self.parameters.get("order_by"):
                     # override implicit ordering when using ranked ordering.
                     query_order_by[-1] = "rank"
 
-            if query.exists():
-                aggregates = self._mapper.report_type_map.get("aggregates")
-                metric_sum = query.aggregate(**aggregates)
+            aggregates = self._mapper.report_type_map.get("aggregates")
+            metric_sum = self._aggregate_totals(query, aggregates)
+            if metric_sum is not None:
                 query_sum = {key: metric_sum.get(key) for key in aggregates}
 
             if self._delta:
                 query_data = self.add_deltas(query_data, query_sum)
 
             is_csv_output = self.parameters.accept_type and "text/csv" in self.parameters.accept_type
-
-            query_data = self.order_by(query_data, query_order_by)
+            if is_csv_output and not self._limit:
+                query_data = self._order_csv_data(query_data, query_order_by)
+            else:
+                query_data = self.order_by(query_data, query_order_by)
             cost_units_value = self._mapper.report_type_map.get("cost_units_fallback", "USD")
             usage_units_value = self._mapper.report_type_map.get("usage_units_fallback")
             count_units_value = self._mapper.report_type_map.get("count_units_fallback")
-            if query_data:
-                cost_units_value = query_data[0].get("cost_units")
+            # A streamed CSV export is still a queryset, so only its first row is fetched here
+            first_row = next(iter(query_data[:1]), None)
+            if first_row:
+                cost_units_value = first_row.get("cost_units")
                 if self._mapper.usage_units_key:
-                    usage_units_value = query_data[0].get("usage_units")
+                    usage_units_value = first_row.get("usage_units")
                 if self._mapper.report_type_map.get("annotations", {}).get("count_units"):
-                    count_units_value = query_data[0].get("count_units")
+                    count_units_value = first_row.get("count_units")
 
             if is_csv_output:
                 if self._limit:
                     data = self._ranked_list(list(query_data))
                 else:
-                    data = list(query_data)
+                    data = query_data
             else:
                 groups = copy.deepcopy(query_group_by)
                 groups.remove("date")
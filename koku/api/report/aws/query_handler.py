@@ -11,6 +11,7 @@ from functools import reduce
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models import F
 from django.db.models import Q
+from django.db.models import QuerySet
 from django.db.models import Value
 from django.db.models.expressions import Func
 from django.db.models.functions import Coalesce
@@ -176,6 +177,9 @@ class AWSReportQueryHandler(ReportQueryHandler):
         return query_data
 
     def _set_csv_output_fields(self, query_data):
+        if isinstance(query_data, QuerySet):
+            # The rows of a streamed export are renamed by format_csv_rows as they are read
+            return query_data
         for rec in query_data:
             for target, mapped in CSV_FIELD_MAP.items():
                 if target in rec:
@@ -184,6 +188,11 @@ class AWSReportQueryHandler(ReportQueryHandler):
 
         return query_data
 
+    def format_csv_rows(self, rows):
+        """Rename the account fields of each streamed CSV row."""
+        for row in rows:
+            yield self._set_csv_output_fields([row])[0]
+
     def execute_query(self):  # noqa: C901
         """Execute each query needed to return the results.
 
@@ -356,20 +365,15 @@ class AWSReportQueryHandler(ReportQueryHandler):
         cost_units_fallback = self._mapper.report_type_map.get("cost_units_fallback")
         usage_units_fallback = self._mapper.report_type_map.get("usage_units_fallback")
         count_units_fallback = self._mapper.report_type_map.get("count_units_fallback")
-        if query.exists():
-            sum_annotations = {"cost_units": Coalesce(self._mapper.cost_units_key, Value(cost_units_fallback))}
-            if self._mapper.usage_units_key:
-                units_fallback = self._mapper.report_type_map.get("usage_units_fallback")
-                sum_annotations["usage_units"] = Coalesce(self._mapper.usage_units_key, Value(units_fallback))
-            sum_query = query.annotate(**sum_annotations)
-            units_value = sum_query.values("cost_units").first().get("cost_units", cost_units_fallback)
-            sum_units = {"cost_units": units_value}
-            if self._mapper.usage_units_key:
-                units_value = sum_query.values("usage_units").first().get("usage_units", usage_units_fallback)
-                sum_units["usage_units"] = units_value
+        units = {"cost_units": (self._mapper.cost_units_key, cost_units_fallback)}
+        if self._mapper.usage_units_key:
+            units["usage_units"] = (self._mapper.usage_units_key, usage_units_fallback)
+        total_query = self._aggregate_totals(query, self._get_total_aggregates(), units)
+        if total_query is not None:
+            sum_units = {unit_key: total_query[unit_key] for unit_key in units}
             if annotations.get("count_units"):
                 sum_units["count_units"] = count_units_fallback
-            query_sum = self.calculate_total(**sum_units)
+            query_sum = self.calculate_total(total_query, **sum_units)
         else:
             sum_units["cost_units"] = cost_units_fallback
             if annotations.get("count_units"):
@@ -600,7 +604,7 @@ select coalesce(raa.account_alias, t.usage_account_id)::text as "account",
 
             query_sum = self._build_sum(query, annotations)
 
-            if self._limit and query_data and not org_unit_applied:
+            if self._limit and query_data.exists() and not org_unit_applied:
                 query_data = self._group_by_ranks(query, query_data)
                 if not self.parameters.get("order_by"):
                     # override implicit ordering when using ranked ordering.
@@ -609,10 +613,13 @@ select coalesce(raa.account_alias, t.usage_account_id)::text as "account",
             if self._delta:
                 query_data = self.add_deltas(query_data, query_sum)
 
-            query_data = self.order_by(query_data, query_order_by)
+            if self.is_csv_output and not (self._limit or org_unit_applied or tag_results is not None):
+                query_results = self._order_csv_data(query_data, query_order_by)
+            else:
+                query_data = self.order_by(query_data, query_order_by)
 
-            # Fetch the data (returning list(dict))
-            query_results = list(query_data)
+                # Fetch the data (returning list(dict))
+                query_results = list(query_data)
 
             # Resolve tag exists for unique account returned
             # if tag_results is not Falsey
@@ -638,37 +645,42 @@ select coalesce(raa.account_alias, t.usage_account_id)::text as "account",
         query_data = data
         return query_data, query_sum
 
-    def calculate_total(self, **units):
+    def _get_total_aggregates(self):
+        """Return the aggregates used for the report totals."""
+        aggregates = copy.deepcopy(self._mapper.report_type_map.get("aggregates", {}))
+        if not self.parameters.parameters.get("compute_count"):
+            # Query parameter indicates count should be removed from DB queries
+            aggregates.pop("count", None)
+        return aggregates
+
+    def calculate_total(self, total_query=None, **units):
         """Calculate aggregated totals for the query.
 
         Args:
+            total_query (dict): The totals already aggregated by _aggregate_totals, if any
             units (dict): The units dictionary
 
         Returns:
             (dict) The aggregated totals for the query
 
         """
-        query_group_by = ["date"] + self._get_group_by()
         query = self.query_table.objects.filter(self.query_filter)
-        query_data = query.annotate(**self.annotations)
-        query_data = query_data.values(*query_group_by)
-
-        aggregates = copy.deepcopy(self._mapper.report_type_map.get("aggregates", {}))
-        if not self.parameters.parameters.get("compute_count"):
-            # Query parameter indicates count should be removed from DB queries
-            aggregates.pop("count", None)
+        aggregates = self._get_total_aggregates()
+        if total_query is None:
+            total_query = query.aggregate(**aggregates)
 
         counts = None
 
         if "count" in aggregates:
+            query_group_by = ["date"] + self._get_group_by()
+            query_data = query.annotate(**self.annotations).values(*query_group_by)
             resource_ids = (
                 query_data.annotate(resource_id=Func(F("resource_ids"), function="unnest"))
                 .values_list("resource_id", flat=True)
                 .distinct()
             )
-            counts = len(resource_ids)
+            counts = resource_ids.count()
 
-        total_query = query.aggregate(**aggregates)
         for unit_key, unit_value in units.items():
             total_query[unit_key] = unit_value
 
@@ -113,20 +113,14 @@ class GCPReportQueryHandler(ReportQueryHandler):
         cost_units_fallback = self._mapper.report_type_map.get("cost_units_fallback")
         usage_units_fallback = self._mapper.report_type_map.get("usage_units_fallback")
 
-        if query.exists():
-            sum_annotations = {"cost_units": Coalesce(self._mapper.cost_units_key, Value(cost_units_fallback))}
-            if self._mapper.usage_units_key:
-                units_fallback = self._mapper.report_type_map.get("usage_units_fallback")
-                sum_annotations["usage_units"] = Coalesce(self._mapper.usage_units_key, Value(units_fallback))
-            sum_query = query.annotate(**sum_annotations)
-
-            units_value = sum_query.values("cost_units").first().get("cost_units", cost_units_fallback)
-            sum_units = {"cost_units": units_value}
-            if self._mapper.usage_units_key:
-                units_value = sum_query.values("usage_units").first().get("usage_units", usage_units_fallback)
-                sum_units["usage_units"] = units_value
-
-            query_sum = self.calculate_total(**sum_units)
+        units = {"cost_units": (self._mapper.cost_units_key, cost_units_fallback)}
+        if self._mapper.usage_units_key:
+            units["usage_units"] = (self._mapper.usage_units_key, usage_units_fallback)
+        aggregates = self._mapper.report_type_map.get("aggregates")
+        total_query = self._aggregate_totals(query, aggregates, units)
+        if total_query is not None:
+            sum_units = {unit_key: total_query[unit_key] for unit_key in units}
+            query_sum = self.calculate_total(total_query, **sum_units)
         else:
             sum_units["cost_units"] = cost_units_fallback
             if self._mapper.report_type_map.get("annotations", {}).get("usage_units"):
@@ -169,14 +163,13 @@ class GCPReportQueryHandler(ReportQueryHandler):
 
             is_csv_output = self.parameters.accept_type and "text/csv" in self.parameters.accept_type
 
-            query_data = self.order_by(query_data, query_order_by)
-
             if is_csv_output:
                 if self._limit:
-                    data = self._ranked_list(list(query_data))
+                    data = self._ranked_list(list(self.order_by(query_data, query_order_by)))
                 else:
-                    data = list(query_data)
+                    data = self._order_csv_data(query_data, query_order_by)
             else:
+                query_data = self.order_by(query_data, query_order_by)
                 groups = copy.deepcopy(query_group_by)
                 groups.remove("date")
                 data = self._apply_group_by(list(query_data), groups)
@@ -190,23 +183,22 @@ class GCPReportQueryHandler(ReportQueryHandler):
         self.query_data = data
         return self._format_query_response()
 
-    def calculate_total(self, **units):
+    def calculate_total(self, total_query=None, **units):
         """Calculate aggregated totals for the query.
 
         Args:
+            total_query (dict): The totals already aggregated by _aggregate_totals, if any
             units (dict): The units dictionary
 
         Returns:
             (dict) The aggregated totals for the query
 
         """
-        query_group_by = ["date"] + self._get_group_by()
-        query = self.query_table.objects.filter(self.query_filter)
-        query_data = query.annotate(**self.annotations)
-        query_data = query_data.values(*query_group_by)
-        aggregates = self._mapper.report_type_map.get("aggregates")
+        if total_query is None:
+            query = self.query_table.objects.filter(self.query_filter)
+            aggregates = self._mapper.report_type_map.get("aggregates")
+            total_query = query.aggregate(**aggregates)
 
-        total_query = query.aggregate(**aggregates)
         for unit_key, unit_value in units.items():
             total_query[unit_key] = unit_value
 
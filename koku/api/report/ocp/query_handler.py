@@ -131,34 +131,35 @@ class OCPReportQueryHandler(ReportQueryHandler):
 
             query_data = query_data.values(*query_group_by).annotate(**self.report_annotations)
 
-            if self._limit and query_data:
+            if self._limit and query_data.exists():
                 query_data = self._group_by_ranks(query, query_data)
                 if not self.parameters.get("order_by"):
                     # override implicit ordering when using ranked ordering.
                     query_order_by[-1] = "rank"
 
             # Populate the 'total' section of the API response
-            if query.exists():
-                aggregates = self._mapper.report_type_map.get("aggregates")
-                metric_sum = query.aggregate(**aggregates)
+            aggregates = self._mapper.report_type_map.get("aggregates")
+            metric_sum = self._aggregate_totals(query, aggregates)
+            if metric_sum is not None:
                 query_sum = {key: metric_sum.get(key) for key in aggregates}
 
             query_data, total_capacity = self.get_cluster_capacity(query_data)
             if total_capacity:
                 query_sum.update(total_capacity)
+                # The capacity was added to the fetched rows, which must not be queried again
+                query_data = list(query_data)
 
             if self._delta:
                 query_data = self.add_deltas(query_data, query_sum)
             is_csv_output = self.parameters.accept_type and "text/csv" in self.parameters.accept_type
 
-            query_data = self.order_by(query_data, query_order_by)
-
             if is_csv_output:
                 if self._limit:
-                    data = self._ranked_list(list(query_data))
+                    data = self._ranked_list(list(self.order_by(query_data, query_order_by)))
                 else:
-                    data = list(query_data)
+                    data = self._order_csv_data(query_data, query_order_by)
             else:
+                query_data = self.order_by(query_data, query_order_by)
                 # Pass in a copy of the group by without the added
                 # tag column name prefix
                 groups = copy.deepcopy(query_group_by)
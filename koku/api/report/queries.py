@@ -14,13 +14,19 @@ from decimal import Decimal
 from decimal import DivisionByZero
 from decimal import InvalidOperation
 from itertools import groupby
+from itertools import islice
 from urllib.parse import quote_plus
 
+from django.db.models import Count
 from django.db.models import F
+from django.db.models import Max
 from django.db.models import Q
+from django.db.models import QuerySet
+from django.db.models import Value
 from django.db.models import Window
 from django.db.models.expressions import OrderBy
 from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
 from django.db.models.functions import Rank
 
 from api.models import Provider
@@ -29,6 +35,19 @@ from api.query_filter import QueryFilterCollection
 from api.query_handler import QueryHandler
 
 LOG = logging.getLogger(__name__)
+NUMERIC_ORDERING = (
+    "date",
+    "rank",
+    "delta",
+    "delta_percent",
+    "total",
+    "usage",
+    "request",
+    "limit",
+    "sup_total",
+    "infra_total",
+    "cost_total",
+)
 
 
 def strip_tag_prefix(tag):
@@ -75,6 +94,7 @@ class ReportQueryHandler(QueryHandler):
         self._report_type = parameters.report_type
         self._delta = parameters.delta
         self._offset = parameters.get_filter("offset", default=0)
+        self._rank_page_dates = None
         self.query_delta = {"value": None, "percent": None}
 
         self.query_filter = self._get_filter()
@@ -612,19 +632,6 @@ class ReportQueryHandler(QueryHandler):
             (list): The sorted/ordered list
 
         """
-        numeric_ordering = [
-            "date",
-            "rank",
-            "delta",
-            "delta_percent",
-            "total",
-            "usage",
-            "request",
-            "limit",
-            "sup_total",
-            "infra_total",
-            "cost_total",
-        ]
         tag_str = "tag:"
         db_tag_prefix = self._mapper.tag_column + "__"
         sorted_data = data
@@ -634,7 +641,7 @@ class ReportQueryHandler(QueryHandler):
             if field.startswith("-"):
                 reverse = True
                 field = field[1:]
-            if field in numeric_ordering:
+            if field in NUMERIC_ORDERING:
                 sorted_data = sorted(
                     sorted_data, key=lambda entry: (entry[field] is None, entry[field]), reverse=reverse
                 )
@@ -653,6 +660,29 @@ class ReportQueryHandler(QueryHandler):
                 )
         return sorted_data
 
+    def _order_csv_data(self, query_data, order_fields):
+        """Order the rows of an unranked CSV export.
+
+        When every order field is numeric the rows are ordered in SQL, the same way
+        order_by sorts them, and stay a lazy queryset that the view streams a page of
+        through a server-side cursor. Anything else is sorted in Python as before.
+        """
+        if not isinstance(query_data, QuerySet) or self._delta or self.parameters.get("units"):
+            return self.order_by(query_data, order_fields)
+        orderings = []
+        for field in order_fields:
+            descending = field.startswith("-")
+            field = field.lstrip("-")
+            if field not in NUMERIC_ORDERING:
+                return self.order_by(query_data, order_fields)
+            # order_by sorts None last, and sorting in reverse puts them first
+            orderings.append(F(field).desc(nulls_first=True) if descending else F(field).asc(nulls_last=True))
+        return query_data.order_by(*orderings)
+
+    def format_csv_rows(self, rows):
+        """Return the rows of a streamed CSV export in their output format."""
+        return rows
+
     def get_tag_order_by(self, tag):
         """Generate an OrderBy clause forcing JSON column->key to be used.
 
@@ -755,17 +785,37 @@ class ReportQueryHandler(QueryHandler):
         else:
             ranks = query.annotate(**self.annotations).values(*group_by_value).annotate(rank=rank_by_total)
 
-        rankings = []
-        for rank in ranks:
-            rank_value = rank.get(group_by_value[0])
-            rank_value = self.check_missing_rank_value(rank_value)
-            if rank_value not in rankings:
-                rankings.append(rank_value)
+        # dict keys keep the first occurrence of each value in rank order
+        rankings = list(
+            dict.fromkeys(self.check_missing_rank_value(rank.get(group_by_value[0])) for rank in ranks)
+        )
+
+        if "offset" in self.parameters.get("filter", {}) and tag_column not in gb[0]:
+            # Offset pages have no Others row, so only the groups on the page need to be fetched.
+            # The dates are kept so that days without data for the page groups are still zero-filled.
+            self._rank_page_dates = list(
+                query.annotate(**self.annotations).order_by().values_list("date", flat=True).distinct()
+            )
+            data = data.filter(self._rank_page_filter(gb[0], rankings))
 
         for query_return in data:
             query_return = self._apply_group_null_label(query_return, gb)
         return self._ranked_list(data, rankings)
 
+    def _rank_page(self, ranks):
+        """Return the ranked values on the page selected by the limit and offset filters."""
+        return list(islice(ranks, self._offset, self._offset + self._limit))
+
+    def _rank_page_filter(self, group_by_field, rankings):
+        """Return a filter limiting grouped rows to the ranked values on the requested page."""
+        page = self._rank_page(rankings)
+        no_value_label = self.check_missing_rank_value(None)
+        page_filter = Q(**{f"{group_by_field}__in": [value for value in page if value != no_value_label]})
+        if no_value_label in page:
+            # check_missing_rank_value labels both null and empty values as the no-value group
+            page_filter |= Q(**{f"{group_by_field}__isnull": True}) | Q(**{group_by_field: ""})
+        return page_filter
+
     def _ranked_list(self, data_list, ranks=None):
         """Get list of ranked items less than top.
 
@@ -782,27 +832,48 @@ class ReportQueryHandler(QueryHandler):
             self.max_rank = max(entry.get("rank", 0) for entry in data_list)
 
         date_grouped_data, account_alias_map = self.date_group_data(data_list)
+        is_offset = "offset" in self.parameters.get("filter", {})
         if ranks:
+            # Groups outside of an offset page are dropped by the rank summation, so they are not zero-filled
+            fill_ranks = self._rank_page(ranks) if is_offset else ranks
             padded_data = OrderedDict()
             for date in date_grouped_data:
-                padded_data[date] = self._zerofill_ranks(date_grouped_data[date], ranks, account_alias_map)
+                padded_data[date] = self._zerofill_ranks(date_grouped_data[date], fill_ranks, account_alias_map)
+            if is_offset and self._rank_page_dates and date_grouped_data:
+                template = next(iter(date_grouped_data.values()))[0]
+                self._zerofill_rank_page_dates(padded_data, template, fill_ranks, account_alias_map)
         else:
             padded_data = date_grouped_data
 
         rank_limited_data = OrderedDict()
-        is_offset = "offset" in self.parameters.get("filter", {})
         for date in padded_data:
             ranked_list = self._perform_rank_summation(padded_data[date], is_offset, ranks)
             rank_limited_data[date] = ranked_list
 
         return self.unpack_date_grouped_data(rank_limited_data)
 
+    def _zerofill_rank_page_dates(self, padded_data, template, ranks, account_alias_map):
+        """Add zero-filled rows for the dates on which none of the offset page groups have data."""
+        rank_field = self._get_group_by()[0]
+        missing_dates = [date for date in self._rank_page_dates if date not in padded_data]
+        if not missing_dates:
+            return
+        for date in missing_dates:
+            # The template row has no ranked value, so every ranked value is filled and the template dropped
+            empty_row = dict(template, date=date)
+            empty_row[rank_field] = None
+            padded_data[date] = self._zerofill_ranks([empty_row], ranks, account_alias_map)[1:]
+        for date in sorted(padded_data):
+            padded_data.move_to_end(date)
+
     def _zerofill_ranks(self, data, ranks, account_alias_map):
         """Ensure the data set has at least one entry from every ranked category."""
         rank_field = self._get_group_by()[0]
 
-        data_ranks = [item[rank_field] for item in data]
-        missing = list(set(ranks) - set(data_ranks))
+        data_ranks = {item[rank_field] for item in data}
+        missing = [rank for rank in ranks if rank not in data_ranks]
+        if not missing:
+            return data
 
         row_defaults = {
             "str": "",
@@ -814,16 +885,19 @@ class ReportQueryHandler(QueryHandler):
             "NoneType": None,
         }
         empty_row = {key: row_defaults[str(type(val).__name__)] for key, val in data[0].items()}
+        empty_row["date"] = data[0].get("date")
+        # Only the dict and list defaults are mutable, every other value can be shared between rows
+        mutable_keys = [key for key, val in empty_row.items() if isinstance(val, (dict, list))]
         missed_data = []
         for missed in missing:
-            ranked_empty_row = copy.deepcopy(empty_row)
+            ranked_empty_row = empty_row.copy()
+            for key in mutable_keys:
+                ranked_empty_row[key] = type(empty_row[key])()
             ranked_empty_row[rank_field] = missed
-            ranked_empty_row["date"] = data[0].get("date")
             if rank_field == "account":
                 ranked_empty_row["account_alias"] = account_alias_map.get(missed, missed)
             missed_data.append(ranked_empty_row)
-        new_data = data + missed_data
-        return new_data
+        return data + missed_data
 
     def _perform_rank_summation(self, entry, is_offset=False, ranks=[]):  # noqa: C901
         """Do the rank limiting for _ranked_list().
@@ -837,15 +911,18 @@ class ReportQueryHandler(QueryHandler):
         ranked_list = []
         others_list = []
         other_sums = {column: 0 for column in self._mapper.sum_columns}
+        rank_field = self._get_group_by()[0] if ranks else None
+        rank_positions = {}
+        for position, ranked_value in enumerate(ranks or [], 1):
+            rank_positions.setdefault(ranked_value, position)
 
         for data in entry:
             if other is None:
                 other = copy.deepcopy(data)
 
             if ranks:
-                ranked_value = data.get(self._get_group_by()[0])
-                ranked_value = self.check_missing_rank_value(ranked_value)
-                rank = ranks.index(ranked_value) + 1
+                ranked_value = self.check_missing_rank_value(data.get(rank_field))
+                rank = rank_positions[ranked_value]
                 data["rank"] = rank
             else:
                 rank = data.get("rank", 1)
@@ -917,6 +994,26 @@ class ReportQueryHandler(QueryHandler):
                 return_data.append(value)
         return return_data
 
+    def _aggregate_totals(self, query, aggregates, units=None):
+        """Aggregate the totals of the filtered query and read its units in a single statement.
+
+        Args:
+            query (QuerySet): The filtered report query
+            aggregates (dict): The total aggregates to compute
+            units (dict): Unit names mapped to the (column, fallback) they are read from
+
+        Returns:
+            (dict): The aggregated totals and units, or None when the query matches no rows
+
+        """
+        unit_aggregates = {
+            unit_key: Coalesce(Max(column), Value(fallback)) for unit_key, (column, fallback) in (units or {}).items()
+        }
+        totals = query.aggregate(**{**aggregates, **unit_aggregates, "matched_rows": Count("*")})
+        if not totals.pop("matched_rows"):
+            return None
+        return totals
+
     def _create_previous_totals(self, previous_query, query_group_by):
         """Get totals from the time period previous to the current report.
 
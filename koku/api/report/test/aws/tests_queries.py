@@ -4,15 +4,19 @@
 #
 """Test the Report Queries."""
 import logging
+import os
+import time
 from collections import defaultdict
 from collections import OrderedDict
 from datetime import datetime
 from datetime import timedelta
 from decimal import Decimal
+from unittest import skipUnless
 from unittest.mock import patch
 from unittest.mock import PropertyMock
 
 from dateutil.relativedelta import relativedelta
+from django.db import connection
 from django.db.models import Count
 from django.db.models import DecimalField
 from django.db.models import F
@@ -20,6 +24,7 @@ from django.db.models import Func
 from django.db.models import Sum
 from django.db.models import Value
 from django.db.models.functions import Coalesce
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.exceptions import ValidationError
 from tenant_schemas.utils import tenant_context
@@ -982,6 +987,20 @@ class AWSReportQueryTest(IamTestCase):
         self.assertAlmostEqual(cost_total_value, self.calculate_total(handler), 6)
         self.assertEqual(cost_total_units, expected_units)
 
+    def test_build_sum_single_query(self):
+        """Test that the totals and their units are read with a single query."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=monthly"
+        query_params = self.mocked_query_params(url, AWSCostView)
+        handler = AWSReportQueryHandler(query_params)
+        with tenant_context(self.tenant):
+            query = handler.query_table.objects.filter(handler.query_filter)
+            with CaptureQueriesContext(connection) as captured:
+                result = handler._build_sum(query, handler._mapper.report_type_map.get("annotations"))
+        report_queries = [sql for sql in captured.captured_queries if "search_path" not in sql["sql"]]
+        self.assertEqual(len(report_queries), 1)
+        self.assertAlmostEqual(result.get("cost", {}).get("total", {}).get("value"), self.calculate_total(handler), 6)
+        self.assertEqual(result.get("cost", {}).get("total", {}).get("units"), "USD")
+
     def test_percent_delta(self):
         """Test _percent_delta() utility method."""
         url = "?"
@@ -1050,6 +1069,56 @@ class AWSReportQueryTest(IamTestCase):
         ranked_list = handler._ranked_list(data_list)
         self.assertEqual(ranked_list, expected)
 
+    def test_execute_query_offset_fetches_rank_page(self):
+        """Test that an offset page only returns its ranked groups on every date of the report."""
+        base_url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&group_by[account]=*&order_by[cost]=desc"  # noqa: E501
+        query_params = self.mocked_query_params(f"{base_url}&filter[limit]=2&filter[offset]=0", AWSCostView)
+        first_pages = AWSReportQueryHandler(query_params).execute_query().get("data")
+        query_params = self.mocked_query_params(f"{base_url}&filter[limit]=1&filter[offset]=1", AWSCostView)
+        handler = AWSReportQueryHandler(query_params)
+        second_page = handler.execute_query().get("data")
+
+        self.assertEqual(len(second_page), len(first_pages))
+        for page_day, full_day in zip(second_page, first_pages):
+            self.assertEqual(page_day.get("date"), full_day.get("date"))
+            self.assertEqual(len(page_day.get("accounts")), 1)
+            self.assertEqual(page_day["accounts"][0].get("account"), full_day["accounts"][1].get("account"))
+        self.assertGreater(handler.max_rank, 1)
+
+    def test_rank_page_filter_matches_empty_group(self):
+        """Test that the no-value group of an offset page matches both null and empty group values."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=monthly&filter[limit]=1&filter[offset]=1&group_by[region]=*"  # noqa: E501
+        handler = AWSReportQueryHandler(self.mocked_query_params(url, AWSCostView))
+        with tenant_context(self.tenant):
+            null_row, empty_row, region_row = AWSCostSummaryByRegion.objects.filter(region__isnull=False)[:3]
+            AWSCostSummaryByRegion.objects.filter(id=null_row.id).update(region=None)
+            AWSCostSummaryByRegion.objects.filter(id=empty_row.id).update(region="")
+            expected = set(
+                AWSCostSummaryByRegion.objects.filter(region__isnull=True).values_list("id", flat=True)
+            ) | set(AWSCostSummaryByRegion.objects.filter(region="").values_list("id", flat=True))
+
+            page_filter = handler._rank_page_filter("region", [region_row.region, "no-region"])
+            filtered = set(AWSCostSummaryByRegion.objects.filter(page_filter).values_list("id", flat=True))
+        self.assertIn(empty_row.id, filtered)
+        self.assertEqual(filtered, expected)
+
+    def test_zerofill_rank_page_dates_sorted(self):
+        """Test that the dates added for an offset page are kept in date order."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&filter[limit]=1&filter[offset]=1&group_by[account]=*"  # noqa: E501
+        handler = AWSReportQueryHandler(self.mocked_query_params(url, AWSCostView))
+        template = {"date": "2000-01-02", "account": "1", "account_alias": "acct 1", "cost_total": 0.03}
+        padded_data = OrderedDict([("2000-01-02", [template]), ("2000-01-04", [dict(template, date="2000-01-04")])])
+        handler._rank_page_dates = ["2000-01-05", "2000-01-01", "2000-01-02", "2000-01-03", "2000-01-04"]
+
+        handler._zerofill_rank_page_dates(padded_data, template, ["1"], {"1": "acct 1"})
+
+        self.assertEqual(list(padded_data), ["2000-01-01", "2000-01-02", "2000-01-03", "2000-01-04", "2000-01-05"])
+        self.assertEqual(padded_data["2000-01-02"], [template])
+        self.assertEqual(
+            padded_data["2000-01-03"],
+            [{"date": "2000-01-03", "account": "1", "account_alias": "acct 1", "cost_total": 0.0}],
+        )
+
     def test_rank_list_zerofill_account(self):
         """Test rank list limit with account alias, ensuring we zero-fill missing ranks and populate account_alias."""
         url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&filter[limit]=10&group_by[account]=*&order_by[account_alias]=asc"  # noqa: E501
@@ -1326,6 +1395,62 @@ class AWSReportQueryTest(IamTestCase):
         ranked_list = handler._ranked_list(data_list, ranks=["m2.large", "m1.large"])
         self.assertEqual(ranked_list, expected)
 
+    def test_rank_list_zerofills_and_sums_others_per_day(self):
+        """Test that every day gets each top ranked group, zero-filled if needed, and an Others sum of the rest."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&filter[limit]=2&group_by[account]=*"  # noqa: E501
+        query_params = self.mocked_query_params(url, AWSCostView)
+        handler = AWSReportQueryHandler(query_params)
+        num_groups = 8
+        ranks = [str(group) for group in range(num_groups)]
+        # Every day only has data for half of the groups, the rest must be zero-filled
+        data_list = [
+            {
+                "date": f"2000-01-{day + 1:02d}",
+                "account": str(group),
+                "account_alias": f"acct {group}",
+                "cost_total": Decimal(num_groups - group),
+                "tags": [],
+            }
+            for day in range(3)
+            for group in range(day % 2, num_groups, 2)
+        ]
+        ranked_list = handler._ranked_list(data_list, ranks=ranks)
+
+        result = defaultdict(list)
+        for row in ranked_list:
+            result[row["date"]].append((row["rank"], row["account"], row["account_alias"], row["cost_total"]))
+        even_day = [(1, "0", "acct 0", 8), (2, "1", "acct 1", 0), (3, "Others", "Others", 12)]
+        odd_day = [(1, "0", "acct 0", 0), (2, "1", "acct 1", 7), (3, "Others", "Others", 9)]
+        self.assertEqual(
+            {date: sorted(rows) for date, rows in result.items()},
+            {"2000-01-01": even_day, "2000-01-02": odd_day, "2000-01-03": even_day},
+        )
+
+    @skipUnless(os.environ.get("KOKU_BENCHMARKS"), "Set KOKU_BENCHMARKS to run benchmarks.")
+    def test_rank_list_scales_with_group_count(self):
+        """Benchmark ranking and zero-fill on synthetic data with thousands of groups."""
+        url = "?filter[time_scope_units]=month&filter[time_scope_value]=-1&filter[resolution]=daily&filter[limit]=5&group_by[account]=*"  # noqa: E501
+        query_params = self.mocked_query_params(url, AWSCostView)
+        handler = AWSReportQueryHandler(query_params)
+        num_days = 30
+        for num_groups in (100, 1000, 5000):
+            ranks = [str(group) for group in range(num_groups)]
+            # Every day only has data for half of the groups, the rest must be zero-filled
+            data_list = [
+                {
+                    "date": f"2000-01-{day + 1:02d}",
+                    "account": str(group),
+                    "account_alias": f"acct {group}",
+                    "cost_total": Decimal(num_groups - group),
+                    "tags": [],
+                }
+                for day in range(num_days)
+                for group in range(day % 2, num_groups, 2)
+            ]
+            start = time.perf_counter()
+            handler._ranked_list(data_list, ranks=ranks)
+            LOG.info(f"Ranked {num_groups} groups over {num_days} days in {time.perf_counter() - start:.3f}s")
+
     def test_query_costs_with_totals(self):
         """Test execute_query() - costs with totals.
 
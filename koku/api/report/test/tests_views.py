@@ -7,7 +7,6 @@ from django.test import RequestFactory
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
-from rest_framework_csv.renderers import CSVRenderer
 
 from api.common.pagination import ReportPagination
 from api.common.pagination import ReportRankedPagination
@@ -89,11 +88,23 @@ class ReportViewTest(IamTestCase):
             with self.subTest(endpoint=endpoint):
                 url = reverse(endpoint)
                 response = self.client.get(url, content_type="text/csv", **self.headers)
-                response.render()
 
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(response.accepted_media_type, "text/csv")
-                self.assertIsInstance(response.accepted_renderer, CSVRenderer)
+                self.assertTrue(response["Content-Type"].startswith("text/csv"))
+
+    def test_endpoint_csv_streams_requested_page(self):
+        """Test that an unranked CSV export is streamed one page at a time."""
+        client = APIClient(HTTP_ACCEPT="text/csv")
+        url = reverse("reports-aws-costs") + "?group_by[account]=*&limit=2&offset=1"
+        response = client.get(url, **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        header = lines[0].split(",")
+        self.assertIn("id", header)
+        self.assertNotIn("account", header)
+        self.assertLessEqual(len(lines) - 1, 2)
 
     def test_find_unit_list(self):
         """Test that the correct unit is returned."""
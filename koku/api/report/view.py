@@ -5,6 +5,8 @@
 """View for Reports."""
 import logging
 
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext as _
 from django.views.decorators.vary import vary_on_headers
@@ -14,6 +16,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.views import APIView
+from rest_framework_csv.renderers import CSVStreamingRenderer
 
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.pagination import OrgUnitPagination
@@ -23,6 +26,7 @@ from api.query_params import QueryParameters
 from api.utils import UnitConverter
 
 LOG = logging.getLogger(__name__)
+CSV_STREAM_CHUNK_SIZE = 500
 
 
 def get_paginator(filter_query_params, count, group_by_params=False):
@@ -43,6 +47,16 @@ def get_paginator(filter_query_params, count, group_by_params=False):
     return paginator
 
 
+def _stream_csv(request, handler, query_data):
+    """Stream the requested page of a CSV report as its rows are read from a server-side cursor."""
+    paginator = ReportPagination()
+    offset = paginator.get_offset(request)
+    end = offset + paginator.get_limit(request)
+    rows = handler.format_csv_rows(query_data[offset:end].iterator(chunk_size=CSV_STREAM_CHUNK_SIZE))
+    renderer = CSVStreamingRenderer()
+    return StreamingHttpResponse(renderer.render(rows), content_type=f"{renderer.media_type}; charset=utf-8")
+
+
 def _find_unit():
     """Find the original unit for a report dataset."""
     unit = None
@@ -154,6 +168,9 @@ class ReportView(APIView):
             return Response(data=exc.detail, status=status.HTTP_400_BAD_REQUEST)
         handler = self.query_handler(params)
         output = handler.execute_query()
+        if isinstance(output.get("data"), QuerySet):
+            # Unranked CSV exports are left as a queryset so only the requested page is fetched
+            return _stream_csv(request, handler, output["data"])
         max_rank = handler.max_rank
 
         if "units" in params.parameters:
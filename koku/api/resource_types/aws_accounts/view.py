@@ -13,7 +13,7 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.aws_access import AwsAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.aws.models import AWSCostSummaryByAccount
+from reporting.provider.aws.models import AWSAccountDimension
 from reporting.provider.aws.openshift.models import OCPAWSCostSummaryByAccount
 
 
@@ -21,7 +21,7 @@ class AWSAccountView(generics.ListAPIView):
     """API GET list view for AWS accounts."""
 
     queryset = (
-        AWSCostSummaryByAccount.objects.annotate(
+        AWSAccountDimension.objects.annotate(
             **(
                 {
                     "value": F("usage_account_id"),
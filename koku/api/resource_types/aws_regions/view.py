@@ -12,14 +12,14 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.aws_access import AwsAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.aws.models import AWSCostSummaryByRegion
+from reporting.provider.aws.models import AWSRegionDimension
 
 
 class AWSAccountRegionView(generics.ListAPIView):
     """API GET list view for AWS by region"""
 
     queryset = (
-        AWSCostSummaryByRegion.objects.annotate(**{"value": F("region")})
+        AWSRegionDimension.objects.annotate(**{"value": F("region")})
         .values("value")
         .distinct()
         .filter(region__isnull=False)
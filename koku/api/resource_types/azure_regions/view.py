@@ -12,7 +12,7 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.azure_access import AzureAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.azure.models import AzureCostSummaryByLocation
+from reporting.provider.azure.models import AzureRegionDimension
 from reporting.provider.azure.openshift.models import OCPAzureCostSummaryByLocation
 
 
@@ -20,7 +20,7 @@ class AzureRegionView(generics.ListAPIView):
     """API GET list view for Azure Region locations."""
 
     queryset = (
-        AzureCostSummaryByLocation.objects.annotate(**{"value": F("resource_location")})
+        AzureRegionDimension.objects.annotate(**{"value": F("resource_location")})
         .values("value")
         .distinct()
         .filter(resource_location__isnull=False)
@@ -12,7 +12,7 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.azure_access import AzureAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.azure.models import AzureCostSummaryByService
+from reporting.provider.azure.models import AzureServiceDimension
 from reporting.provider.azure.openshift.models import OCPAzureCostSummaryByService
 
 
@@ -20,7 +20,7 @@ class AzureServiceView(generics.ListAPIView):
     """API GET list view for Azure Service types."""
 
     queryset = (
-        AzureCostSummaryByService.objects.annotate(**{"value": F("service_name")})
+        AzureServiceDimension.objects.annotate(**{"value": F("service_name")})
         .values("value")
         .distinct()
         .filter(service_name__isnull=False)
@@ -12,7 +12,7 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.azure_access import AzureAccessPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.azure.models import AzureCostSummaryByAccount
+from reporting.provider.azure.models import AzureSubscriptionDimension
 from reporting.provider.azure.openshift.models import OCPAzureCostSummaryByAccount
 
 
@@ -20,7 +20,7 @@ class AzureSubscriptionGuidView(generics.ListAPIView):
     """API GET list view for Azure Subscription Guid."""
 
     queryset = (
-        AzureCostSummaryByAccount.objects.annotate(**{"value": F("subscription_guid")}).values("value").distinct()
+        AzureSubscriptionDimension.objects.annotate(**{"value": F("subscription_guid")}).values("value").distinct()
     )
     serializer_class = ResourceTypeSerializer
     permission_classes = [AzureAccessPermission]
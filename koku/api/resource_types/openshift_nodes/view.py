@@ -12,14 +12,14 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.openshift_access import OpenShiftNodePermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.ocp.models import OCPCostSummaryByNode
+from reporting.provider.ocp.models import OCPNodeDimension
 
 
 class OCPNodesView(generics.ListAPIView):
     """API GET list view for Openshift nodes."""
 
     queryset = (
-        OCPCostSummaryByNode.objects.annotate(**{"value": F("node")})
+        OCPNodeDimension.objects.annotate(**{"value": F("node")})
         .values("value")
         .distinct()
         .filter(node__isnull=False)
@@ -12,14 +12,14 @@ from rest_framework import generics
 from api.common import CACHE_RH_IDENTITY_HEADER
 from api.common.permissions.openshift_access import OpenShiftProjectPermission
 from api.resource_types.serializers import ResourceTypeSerializer
-from reporting.provider.ocp.models import OCPCostSummaryByProject
+from reporting.provider.ocp.models import OCPProjectDimension
 
 
 class OCPProjectsView(generics.ListAPIView):
     """API GET list view for Openshift projects."""
 
     queryset = (
-        OCPCostSummaryByProject.objects.annotate(**{"value": F("namespace")})
+        OCPProjectDimension.objects.annotate(**{"value": F("namespace")})
         .values("value")
         .distinct()
         .filter(namespace__isnull=False)
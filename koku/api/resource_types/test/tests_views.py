@@ -19,6 +19,7 @@ from api.provider.models import Provider
 from cost_models.models import CostModel
 from cost_models.models import CostModelMap
 from masu.test import MasuTestCase
+from reporting.provider.ocp.models import OCPCostSummaryByProject
 
 FAKE = Faker()
 
@@ -198,3 +199,19 @@ class ResourceTypesViewTest(IamTestCase):
         self.assertIsNotNone(json_result.get("data"))
         self.assertIsInstance(json_result.get("data"), list)
         self.assertEqual(json_result.get("data"), [])
+
+    def test_openshift_projects_match_summary(self):
+        """Test that the project dimension lists the namespaces of the project summary."""
+        with tenant_context(self.tenant):
+            namespaces = OCPCostSummaryByProject.objects.values_list("namespace", flat=True).distinct()
+            expected = sorted(namespace for namespace in namespaces if namespace)
+        url = reverse("openshift-projects") + "?limit=1000"
+        response = self.client.get(url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["value"] for item in response.json().get("data")], expected)
+
+        search = expected[0][1:4]
+        url = reverse("openshift-projects") + f"?limit=1000&search={search}"
+        response = self.client.get(url, **self.headers)
+        expected = [namespace for namespace in expected if search.lower() in namespace.lower()]
+        self.assertEqual([item["value"] for item in response.json().get("data")], expected)
@@ -24,6 +24,7 @@ from api.query_params import get_tenant
 from api.query_params import QueryParameters
 from api.report.serializers import ParamSerializer
 from api.report.view import ReportView
+from koku.cache import invalidate_tag_keys_cache_for_tenant
 
 LOG = logging.getLogger(__name__)
 PROVIDERS = [
@@ -654,10 +655,39 @@ class QueryParametersTests(TestCase):
             query_handler=Mock(provider=random.choice(PROVIDERS)),
             report=self.FAKE.word(),
             serializer=Mock,
-            tag_handler=[Mock(objects=fake_objects)],
+            tag_handler=[Mock(objects=fake_objects, _meta=Mock(db_table="reporting_fake_tags_summary"))],
         )
         params = QueryParameters(fake_request, fake_view)
         self.assertEqual(params.tag_keys, expected)
+        invalidate_tag_keys_cache_for_tenant("acct10001")
+
+    def test_get_tag_keys_cached(self):
+        """Test that tag keys are read from the tag summary table once until invalidated."""
+        fake_request = Mock(
+            spec=HttpRequest,
+            user=Mock(access=Mock(get=lambda key, default: default), customer=Mock(schema_name="acct10001")),
+            GET=Mock(urlencode=Mock(return_value="filter[tag:app]=web")),
+        )
+        fake_objects = Mock()
+        fake_objects.values.return_value = [{"key": "app"}, {"key": "environment"}]
+        fake_view = Mock(
+            spec=ReportView,
+            provider=self.FAKE.word(),
+            query_handler=Mock(provider=random.choice(PROVIDERS)),
+            report=self.FAKE.word(),
+            serializer=Mock,
+            tag_handler=[Mock(objects=fake_objects, _meta=Mock(db_table="reporting_cached_tags_summary"))],
+        )
+        invalidate_tag_keys_cache_for_tenant("acct10001")
+        QueryParameters(fake_request, fake_view)
+        params = QueryParameters(fake_request, fake_view)
+        self.assertEqual(params.tag_keys, {"tag:app"})
+        fake_objects.values.assert_called_once()
+
+        invalidate_tag_keys_cache_for_tenant("acct10001")
+        QueryParameters(fake_request, fake_view)
+        self.assertEqual(fake_objects.values.call_count, 2)
+        invalidate_tag_keys_cache_for_tenant("acct10001")
 
     def test_get_providers(self):
         """Test get providers returns the correct access keys."""
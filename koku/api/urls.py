@@ -5,7 +5,6 @@
 """Describes the urls and patterns for the API application."""
 from django.conf import settings
 from django.urls import path
-from django.views.decorators.cache import cache_page
 from django.views.generic.base import RedirectView
 from rest_framework.routers import DefaultRouter
 
@@ -72,6 +71,7 @@ from api.views import StatusView
 from api.views import UserAccessView
 from koku.cache import AWS_CACHE_PREFIX
 from koku.cache import AZURE_CACHE_PREFIX
+from koku.cache import cache_view
 from koku.cache import GCP_CACHE_PREFIX
 from koku.cache import OPENSHIFT_ALL_CACHE_PREFIX
 from koku.cache import OPENSHIFT_AWS_CACHE_PREFIX
@@ -91,207 +91,207 @@ urlpatterns = [
     path("metrics/", metrics, name="metrics"),
     path(
         "tags/aws/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSTagView.as_view()),
         name="aws-tags",
     ),
     path(
         "tags/azure/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureTagView.as_view()),
         name="azure-tags",
     ),
     path(
         "tags/gcp/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPTagView.as_view()),
         name="gcp-tags",
     ),
     path(
         "tags/openshift/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(OCPTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(OCPTagView.as_view()),
         name="openshift-tags",
     ),
     path(
         "tags/openshift/infrastructures/all/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
             OCPAllTagView.as_view()
         ),
         name="openshift-all-tags",
     ),
     path(
         "tags/openshift/infrastructures/aws/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
             OCPAWSTagView.as_view()
         ),
         name="openshift-aws-tags",
     ),
     path(
         "tags/openshift/infrastructures/azure/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
             OCPAzureTagView.as_view()
         ),
         name="openshift-azure-tags",
     ),
     path(
         "tags/aws/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSTagView.as_view()),
         name="aws-tags-key",
     ),
     path(
         "tags/azure/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureTagView.as_view()),
         name="azure-tags-key",
     ),
     path(
         "tags/openshift/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(OCPTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(OCPTagView.as_view()),
         name="openshift-tags-key",
     ),
     path(
         "tags/gcp/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPTagView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPTagView.as_view()),
         name="gcp-tags-key",
     ),
     path(
         "tags/openshift/infrastructures/all/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
             OCPAllTagView.as_view()
         ),
         name="openshift-all-tags-key",
     ),
     path(
         "tags/openshift/infrastructures/aws/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
             OCPAWSTagView.as_view()
         ),
         name="openshift-aws-tags-key",
     ),
     path(
         "tags/openshift/infrastructures/azure/<key>/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
             OCPAzureTagView.as_view()
         ),
         name="openshift-azure-tags-key",
     ),
     path(
         "reports/aws/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSCostView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSCostView.as_view()),
         name="reports-aws-costs",
     ),
     path(
         "reports/aws/instance-types/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(
             AWSInstanceTypeView.as_view()
         ),
         name="reports-aws-instance-type",
     ),
     path(
         "reports/aws/storage/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSStorageView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSStorageView.as_view()),
         name="reports-aws-storage",
     ),
     path(
         "reports/azure/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureCostView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureCostView.as_view()),
         name="reports-azure-costs",
     ),
     path(
         "reports/azure/instance-types/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(
             AzureInstanceTypeView.as_view()
         ),
         name="reports-azure-instance-type",
     ),
     path(
         "reports/azure/storage/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(
             AzureStorageView.as_view()
         ),
         name="reports-azure-storage",
     ),
     path(
         "reports/openshift/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
             OCPCostView.as_view()
         ),
         name="reports-openshift-costs",
     ),
     path(
         "reports/openshift/memory/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
             OCPMemoryView.as_view()
         ),
         name="reports-openshift-memory",
     ),
     path(
         "reports/openshift/compute/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(OCPCpuView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(OCPCpuView.as_view()),
         name="reports-openshift-cpu",
     ),
     path(
         "reports/openshift/volumes/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
             OCPVolumeView.as_view()
         ),
         name="reports-openshift-volume",
     ),
     path(
         "reports/openshift/infrastructures/all/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
             OCPAllCostView.as_view()
         ),
         name="reports-openshift-all-costs",
     ),
     path(
         "reports/openshift/infrastructures/all/storage/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
             OCPAllStorageView.as_view()
         ),
         name="reports-openshift-all-storage",
     ),
     path(
         "reports/openshift/infrastructures/all/instance-types/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_ALL_CACHE_PREFIX)(
             OCPAllInstanceTypeView.as_view()
         ),
         name="reports-openshift-all-instance-type",
     ),
     path(
         "reports/openshift/infrastructures/aws/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
             OCPAWSCostView.as_view()
         ),
         name="reports-openshift-aws-costs",
     ),
     path(
         "reports/openshift/infrastructures/aws/storage/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
             OCPAWSStorageView.as_view()
         ),
         name="reports-openshift-aws-storage",
     ),
     path(
         "reports/openshift/infrastructures/aws/instance-types/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AWS_CACHE_PREFIX)(
             OCPAWSInstanceTypeView.as_view()
         ),
         name="reports-openshift-aws-instance-type",
     ),
     path(
         "reports/openshift/infrastructures/azure/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
             OCPAzureCostView.as_view()
         ),
         name="reports-openshift-azure-costs",
     ),
     path(
         "reports/openshift/infrastructures/azure/storage/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
             OCPAzureStorageView.as_view()
         ),
         name="reports-openshift-azure-storage",
     ),
     path(
         "reports/openshift/infrastructures/azure/instance-types/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_AZURE_CACHE_PREFIX)(
             OCPAzureInstanceTypeView.as_view()
         ),
         name="reports-openshift-azure-instance-type",
@@ -301,28 +301,88 @@ urlpatterns = [
     path("organizations/aws/", AWSOrgView.as_view(), name="aws-org-unit"),
     path("resource-types/", ResourceTypeView.as_view(), name="resource-types"),
     path("user-access/", UserAccessView.as_view(), name="user-access"),
-    path("resource-types/aws-accounts/", AWSAccountView.as_view(), name="aws-accounts"),
-    path("resource-types/gcp-accounts/", GCPAccountView.as_view(), name="gcp-accounts"),
-    path("resource-types/gcp-projects/", GCPProjectsView.as_view(), name="gcp-projects"),
-    path("resource-types/gcp-regions/", GCPRegionView.as_view(), name="gcp-regions"),
-    path("resource-types/gcp-services/", GCPServiceView.as_view(), name="gcp-services"),
+    path(
+        "resource-types/aws-accounts/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSAccountView.as_view()),
+        name="aws-accounts",
+    ),
+    path(
+        "resource-types/gcp-accounts/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPAccountView.as_view()),
+        name="gcp-accounts",
+    ),
+    path(
+        "resource-types/gcp-projects/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPProjectsView.as_view()),
+        name="gcp-projects",
+    ),
+    path(
+        "resource-types/gcp-regions/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPRegionView.as_view()),
+        name="gcp-regions",
+    ),
+    path(
+        "resource-types/gcp-services/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPServiceView.as_view()),
+        name="gcp-services",
+    ),
     path(
         "resource-types/aws-organizational-units/",
         AWSOrganizationalUnitView.as_view(),
         name="aws-organizational-units",
     ),
-    path("resource-types/azure-regions/", AzureRegionView.as_view(), name="azure-regions"),
-    path("resource-types/azure-services/", AzureServiceView.as_view(), name="azure-services"),
-    path("resource-types/aws-services/", AWSServiceView.as_view(), name="aws-services"),
-    path("resource-types/aws-regions/", AWSAccountRegionView.as_view(), name="aws-regions"),
+    path(
+        "resource-types/azure-regions/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(AzureRegionView.as_view()),
+        name="azure-regions",
+    ),
+    path(
+        "resource-types/azure-services/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(
+            AzureServiceView.as_view()
+        ),
+        name="azure-services",
+    ),
+    path(
+        "resource-types/aws-services/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(AWSServiceView.as_view()),
+        name="aws-services",
+    ),
+    path(
+        "resource-types/aws-regions/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AWS_CACHE_PREFIX)(
+            AWSAccountRegionView.as_view()
+        ),
+        name="aws-regions",
+    ),
     path(
         "resource-types/azure-subscription-guids/",
-        AzureSubscriptionGuidView.as_view(),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=AZURE_CACHE_PREFIX)(
+            AzureSubscriptionGuidView.as_view()
+        ),
         name="azure-subscription-guids",
     ),
-    path("resource-types/openshift-clusters/", OCPClustersView.as_view(), name="openshift-clusters"),
-    path("resource-types/openshift-projects/", OCPProjectsView.as_view(), name="openshift-projects"),
-    path("resource-types/openshift-nodes/", OCPNodesView.as_view(), name="openshift-nodes"),
+    path(
+        "resource-types/openshift-clusters/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
+            OCPClustersView.as_view()
+        ),
+        name="openshift-clusters",
+    ),
+    path(
+        "resource-types/openshift-projects/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
+            OCPProjectsView.as_view()
+        ),
+        name="openshift-projects",
+    ),
+    path(
+        "resource-types/openshift-nodes/",
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=OPENSHIFT_CACHE_PREFIX)(
+            OCPNodesView.as_view()
+        ),
+        name="openshift-nodes",
+    ),
     path("resource-types/cost-models/", CostModelResourceTypesView.as_view(), name="cost-models"),
     path("forecasts/aws/costs/", AWSCostForecastView.as_view(), name="aws-cost-forecasts"),
     path("forecasts/gcp/costs/", GCPForecastCostView.as_view(), name="gcp-cost-forecasts"),
@@ -345,19 +405,19 @@ urlpatterns = [
     ),
     path(
         "reports/gcp/costs/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPCostView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPCostView.as_view()),
         name="reports-gcp-costs",
     ),
     path(
         "reports/gcp/instance-types/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(
             GCPInstanceTypeView.as_view()
         ),
         name="reports-gcp-instance-type",
     ),
     path(
         "reports/gcp/storage/",
-        cache_page(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPStorageView.as_view()),
+        cache_view(timeout=settings.CACHE_MIDDLEWARE_SECONDS, key_prefix=GCP_CACHE_PREFIX)(GCPStorageView.as_view()),
         name="reports-gcp-storage",
     ),
 ]
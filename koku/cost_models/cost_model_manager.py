@@ -92,7 +92,12 @@ class CostModelManager:
                         schema_name, provider.uuid, start_date, end_date, queue_name=PRIORITY_QUEUE
                     ).set(queue=PRIORITY_QUEUE),
                     refresh_materialized_views.si(
-                        schema_name, provider.type, provider_uuid=provider.uuid, queue_name=PRIORITY_QUEUE
+                        schema_name,
+                        provider.type,
+                        provider_uuid=provider.uuid,
+                        queue_name=PRIORITY_QUEUE,
+                        start_date=start_date,
+                        end_date=end_date,
                     ).set(queue=PRIORITY_QUEUE),
                 ).apply_async()
 
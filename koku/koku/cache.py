@@ -4,23 +4,17 @@
 #
 """Cache functions."""
 import logging
+import time
+from functools import wraps
 
-from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.dummy import DummyCache
-from django.core.cache.backends.locmem import LocMemCache
-from django_redis.cache import RedisCache
-from redis import Redis
+from django.views.decorators.cache import cache_page
+from tenant_schemas.utils import schema_context
 
 from api.provider.models import Provider
 
 
-class KokuCacheError(Exception):
-    """KokuCacheError Error."""
-
-    pass
-
-
 LOG = logging.getLogger(__name__)
 
 AWS_CACHE_PREFIX = "aws-view"
@@ -31,6 +25,54 @@ OPENSHIFT_AWS_CACHE_PREFIX = "openshift-aws-view"
 OPENSHIFT_AZURE_CACHE_PREFIX = "openshift-azure-view"
 OPENSHIFT_ALL_CACHE_PREFIX = "openshift-all-view"
 SOURCES_PREFIX = "sources"
+TAG_KEYS_CACHE_PREFIX = "tag-keys"
+VIEW_CACHE_PREFIXES = (
+    AWS_CACHE_PREFIX,
+    AZURE_CACHE_PREFIX,
+    GCP_CACHE_PREFIX,
+    OPENSHIFT_CACHE_PREFIX,
+    OPENSHIFT_AWS_CACHE_PREFIX,
+    OPENSHIFT_AZURE_CACHE_PREFIX,
+    OPENSHIFT_ALL_CACHE_PREFIX,
+)
+
+
+def _view_cache_version_key(cache_key_prefix):
+    """Return the cache key holding the generation of a view cache prefix."""
+    return f"{cache_key_prefix}.version"
+
+
+def get_view_cache_version(cache_key_prefix):
+    """Return the current generation of the current tenant's views for a cache key prefix.
+
+    The generation starts at the current time rather than zero so that a version
+    key that was evicted never brings back responses cached under an old generation.
+    """
+    cache = caches["default"]
+    version_key = _view_cache_version_key(cache_key_prefix)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, time.time_ns(), timeout=None)
+        version = cache.get(version_key)
+    return version
+
+
+def cache_view(timeout, key_prefix):
+    """Cache a view's responses under the current generation of the tenant's key prefix.
+
+    Invalidating the prefix for a tenant bumps its generation, so responses cached
+    before then are no longer looked up and age out with their timeout.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            versioned_prefix = f"{key_prefix}.{get_view_cache_version(key_prefix)}"
+            return cache_page(timeout, key_prefix=versioned_prefix)(view_func)(request, *args, **kwargs)
+
+        return _wrapped_view
+
+    return decorator
 
 
 def invalidate_view_cache_for_tenant_and_cache_key(schema_name, cache_key_prefix=None):
@@ -39,37 +81,47 @@ def invalidate_view_cache_for_tenant_and_cache_key(schema_name, cache_key_prefix
     If cache_key_prefix is None, all views will be invalidated.
     """
     cache = caches["default"]
-    if isinstance(cache, RedisCache):
-        cache = Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB)
-        all_keys = cache.keys("*")
-        all_keys = [key.decode("utf-8") for key in all_keys]
-    elif isinstance(cache, LocMemCache):
-        all_keys = cache._cache.keys()
-        all_keys = list(all_keys)
-        all_keys = [key.split(":") for key in all_keys]
-        all_keys = [":".join(splits[-2:]) for splits in all_keys]
-    elif isinstance(cache, DummyCache):
+    if isinstance(cache, DummyCache):
         LOG.info("Skipping cache invalidation because views caching is disabled.")
         return
-    else:
-        msg = "Using an unsupported caching backend!"
-        raise KokuCacheError(msg)
 
-    all_keys = all_keys if all_keys is not None else []
-
-    if cache_key_prefix:
-        keys_to_invalidate = [key for key in all_keys if (schema_name in key and cache_key_prefix in key)]
-    else:
-        # Invalidate all cached views for the tenant
-        keys_to_invalidate = [key for key in all_keys if schema_name in key]
-
-    for key in keys_to_invalidate:
-        cache.delete(key)
+    cache_key_prefixes = (cache_key_prefix,) if cache_key_prefix else VIEW_CACHE_PREFIXES
+    with schema_context(schema_name):
+        for prefix in cache_key_prefixes:
+            version_key = _view_cache_version_key(prefix)
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                # No generation yet, nothing can have been cached under the one that will be created
+                cache.add(version_key, time.time_ns(), timeout=None)
 
     msg = f"Invalidated request cache for\n\ttenant: {schema_name}\n\tcache_key_prefix: {cache_key_prefix}"
     LOG.info(msg)
 
 
+def get_cached_tag_keys(schema_name, model):
+    """Return the set of keys in a tenant's tag summary table.
+
+    The keys of all of a tenant's tag summary tables share one cache entry,
+    which invalidate_tag_keys_cache_for_tenant drops when the summaries change.
+    """
+    cache = caches["default"]
+    cache_key = f"{TAG_KEYS_CACHE_PREFIX}.{schema_name}"
+    table_name = model._meta.db_table
+    with schema_context(schema_name):
+        tag_keys = cache.get(cache_key) or {}
+        if table_name not in tag_keys:
+            tag_keys[table_name] = {tag.get("key") for tag in model.objects.values("key")}
+            cache.set(cache_key, tag_keys)
+    return tag_keys[table_name]
+
+
+def invalidate_tag_keys_cache_for_tenant(schema_name):
+    """Drop the cached tag keys of a tenant."""
+    with schema_context(schema_name):
+        caches["default"].delete(f"{TAG_KEYS_CACHE_PREFIX}.{schema_name}")
+
+
 def invalidate_view_cache_for_tenant_and_source_type(schema_name, source_type):
     """"Invalidate our view cache for a specific tenant and source type."""
     cache_key_prefixes = ()
@@ -89,3 +141,4 @@ def invalidate_view_cache_for_tenant_and_source_type(schema_name, source_type):
 
     for cache_key_prefix in cache_key_prefixes:
         invalidate_view_cache_for_tenant_and_cache_key(schema_name, cache_key_prefix)
+    invalidate_tag_keys_cache_for_tenant(schema_name)
@@ -28,6 +28,7 @@ from django_prometheus.middleware import Metrics
 from django_prometheus.middleware import PrometheusAfterMiddleware
 from django_prometheus.middleware import PrometheusBeforeMiddleware
 from prometheus_client import Counter
+from prometheus_client import Histogram
 from rest_framework.exceptions import ValidationError
 from tenant_schemas.middleware import BaseTenantMiddleware
 from tenant_schemas.utils import schema_exists
@@ -50,11 +51,18 @@ MAX_CACHE_SIZE = 10000
 USER_CACHE = TTLCache(maxsize=MAX_CACHE_SIZE, ttl=TIME_TO_CACHE)
 
 
+# Requests for the same user serialize on one of these locks so a cache miss triggers a single RBAC fetch
+RBAC_ACCESS_LOCKS = [threading.Lock() for _ in range(64)]
+RBAC_REFRESH_LOCK_TTL = 30
+
 LOG = logging.getLogger(__name__)
 MASU = settings.MASU
 SOURCES = settings.SOURCES
 UNIQUE_ACCOUNT_COUNTER = Counter("hccm_unique_account", "Unique Account Counter")
 UNIQUE_USER_COUNTER = Counter("hccm_unique_user", "Unique User Counter", ["account", "user"])
+DB_QUERIES_PER_REQUEST = Histogram(
+    "hccm_db_queries_per_request", "Database queries per API request", buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+)
 
 EXTENDED_METRICS = [
     "django_http_requests_latency_seconds_by_view_method",
@@ -249,6 +257,41 @@ class IdentityHeaderMiddleware(MiddlewareMixin):
         access = self.rbac.get_access_for_user(user)
         return access
 
+    def _cache_access(self, cache, user, access):
+        """Cache the user's access, keeping it past its freshness so it can be served while refreshed."""
+        entry = {"access": access, "expires": time.time() + self.rbac.cache_ttl}
+        cache.set(user.uuid, entry, self.rbac.cache_ttl + self.rbac.cache_stale_ttl)
+        return access
+
+    def _get_cached_access(self, user, fetch_access):
+        """Return the user's access from the rbac cache, calling fetch_access at most once per user.
+
+        A fresh entry is returned as is. Once an entry goes stale, the request that wins the
+        refresh lock fetches the access again while concurrent requests keep serving the stale
+        entry. On a miss, concurrent requests in this process wait for the first one's fetch.
+        """
+        cache = caches["rbac"]
+        entry = cache.get(user.uuid)
+        if isinstance(entry, dict) and entry.get("access") and "expires" in entry:
+            if entry["expires"] > time.time():
+                return entry["access"]
+            refresh_key = f"{user.uuid}.refresh"
+            if not cache.add(refresh_key, True, RBAC_REFRESH_LOCK_TTL):
+                return entry["access"]
+            try:
+                return self._cache_access(cache, user, fetch_access())
+            except RbacConnectionError as err:
+                LOG.warning("Serving stale access for user %s: %s", user.uuid, err)
+                return entry["access"]
+            finally:
+                cache.delete(refresh_key)
+
+        with RBAC_ACCESS_LOCKS[hash(user.uuid) % len(RBAC_ACCESS_LOCKS)]:
+            entry = cache.get(user.uuid)
+            if isinstance(entry, dict) and entry.get("access") and entry.get("expires", 0) > time.time():
+                return entry["access"]
+            return self._cache_access(cache, user, fetch_access())
+
     def process_request(self, request):  # noqa: C901
         """Process request for csrf checks.
         Args:
@@ -326,20 +369,23 @@ class IdentityHeaderMiddleware(MiddlewareMixin):
             user.admin = is_admin
             user.req_id = req_id
 
-            cache = caches["rbac"]
-            user_access = cache.get(user.uuid)
+            if settings.DEVELOPMENT and request.user.req_id == "DEVELOPMENT":
+                # passthrough for DEVELOPMENT_IDENTITY env var.
+                dev_access = request.user.access
 
-            if not user_access:
-                if settings.DEVELOPMENT and request.user.req_id == "DEVELOPMENT":
-                    # passthrough for DEVELOPMENT_IDENTITY env var.
+                def fetch_access():
                     LOG.warning("DEVELOPMENT is Enabled. Bypassing access lookup for user: %s", json_rh_auth)
-                    user_access = request.user.access
-                else:
-                    try:
-                        user_access = self._get_access(user)
-                    except RbacConnectionError as err:
-                        return HttpResponseFailedDependency({"source": "Rbac", "exception": err})
-                cache.set(user.uuid, user_access, self.rbac.cache_ttl)
+                    return dev_access
+
+            else:
+
+                def fetch_access():
+                    return self._get_access(user)
+
+            try:
+                user_access = self._get_cached_access(user, fetch_access)
+            except RbacConnectionError as err:
+                return HttpResponseFailedDependency({"source": "Rbac", "exception": err})
             user.access = user_access
 
             user.beta = False
@@ -384,25 +430,39 @@ class IdentityHeaderMiddleware(MiddlewareMixin):
 
 
 class RequestTimingMiddleware(MiddlewareMixin):
-    """A class to add total time taken to a request/response."""
+    """A class to add total time taken and database queries run to a request/response."""
 
     def process_request(self, request):  # noqa: C901
-        """Process request to add start time.
+        """Process request to add start time and start counting database queries.
         Args:
             request (object): The request object
         """
         request.start_time = time.time()
+        request.db_query_count = 0
+
+        def count_query(execute, sql, params, many, context):
+            request.db_query_count += 1
+            return execute(sql, params, many, context)
+
+        request.db_query_counter = count_query
+        connection.execute_wrappers.append(count_query)
 
     def process_response(self, request, response):
-        """Process response to log total time.
+        """Process response to log total time and database queries.
         Args:
             request (object): The request object
             response (object): The response object
         """
+        counter = getattr(request, "db_query_counter", None)
+        if counter in connection.execute_wrappers:
+            connection.execute_wrappers.remove(counter)
+            DB_QUERIES_PER_REQUEST.observe(request.db_query_count)
         if hasattr(response, "log_statement"):
             stmt = response.log_statement
             time_taken_ms = (time.time() - request.start_time) * 1000
             stmt.update({"response_time": f"{time_taken_ms:.2f} ms"})
+            if counter:
+                stmt.update({"db_queries": request.db_query_count})
             LOG.info(stmt)
         return response
 
@@ -14,6 +14,11 @@ LOG = logging.getLogger(__name__)
 POSITIONAL_VARS = re.compile("%s")
 NAMED_VARS = re.compile(r"%(.+)s")
 EOT = re.compile(r",\s*\)$")  # pylint: disable=anomalous-backslash-in-string
+POSTGRES_INSERT = re.compile(
+    r"^\s*(?:/\*.*?\*/\s*|--[^\n]*\n\s*)*"  # leading comments
+    r"INSERT\s+INTO\s+postgres\.(?P<schema>\w+)\.(?P<table>\w+)\s*\((?P<columns>[^)]*)\)\s*(?P<query>.*?)[\s;]*$",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 class PreprocessStatementError(Exception):
@@ -78,6 +83,21 @@ def sql_mogrify(sql, params=None):
         return sql
 
 
+def split_postgres_insert(sql):
+    """
+    Split an INSERT INTO postgres.<schema>.<table> (<columns>) <query> statement into its parts.
+    Params:
+        sql (str) : PrestoSQL statement
+    Returns:
+        tuple : (schema, table, columns, query) or None if sql does not insert into the postgres catalog
+    """
+    match = POSTGRES_INSERT.match(sql)
+    if not match:
+        return None
+    columns = [column.strip() for column in match.group("columns").split(",") if column.strip()]
+    return match.group("schema"), match.group("table"), columns, match.group("query")
+
+
 def connect(**connect_args):
     """
     Establish a prestodb connection.
@@ -8,6 +8,7 @@ from json.decoder import JSONDecodeError
 
 import requests
 from prometheus_client import Counter
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
 from rest_framework import status
 
@@ -170,6 +171,12 @@ class RbacService:
         self.port = rbac_conn_info.get(PORT)
         self.path = rbac_conn_info.get(PATH)
         self.cache_ttl = ENVIRONMENT.int("RBAC_CACHE_TTL", default=30)
+        self.cache_stale_ttl = ENVIRONMENT.int("RBAC_CACHE_STALE_TTL", default=300)
+        # Keep-alive connections to RBAC are reused across requests instead of opened per lookup
+        adapter = HTTPAdapter(pool_maxsize=ENVIRONMENT.int("RBAC_POOL_MAXSIZE", default=10))
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _get_rbac_service(self):
         """Get RBAC service host and port info from environment."""
@@ -181,45 +188,44 @@ class RbacService:
         }
 
     def _request_user_access(self, url, headers):  # noqa: C901
-        """Send request to RBAC service and handle pagination case."""
+        """Send requests to RBAC service, following the pagination links."""
         access = []
-        try:
-            response = requests.get(url, headers=headers)
-        except ConnectionError as err:
-            LOG.warning("Error requesting user access: %s", err)
-            RBAC_CONNECTION_ERROR_COUNTER.inc()
-            raise RbacConnectionError(err)
-
-        if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
-            msg = ">=500 Response from RBAC"
-            LOG.warning(msg)
-            RBAC_CONNECTION_ERROR_COUNTER.inc()
-            raise RbacConnectionError(msg)
-
-        if response.status_code != status.HTTP_200_OK:
+        while url:
             try:
-                error = response.json()
-                LOG.warning("Error requesting user access: %s", error)
-            except (JSONDecodeError, ValueError) as res_error:
-                LOG.warning("Error processing failed, %s, user access: %s", response.status_code, res_error)
-            return access
-
-        # check for pagination handling
-        try:
-            data = response.json()
-        except ValueError as res_error:
-            LOG.error("Error processing user access: %s", res_error)
-            return access
-
-        if not isinstance(data, dict):
-            LOG.error("Error processing user access. Unexpected response object: %s", data)
-            return access
-
-        next_link = data.get("links", {}).get("next")
-        access = data.get("data", [])
-        if next_link:
-            next_url = f"{self.protocol}://{self.host}:{self.port}{next_link}"
-            access += self._request_user_access(next_url, headers)
+                response = self.session.get(url, headers=headers)
+            except ConnectionError as err:
+                LOG.warning("Error requesting user access: %s", err)
+                RBAC_CONNECTION_ERROR_COUNTER.inc()
+                raise RbacConnectionError(err)
+
+            if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                msg = ">=500 Response from RBAC"
+                LOG.warning(msg)
+                RBAC_CONNECTION_ERROR_COUNTER.inc()
+                raise RbacConnectionError(msg)
+
+            if response.status_code != status.HTTP_200_OK:
+                try:
+                    error = response.json()
+                    LOG.warning("Error requesting user access: %s", error)
+                except (JSONDecodeError, ValueError) as res_error:
+                    LOG.warning("Error processing failed, %s, user access: %s", response.status_code, res_error)
+                return access
+
+            # check for pagination handling
+            try:
+                data = response.json()
+            except ValueError as res_error:
+                LOG.error("Error processing user access: %s", res_error)
+                return access
+
+            if not isinstance(data, dict):
+                LOG.error("Error processing user access. Unexpected response object: %s", data)
+                return access
+
+            access += data.get("data", [])
+            next_link = data.get("links", {}).get("next")
+            url = f"{self.protocol}://{self.host}:{self.port}{next_link}" if next_link else None
         return access
 
     def get_access_for_user(self, user):
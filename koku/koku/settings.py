@@ -419,14 +419,29 @@ S3_SECRET = CONFIGURATOR.get_object_store_secret_key(REQUESTED_BUCKET)
 ENABLE_S3_ARCHIVING = ENVIRONMENT.bool("ENABLE_S3_ARCHIVING", default=False)
 ENABLE_PARQUET_PROCESSING = ENVIRONMENT.bool("ENABLE_PARQUET_PROCESSING", default=False)
 PARQUET_PROCESSING_BATCH_SIZE = ENVIRONMENT.int("PARQUET_PROCESSING_BATCH_SIZE", default=200000)
+PARQUET_STREAMING_SOURCE_TYPES = ENVIRONMENT.list("PARQUET_STREAMING_SOURCE_TYPES", default=[])
+PARQUET_ROW_GROUP_SIZE = ENVIRONMENT.int("PARQUET_ROW_GROUP_SIZE", default=200000)
+PARQUET_MAX_ROWS_PER_FILE = ENVIRONMENT.int("PARQUET_MAX_ROWS_PER_FILE", default=2000000)
+# Convert split files in a process pool, which needs a Celery worker pool that is not prefork (e.g. threads)
+ENABLE_PARQUET_CONVERSION_POOL = ENVIRONMENT.bool("ENABLE_PARQUET_CONVERSION_POOL", default=False)
+PARQUET_CONVERSION_WORKERS = ENVIRONMENT.int("PARQUET_CONVERSION_WORKERS", default=1)
+PARQUET_UPLOAD_WORKERS = ENVIRONMENT.int("PARQUET_UPLOAD_WORKERS", default=4)
 ENABLE_TRINO_SOURCES = ENVIRONMENT.list("ENABLE_TRINO_SOURCES", default=[])
 ENABLE_TRINO_ACCOUNTS = ENVIRONMENT.list("ENABLE_TRINO_ACCOUNTS", default=[])
 ENABLE_TRINO_SOURCE_TYPE = ENVIRONMENT.list("ENABLE_TRINO_SOURCE_TYPE", default=[])
+# Load Trino summary results into Postgres with COPY instead of the Trino Postgres connector
+ENABLE_TRINO_COPY_SINK_SOURCES = ENVIRONMENT.list("ENABLE_TRINO_COPY_SINK_SOURCES", default=[])
+ENABLE_TRINO_COPY_SINK_SOURCE_TYPE = ENVIRONMENT.list("ENABLE_TRINO_COPY_SINK_SOURCE_TYPE", default=[])
 
 # Presto Settings
 PRESTO_HOST = ENVIRONMENT.get_value("PRESTO_HOST", default=None)
 PRESTO_PORT = ENVIRONMENT.get_value("PRESTO_PORT", default=None)
 TRINO_DATE_STEP = ENVIRONMENT.int("TRINO_DATE_STEP", default=5)
+TRINO_TENANT_CONCURRENCY = ENVIRONMENT.int("TRINO_TENANT_CONCURRENCY", default=2)
+# OCP manifests summarize only their changed days, with the full date range summarized at this interval
+OCP_FULL_SUMMARY_INTERVAL_HOURS = ENVIRONMENT.int("OCP_FULL_SUMMARY_INTERVAL_HOURS", default=24)
+TRINO_CATALOG_CACHE_TTL = ENVIRONMENT.int("TRINO_CATALOG_CACHE_TTL", default=600)
+PARTITION_REGISTRY_TTL = ENVIRONMENT.int("PARTITION_REGISTRY_TTL", default=3600)
 
 # IBM Settings
 IBM_SERVICE_URL = ENVIRONMENT.get_value("IBM_SERVICE_URL", default="https://enterprise.cloud.ibm.com")
@@ -5,20 +5,28 @@
 """Test view caching functions."""
 import logging
 import random
+from unittest.mock import Mock
+from unittest.mock import patch
 
 from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import RequestFactory
 from django.test.utils import override_settings
+from tenant_schemas.utils import schema_context
 
 from api.iam.test.iam_test_case import IamTestCase
 from koku.cache import AWS_CACHE_PREFIX
 from koku.cache import AZURE_CACHE_PREFIX
+from koku.cache import cache_view
+from koku.cache import get_cached_tag_keys
+from koku.cache import get_view_cache_version
 from koku.cache import invalidate_view_cache_for_tenant_and_cache_key
 from koku.cache import invalidate_view_cache_for_tenant_and_source_type
-from koku.cache import KokuCacheError
 from koku.cache import OPENSHIFT_ALL_CACHE_PREFIX
 from koku.cache import OPENSHIFT_AWS_CACHE_PREFIX
 from koku.cache import OPENSHIFT_AZURE_CACHE_PREFIX
 from koku.cache import OPENSHIFT_CACHE_PREFIX
+from reporting.provider.aws.models import AWSTagsSummary
 
 
 LOG = logging.getLogger(__name__)
@@ -49,19 +57,32 @@ class KokuCacheTest(IamTestCase):
         self.cache.clear()
 
     def test_invalidate_view_cache_for_tenant_and_cache_key(self):
-        """Test that specific cache data is deleted."""
-        key_to_clear = f"{self.schema_name}:{self.cache_key_prefix}"
-        remaining_key = f"keeper:{self.cache_key_prefix}"
-        cache_data = {key_to_clear: "value", remaining_key: "value"}
-        self.cache.set_many(cache_data)
-
-        self.assertIsNotNone(self.cache.get(key_to_clear))
-        self.assertIsNotNone(self.cache.get(remaining_key))
+        """Test that invalidation moves only the tenant's prefix to a new generation."""
+        other_prefix = random.choice([prefix for prefix in CACHE_PREFIXES if prefix != self.cache_key_prefix])
+        with schema_context(self.schema_name):
+            version = get_view_cache_version(self.cache_key_prefix)
+            other_version = get_view_cache_version(other_prefix)
+        with schema_context("public"):
+            public_version = get_view_cache_version(self.cache_key_prefix)
 
         invalidate_view_cache_for_tenant_and_cache_key(self.schema_name, self.cache_key_prefix)
 
-        self.assertIsNone(self.cache.get(key_to_clear))
-        self.assertIsNotNone(self.cache.get(remaining_key))
+        with schema_context(self.schema_name):
+            self.assertNotEqual(get_view_cache_version(self.cache_key_prefix), version)
+            self.assertEqual(get_view_cache_version(other_prefix), other_version)
+        with schema_context("public"):
+            self.assertEqual(get_view_cache_version(self.cache_key_prefix), public_version)
+
+    def test_invalidate_view_cache_for_tenant_all_prefixes(self):
+        """Test that invalidating without a prefix moves every view prefix to a new generation."""
+        with schema_context(self.schema_name):
+            versions = {prefix: get_view_cache_version(prefix) for prefix in CACHE_PREFIXES}
+
+        invalidate_view_cache_for_tenant_and_cache_key(self.schema_name)
+
+        with schema_context(self.schema_name):
+            for prefix, version in versions.items():
+                self.assertNotEqual(get_view_cache_version(prefix), version)
 
     @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
     def test_invalidate_view_cache_for_tenant_and_cache_key_dummy_cache(self):
@@ -69,54 +90,55 @@ class KokuCacheTest(IamTestCase):
         with self.assertLogs(logger="koku.cache", level="INFO"):
             invalidate_view_cache_for_tenant_and_cache_key(self.schema_name, self.cache_key_prefix)
 
-    @override_settings(
-        CACHES={
-            "default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "worker_cache_table"}
-        }
-    )
-    def test_invalidate_view_cache_for_tenant_and_cache_key_unsupported_backend(self):
-        """Test that an unsupported cache backend raises an error."""
-        with self.assertRaises(KokuCacheError):
-            invalidate_view_cache_for_tenant_and_cache_key(self.schema_name, self.cache_key_prefix)
+    def test_cache_view(self):
+        """Test that a cached view is served from the cache until its prefix is invalidated."""
+        view = Mock(side_effect=lambda request: HttpResponse(str(view.call_count)))
+        cached_view = cache_view(timeout=60, key_prefix=self.cache_key_prefix)(view)
+        request = RequestFactory().get("/api/v1/reports/")
+
+        with schema_context(self.schema_name):
+            self.assertEqual(cached_view(request).content, b"1")
+            self.assertEqual(cached_view(request).content, b"1")
+        invalidate_view_cache_for_tenant_and_cache_key(self.schema_name, self.cache_key_prefix)
+        with schema_context(self.schema_name):
+            self.assertEqual(cached_view(request).content, b"2")
 
     def test_invalidate_view_cache_for_tenant_and_source_type(self):
         """Test that all views for a source type and tenant are invalidated."""
-        aws_cache_key_prefixes = (AWS_CACHE_PREFIX, OPENSHIFT_AWS_CACHE_PREFIX, OPENSHIFT_ALL_CACHE_PREFIX)
-        aws_cache_data = {}
-        for prefix in aws_cache_key_prefixes:
-            aws_cache_data.update({f"{self.schema_name}:{prefix}": "value"})
-        self.cache.set_many(aws_cache_data)
-
-        invalidate_view_cache_for_tenant_and_source_type(self.schema_name, "AWS")
-
-        for key in aws_cache_data:
-            self.assertIsNone(self.cache.get(key))
-
-        openshift_cache_key_prefixes = (
-            OPENSHIFT_CACHE_PREFIX,
-            OPENSHIFT_AWS_CACHE_PREFIX,
-            OPENSHIFT_AZURE_CACHE_PREFIX,
-            OPENSHIFT_ALL_CACHE_PREFIX,
-        )
-
-        openshift_cache_data = {}
-        for prefix in openshift_cache_key_prefixes:
-            openshift_cache_data.update({f"{self.schema_name}:{prefix}": "value"})
-        self.cache.set_many(openshift_cache_data)
-
-        invalidate_view_cache_for_tenant_and_source_type(self.schema_name, "OCP")
-
-        for key in openshift_cache_data:
-            self.assertIsNone(self.cache.get(key))
-
-        azure_cache_key_prefixes = (AZURE_CACHE_PREFIX, OPENSHIFT_AZURE_CACHE_PREFIX, OPENSHIFT_ALL_CACHE_PREFIX)
-
-        azure_cache_data = {}
-        for prefix in azure_cache_key_prefixes:
-            azure_cache_data.update({f"{self.schema_name}:{prefix}": "value"})
-        self.cache.set_many(azure_cache_data)
-
-        invalidate_view_cache_for_tenant_and_source_type(self.schema_name, "Azure")
-
-        for key in azure_cache_data:
-            self.assertIsNone(self.cache.get(key))
+        source_type_prefixes = {
+            "AWS": (AWS_CACHE_PREFIX, OPENSHIFT_AWS_CACHE_PREFIX, OPENSHIFT_ALL_CACHE_PREFIX),
+            "OCP": (
+                OPENSHIFT_CACHE_PREFIX,
+                OPENSHIFT_AWS_CACHE_PREFIX,
+                OPENSHIFT_AZURE_CACHE_PREFIX,
+                OPENSHIFT_ALL_CACHE_PREFIX,
+            ),
+            "Azure": (AZURE_CACHE_PREFIX, OPENSHIFT_AZURE_CACHE_PREFIX, OPENSHIFT_ALL_CACHE_PREFIX),
+        }
+        for source_type, prefixes in source_type_prefixes.items():
+            with self.subTest(source_type=source_type):
+                with schema_context(self.schema_name):
+                    versions = {prefix: get_view_cache_version(prefix) for prefix in CACHE_PREFIXES}
+
+                invalidate_view_cache_for_tenant_and_source_type(self.schema_name, source_type)
+
+                with schema_context(self.schema_name):
+                    for prefix, version in versions.items():
+                        if prefix in prefixes:
+                            self.assertNotEqual(get_view_cache_version(prefix), version)
+                        else:
+                            self.assertEqual(get_view_cache_version(prefix), version)
+
+    def test_get_cached_tag_keys(self):
+        """Test that tag keys are cached per tenant until the source type is invalidated."""
+        with schema_context(self.schema_name):
+            expected = set(AWSTagsSummary.objects.values_list("key", flat=True))
+
+        self.assertEqual(get_cached_tag_keys(self.schema_name, AWSTagsSummary), expected)
+        with patch.object(AWSTagsSummary, "objects") as mock_objects:
+            self.assertEqual(get_cached_tag_keys(self.schema_name, AWSTagsSummary), expected)
+            mock_objects.values.assert_not_called()
+
+            invalidate_view_cache_for_tenant_and_source_type(self.schema_name, "AWS")
+            mock_objects.values.return_value = [{"key": "new_key"}]
+            self.assertEqual(get_cached_tag_keys(self.schema_name, AWSTagsSummary), {"new_key"})
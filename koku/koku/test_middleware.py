@@ -13,7 +13,9 @@ from unittest.mock import patch
 from cachetools import TTLCache
 from django.core.cache import caches
 from django.core.exceptions import PermissionDenied
+from django.db import connection
 from django.db.utils import OperationalError
+from django.http import HttpResponse
 from django.http import JsonResponse
 from django.test.utils import modify_settings
 from django.test.utils import override_settings
@@ -38,6 +40,7 @@ from koku.middleware import HttpResponseUnauthorizedRequest
 from koku.middleware import IdentityHeaderMiddleware
 from koku.middleware import KokuTenantMiddleware
 from koku.middleware import RequestTimingMiddleware
+from koku.rbac import RbacConnectionError
 from koku.test_rbac import mocked_requests_get_500_text
 
 LOG = logging.getLogger(__name__)
@@ -290,11 +293,68 @@ class IdentityHeaderMiddlewareTest(IamTestCase):
 
         user_uuid = mock_request.user.uuid
         cache = caches["rbac"]
-        self.assertEqual(cache.get(user_uuid), mock_access)
+        self.assertEqual(cache.get(user_uuid)["access"], mock_access)
 
         middleware.process_request(mock_request)
         cache = caches["rbac"]
-        self.assertEqual(cache.get(user_uuid), mock_access)
+        self.assertEqual(cache.get(user_uuid)["access"], mock_access)
+        get_access_mock.assert_called_once()
+
+    @patch("koku.rbac.RbacService.get_access_for_user")
+    def test_process_serves_stale_access_while_refreshing(self, get_access_mock):
+        """Test that a stale cache entry is served while another request refreshes it."""
+        stale_access = {"aws.account": {"read": ["111111111111"]}}
+        fresh_access = {"aws.account": {"read": ["999999999999"]}}
+        get_access_mock.return_value = fresh_access
+
+        user_data = self._create_user_data()
+        customer = self._create_customer_data()
+        request_context = self._create_request_context(
+            customer, user_data, create_customer=True, create_tenant=True, is_admin=False
+        )
+        mock_request = request_context["request"]
+        mock_request.path = "/api/v1/tags/aws/"
+        mock_request.META["QUERY_STRING"] = ""
+
+        middleware = IdentityHeaderMiddleware()
+        middleware.process_request(mock_request)
+        user = mock_request.user
+        cache = caches["rbac"]
+        cache.set(user.uuid, {"access": stale_access, "expires": 0})
+
+        cache.add(f"{user.uuid}.refresh", True)
+        self.assertEqual(middleware._get_cached_access(user, get_access_mock), stale_access)
+        get_access_mock.assert_called_once()
+
+        cache.delete(f"{user.uuid}.refresh")
+        self.assertEqual(middleware._get_cached_access(user, get_access_mock), fresh_access)
+        self.assertEqual(cache.get(user.uuid)["access"], fresh_access)
+
+    @patch("koku.rbac.RbacService.get_access_for_user")
+    def test_process_stale_access_on_rbac_error(self, get_access_mock):
+        """Test that a stale cache entry is served when RBAC is unavailable."""
+        stale_access = {"aws.account": {"read": ["111111111111"]}}
+        get_access_mock.return_value = stale_access
+
+        user_data = self._create_user_data()
+        customer = self._create_customer_data()
+        request_context = self._create_request_context(
+            customer, user_data, create_customer=True, create_tenant=True, is_admin=False
+        )
+        mock_request = request_context["request"]
+        mock_request.path = "/api/v1/tags/aws/"
+        mock_request.META["QUERY_STRING"] = ""
+
+        middleware = IdentityHeaderMiddleware()
+        middleware.process_request(mock_request)
+        user_uuid = mock_request.user.uuid
+        caches["rbac"].set(user_uuid, {"access": stale_access, "expires": 0})
+
+        get_access_mock.side_effect = RbacConnectionError("test exception")
+        response = middleware.process_request(mock_request)
+        self.assertIsNone(response)
+        self.assertEqual(mock_request.user.access, stale_access)
+        self.assertEqual(get_access_mock.call_count, 2)
 
     def test_process_not_entitled(self):
         """Test that the a request cannot be made if not entitled."""
@@ -377,7 +437,7 @@ class IdentityHeaderMiddlewareTest(IamTestCase):
             response = middleware.process_request(mock_request)
             self.assertEqual(response.status_code, status.HTTP_424_FAILED_DEPENDENCY)
 
-    @patch("koku.rbac.requests.get", side_effect=ConnectionError("test exception"))
+    @patch("koku.rbac.requests.Session.get", side_effect=ConnectionError("test exception"))
     def test_rbac_connection_error_return_424(self, mocked_get):
         """Test RbacConnectionError causes 424 Reponse."""
         user_data = self._create_user_data()
@@ -394,7 +454,7 @@ class IdentityHeaderMiddlewareTest(IamTestCase):
         self.assertEqual(response.status_code, status.HTTP_424_FAILED_DEPENDENCY)
         mocked_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_500_text)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_500_text)
     def test_rbac_500_response_return_424(self, mocked_get):
         """Test 500 RBAC response causes 424 Reponse."""
         user_data = self._create_user_data()
@@ -473,6 +533,9 @@ class RequestTimingMiddlewareTest(IamTestCase):
         middleware = RequestTimingMiddleware()
         middleware.process_request(self.request)
         self.assertTrue(hasattr(self.request, "start_time"))
+        self.assertIn(self.request.db_query_counter, connection.execute_wrappers)
+        middleware.process_response(self.request, HttpResponse())
+        self.assertNotIn(self.request.db_query_counter, connection.execute_wrappers)
 
     def test_process_response(self):
         """Test that the request gets a user."""
@@ -484,7 +547,7 @@ class RequestTimingMiddlewareTest(IamTestCase):
             output = logger.output
             logged = False
             for msg in output:
-                if "response_time" in msg:
+                if "response_time" in msg and "db_queries" in msg:
                     logged = True
             self.assertTrue(logged)
 
@@ -111,3 +111,26 @@ select a from b;
         conn = FakePrestoConn()
         res = kpdb.executescript(conn, sqlscript)
         self.assertEqual(res, [["eek"], ["eek"]])
+
+    def test_split_postgres_insert(self):
+        """
+        Test that an insert into the postgres catalog is split into its target and query
+        """
+        sql = """
+/* summary */
+INSERT INTO postgres.acct10001.reporting_table (
+    uuid,
+    usage_start
+)
+-- aggregate the line items
+SELECT uuid() as uuid, usage_start FROM hive.acct10001.line_items;
+"""
+        schema, table, columns, query = kpdb.split_postgres_insert(sql)
+        self.assertEqual(schema, "acct10001")
+        self.assertEqual(table, "reporting_table")
+        self.assertEqual(columns, ["uuid", "usage_start"])
+        self.assertEqual(
+            query, "-- aggregate the line items\nSELECT uuid() as uuid, usage_start FROM hive.acct10001.line_items"
+        )
+        self.assertIsNone(kpdb.split_postgres_insert("INSERT INTO hive.acct10001.t (a) SELECT 1"))
+        self.assertIsNone(kpdb.split_postgres_insert("select x from y"))
@@ -108,7 +108,7 @@ def mocked_get_operation(access_item, res_type):
 class RbacServiceTest(TestCase):
     """Test RbacService object."""
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_404_json)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_404_json)
     def test_non_200_error_json(self, mock_get):
         """Test handling of request with non-200 response and json error."""
         rbac = RbacService()
@@ -117,7 +117,7 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, [])
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_500_text)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_500_text)
     def test_500_error_json(self, mock_get):
         """Test handling of request with 500 response and json error."""
         rbac = RbacService()
@@ -125,7 +125,7 @@ class RbacServiceTest(TestCase):
         with self.assertRaises(RbacConnectionError):
             rbac._request_user_access(url, headers={})
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_404_text)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_404_text)
     def test_non_200_error_text(self, mock_get):
         """Test handling of request with non-200 response and non-json error."""
         rbac = RbacService()
@@ -134,7 +134,7 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, [])
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_404_except)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_404_except)
     def test_non_200_error_except(self, mock_get):
         """Test handling of request with non-200 response and non-json error."""
         rbac = RbacService()
@@ -145,7 +145,7 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, [])
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_text)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_text)
     def test_200_text(self, mock_get):
         """Test handling of request with 200 response and non-json error."""
         rbac = RbacService()
@@ -154,7 +154,7 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, [])
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_except)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_except)
     def test_200_exception(self, mock_get):
         """Test handling of request with 200 response and raises a json error."""
         rbac = RbacService()
@@ -163,7 +163,7 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, [])
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_no_next)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_no_next)
     def test_200_all_results(self, mock_get):
         """Test handling of request with 200 response with no next link."""
         rbac = RbacService()
@@ -172,16 +172,25 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, [LIMITED_AWS_ACCESS])
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_next)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_next)
     def test_200_results_next(self, mock_get):
         """Test handling of request with 200 response with next link."""
         rbac = RbacService()
         url = f"{rbac.protocol}://{rbac.host}:{rbac.port}{rbac.path}"
         access = rbac._request_user_access(url, headers={})
         self.assertEqual(access, [LIMITED_AWS_ACCESS, LIMITED_AWS_ACCESS])
-        mock_get.assert_called()
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(
+            mock_get.call_args[0][0], f"{rbac.protocol}://{rbac.host}:{rbac.port}/v1/access/?limit=10&offset=200"
+        )
+
+    def test_session_pools_connections(self):
+        """Test that requests share a keep-alive session with a pooled adapter."""
+        rbac = RbacService()
+        url = f"{rbac.protocol}://{rbac.host}:{rbac.port}{rbac.path}"
+        self.assertIs(rbac.session.get_adapter(url), rbac.session.get_adapter("https://rbac/"))
 
-    @patch("koku.rbac.requests.get", side_effect=ConnectionError("test exception"))
+    @patch("koku.rbac.requests.Session.get", side_effect=ConnectionError("test exception"))
     def test_get_except(self, mock_get):
         """Test handling of request with ConnectionError."""
         before = REGISTRY.get_sample_value("rbac_connection_errors_total")
@@ -433,7 +442,7 @@ class RbacServiceTest(TestCase):
         }
         self.assertEqual(res_access, expected)
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_except)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_except)
     def test_get_access_for_user_none(self, mock_get):
         """Test handling of user request where no access returns None."""
         rbac = RbacService()
@@ -443,7 +452,7 @@ class RbacServiceTest(TestCase):
         self.assertIsNone(access)
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_no_next)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_no_next)
     def test_get_access_for_user_data_limited(self, mock_get):
         """Test handling of user request where access returns data."""
         rbac = RbacService()
@@ -465,7 +474,7 @@ class RbacServiceTest(TestCase):
         self.assertEqual(access, expected)
         mock_get.assert_called()
 
-    @patch("koku.rbac.requests.get", side_effect=mocked_requests_get_200_no_next_ibm)
+    @patch("koku.rbac.requests.Session.get", side_effect=mocked_requests_get_200_no_next_ibm)
     def test_get_access_for_user_data_limited_ibm(self, mock_get):
         """Test handling of user request where access returns data with IBM access."""
         rbac = RbacService()
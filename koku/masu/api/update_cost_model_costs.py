@@ -57,7 +57,12 @@ def update_cost_model_costs(request):
     async_result = chain(
         cost_task.s(schema_name, provider_uuid, start_date, end_date, queue_name=queue_name).set(queue=queue_name),
         refresh_materialized_views.si(
-            schema_name, provider.type, provider_uuid=provider_uuid, queue_name=queue_name
+            schema_name,
+            provider.type,
+            provider_uuid=provider_uuid,
+            queue_name=queue_name,
+            start_date=start_date,
+            end_date=end_date,
         ).set(queue=queue_name),
     ).apply_async()
 
@@ -20,6 +20,8 @@ DEFAULT_KAFKA_CONNECT = True
 DEFAULT_RETRY_SECONDS = 10
 DEFAULT_DEL_RECORD_LIMIT = 5000
 DEFAULT_MAX_ITERATIONS = 3
+DEFAULT_PAYLOAD_MAX_MEMBER_SIZE = 2 * 1024 ** 3
+DEFAULT_REFRESH_COALESCE_SECONDS = 60
 
 
 class Config:
@@ -84,7 +86,13 @@ class Config:
     # Flag to signal whether or not to connect to upload service
     KAFKA_CONNECT = ENVIRONMENT.bool("KAFKA_CONNECT", default=DEFAULT_KAFKA_CONNECT)
 
+    # Largest uncompressed file accepted from an operator payload (in bytes)
+    PAYLOAD_MAX_MEMBER_SIZE = ENVIRONMENT.int("PAYLOAD_MAX_MEMBER_SIZE", default=DEFAULT_PAYLOAD_MAX_MEMBER_SIZE)
+
     RETRY_SECONDS = ENVIRONMENT.int("RETRY_SECONDS", default=DEFAULT_RETRY_SECONDS)
 
+    # Window in which refresh requests for a tenant and provider type are merged into one refresh
+    REFRESH_COALESCE_SECONDS = ENVIRONMENT.int("REFRESH_COALESCE_SECONDS", default=DEFAULT_REFRESH_COALESCE_SECONDS)
+
     DEL_RECORD_LIMIT = ENVIRONMENT.int("DELETE_CYCLE_RECORD_LIMIT", default=DEFAULT_DEL_RECORD_LIMIT)
     MAX_ITERATIONS = ENVIRONMENT.int("DELETE_CYCLE_MAX_RETRY", default=DEFAULT_MAX_ITERATIONS)
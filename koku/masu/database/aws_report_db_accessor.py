@@ -14,10 +14,12 @@ from django.db.models import F
 from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 
+from api.models import Provider
 from masu.config import Config
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
 from masu.external.date_accessor import DateAccessor
+from masu.processor import enable_trino_copy_sink
 from reporting.provider.aws.models import AWSCostEntry
 from reporting.provider.aws.models import AWSCostEntryBill
 from reporting.provider.aws.models import AWSCostEntryLineItem
@@ -271,7 +273,10 @@ class AWSReportDBAccessor(ReportDBAccessorBase):
         summary_sql, summary_sql_params = self.jinja_sql.prepare_query(summary_sql, summary_sql_params)
 
         LOG.info(f"Summary SQL: {str(summary_sql)}")
-        self._execute_presto_raw_sql_query(self.schema, summary_sql)
+        if enable_trino_copy_sink(source_uuid, Provider.PROVIDER_AWS):
+            self._execute_presto_insert_with_copy(summary_sql)
+        else:
+            self._execute_presto_raw_sql_query(self.schema, summary_sql)
 
     def mark_bill_as_finalized(self, bill_id):
         """Mark a bill in the database as finalized."""
@@ -26,12 +26,14 @@ from tenant_schemas.utils import schema_context
 
 import koku.presto_database as kpdb
 from api.metrics import constants as metric_constants
+from api.models import Provider
 from api.utils import DateHelper
 from koku.database import JSONBBuildObject
 from masu.config import Config
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database import OCP_REPORT_TABLE_MAP
 from masu.database.report_db_accessor_base import ReportDBAccessorBase
+from masu.processor import enable_trino_copy_sink
 from masu.util.common import month_date_range_tuple
 from reporting.provider.aws.models import PRESTO_LINE_ITEM_DAILY_TABLE as AWS_PRESTO_LINE_ITEM_DAILY_TABLE
 from reporting.provider.azure.models import PRESTO_LINE_ITEM_DAILY_TABLE as AZURE_PRESTO_LINE_ITEM_DAILY_TABLE
@@ -46,6 +48,16 @@ from reporting.provider.ocp.models import PRESTO_LINE_ITEM_TABLE_DAILY_MAP
 
 LOG = logging.getLogger(__name__)
 
+# defines the usage type for each tag rate metric
+TAG_RATE_METRIC_USAGE_TYPES = {
+    "cpu_core_usage_per_hour": "cpu",
+    "cpu_core_request_per_hour": "cpu",
+    "memory_gb_usage_per_hour": "memory",
+    "memory_gb_request_per_hour": "memory",
+    "storage_gb_usage_per_month": "storage",
+    "storage_gb_request_per_month": "storage",
+}
+
 
 def create_filter(data_source, start_date, end_date, cluster_id):
     """Create filter with data source, start and end dates."""
@@ -650,6 +662,11 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
             "month": start_date.strftime("%m"),
         }
 
+        if enable_trino_copy_sink(source, Provider.PROVIDER_OCP):
+            summary_sql, summary_sql_params = self.jinja_sql.prepare_query(tmpl_summary_sql, summary_sql_params)
+            self._execute_presto_insert_with_copy(kpdb.sql_mogrify(summary_sql, summary_sql_params))
+            return
+
         LOG.info("PRESTO OCP: Connect")
         presto_conn = kpdb.connect(schema=self.schema)
         try:
@@ -1946,14 +1963,41 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
             ),
         )
 
-    def populate_tag_usage_costs(  # noqa: C901
-        self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id
-    ):
+    def _populate_tag_rate_costs(self, method_name, sql_file, tag_rates, start_date, end_date, cluster_id):
+        """Apply every tag rate for one rate type with a single UPDATE of the daily summary table."""
+        if not tag_rates:
+            return
+        # Cast start_date and end_date to date object, if they aren't already
+        if isinstance(start_date, str):
+            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        if isinstance(start_date, datetime.datetime):
+            start_date = start_date.date()
+            end_date = end_date.date()
+
+        table_name = self._table_map["line_item_daily_summary"]
+        tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
+        tag_rates_sql = tag_rates_sql.decode("utf-8")
+        tag_rates_sql_params = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "cluster_id": cluster_id,
+            "schema": self.schema,
+            "tag_rates": tag_rates,
+        }
+        tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(tag_rates_sql, tag_rates_sql_params)
+        LOG.info(f"Running {method_name} SQL from {sql_file} for {len(tag_rates)} tag rates.")
+        self._execute_raw_sql_query(
+            table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
+        )
+
+    def populate_tag_usage_costs(self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id):
         """
         Update the reporting_ocpusagelineitem_daily_summary table with
         usage costs based on tag rates.
-        Due to the way the tag_keys are stored it loops through all of
-        the tag keys to filter and update costs.
+        Every (metric, tag key, tag value) rate of a rate type is sent as a
+        VALUES list and applied in one UPDATE, so the table is scanned once
+        per rate type regardless of the number of tag values.
 
         The data structure for infrastructure and supplementary rates are
         a dictionary that include the metric name, the tag key,
@@ -1965,73 +2009,38 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
                 }
             }
         """
-        # defines the usage type for each metric
-        metric_usage_type_map = {
-            "cpu_core_usage_per_hour": "cpu",
-            "cpu_core_request_per_hour": "cpu",
-            "memory_gb_usage_per_hour": "memory",
-            "memory_gb_request_per_hour": "memory",
-            "storage_gb_usage_per_month": "storage",
-            "storage_gb_request_per_month": "storage",
-        }
         # define the rates so the loop can operate on both rate types
         rate_types = [
             {"rates": infrastructure_rates, "sql_file": "sql/infrastructure_tag_rates.sql"},
             {"rates": supplementary_rates, "sql_file": "sql/supplementary_tag_rates.sql"},
         ]
-        # Cast start_date and end_date to date object, if they aren't already
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        if isinstance(start_date, datetime.datetime):
-            start_date = start_date.date()
-            end_date = end_date.date()
-        # updates costs from tags
         for rate_type in rate_types:
-            rate = rate_type.get("rates")
-            sql_file = rate_type.get("sql_file")
-            for metric in rate:
-                tags = rate.get(metric, {})
-                usage_type = metric_usage_type_map.get(metric)
-                if usage_type == "storage":
-                    labels_field = "volume_labels"
-                else:
-                    labels_field = "pod_labels"
-                table_name = self._table_map["line_item_daily_summary"]
-                for tag_key in tags:
-                    tag_vals = tags.get(tag_key, {})
-                    value_names = list(tag_vals.keys())
-                    for val_name in value_names:
-                        rate_value = tag_vals[val_name]
-                        key_value_pair = json.dumps({tag_key: val_name})
-                        tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
-                        tag_rates_sql = tag_rates_sql.decode("utf-8")
-                        tag_rates_sql_params = {
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "rate": rate_value,
-                            "cluster_id": cluster_id,
-                            "schema": self.schema,
-                            "usage_type": usage_type,
-                            "metric": metric,
-                            "k_v_pair": key_value_pair,
-                            "labels_field": labels_field,
-                        }
-                        tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(
-                            tag_rates_sql, tag_rates_sql_params
-                        )
-                        msg = f"Running populate_tag_usage_costs SQL with params: {tag_rates_sql_params}"
-                        LOG.info(msg)
-                        self._execute_raw_sql_query(
-                            table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
+            tag_rates = []
+            for metric, tags in rate_type.get("rates").items():
+                usage_type = TAG_RATE_METRIC_USAGE_TYPES.get(metric)
+                labels_field = "volume_labels" if usage_type == "storage" else "pod_labels"
+                for tag_key, tag_vals in tags.items():
+                    for val_name, rate_value in tag_vals.items():
+                        tag_rates.append(
+                            {
+                                "metric": metric,
+                                "usage_type": usage_type,
+                                "labels_field": labels_field,
+                                "tag": json.dumps({tag_key: val_name}),
+                                "rate": rate_value,
+                            }
                         )
+            self._populate_tag_rate_costs(
+                "populate_tag_usage_costs", rate_type.get("sql_file"), tag_rates, start_date, end_date, cluster_id
+            )
 
-    def populate_tag_usage_default_costs(  # noqa: C901
+    def populate_tag_usage_default_costs(
         self, infrastructure_rates, supplementary_rates, start_date, end_date, cluster_id
     ):
         """
         Update the reporting_ocpusagelineitem_daily_summary table
         with usage costs based on tag rates.
+        Every default rate of a rate type is applied in one UPDATE.
 
         The data structure for infrastructure and supplementary rates
         are a dictionary that includes the metric, the tag key,
@@ -2046,72 +2055,38 @@ class OCPReportDBAccessor(ReportDBAccessorBase):
                 }
             }
         """
-        # defines the usage type for each metric
-        metric_usage_type_map = {
-            "cpu_core_usage_per_hour": "cpu",
-            "cpu_core_request_per_hour": "cpu",
-            "memory_gb_usage_per_hour": "memory",
-            "memory_gb_request_per_hour": "memory",
-            "storage_gb_usage_per_month": "storage",
-            "storage_gb_request_per_month": "storage",
-        }
         # define the rates so the loop can operate on both rate types
         rate_types = [
             {"rates": infrastructure_rates, "sql_file": "sql/default_infrastructure_tag_rates.sql"},
             {"rates": supplementary_rates, "sql_file": "sql/default_supplementary_tag_rates.sql"},
         ]
-        # Cast start_date and end_date to date object, if they aren't already
-        if isinstance(start_date, str):
-            start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-        if isinstance(start_date, datetime.datetime):
-            start_date = start_date.date()
-            end_date = end_date.date()
-
-        # updates costs from tags
         for rate_type in rate_types:
-            rate = rate_type.get("rates")
-            sql_file = rate_type.get("sql_file")
-            for metric in rate:
-                tags = rate.get(metric, {})
-                usage_type = metric_usage_type_map.get(metric)
-                if usage_type == "storage":
-                    labels_field = "volume_labels"
-                else:
-                    labels_field = "pod_labels"
-                table_name = self._table_map["line_item_daily_summary"]
-                for tag_key in tags:
-                    key_value_pair = []
-                    tag_vals = tags.get(tag_key)
+            tag_rates = []
+            for metric, tags in rate_type.get("rates").items():
+                usage_type = TAG_RATE_METRIC_USAGE_TYPES.get(metric)
+                labels_field = "volume_labels" if usage_type == "storage" else "pod_labels"
+                for tag_key, tag_vals in tags.items():
                     rate_value = tag_vals.get("default_value", 0)
                     if rate_value == 0:
                         continue
-                    value_names = tag_vals.get("defined_keys", [])
-                    for value_to_skip in value_names:
-                        key_value_pair.append(json.dumps({tag_key: value_to_skip}))
-                    json.dumps(key_value_pair)
-                    tag_rates_sql = pkgutil.get_data("masu.database", sql_file)
-                    tag_rates_sql = tag_rates_sql.decode("utf-8")
-                    tag_rates_sql_params = {
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "rate": rate_value,
-                        "cluster_id": cluster_id,
-                        "schema": self.schema,
-                        "usage_type": usage_type,
-                        "metric": metric,
-                        "tag_key": tag_key,
-                        "k_v_pair": key_value_pair,
-                        "labels_field": labels_field,
-                    }
-                    tag_rates_sql, tag_rates_sql_params = self.jinja_sql.prepare_query(
-                        tag_rates_sql, tag_rates_sql_params
-                    )
-                    msg = f"Running populate_tag_usage_default_costs SQL with params: {tag_rates_sql_params}"
-                    LOG.info(msg)
-                    self._execute_raw_sql_query(
-                        table_name, tag_rates_sql, start_date, end_date, bind_params=list(tag_rates_sql_params)
+                    tag_rates.append(
+                        {
+                            "metric": metric,
+                            "usage_type": usage_type,
+                            "labels_field": labels_field,
+                            "tag_key": tag_key,
+                            "defined_values": json.dumps(tag_vals.get("defined_keys", [])),
+                            "rate": rate_value,
+                        }
                     )
+            self._populate_tag_rate_costs(
+                "populate_tag_usage_default_costs",
+                rate_type.get("sql_file"),
+                tag_rates,
+                start_date,
+                end_date,
+                cluster_id,
+            )
 
     def populate_openshift_cluster_information_tables(self, provider, cluster_id, cluster_alias, start_date, end_date):
         """Populate the cluster, node, PVC, and project tables for the cluster."""
@@ -3,7 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Database accessor for report data."""
+import csv
+import datetime
+import io
+import json
 import logging
+import pkgutil
+import tempfile
+import threading
+import time
 import uuid
 from decimal import Decimal
 from decimal import InvalidOperation
@@ -11,12 +19,17 @@ from decimal import InvalidOperation
 import ciso8601
 import django.apps
 from dateutil.relativedelta import relativedelta
+from dateutil.rrule import MONTHLY
+from dateutil.rrule import rrule
+from django.conf import settings
 from django.db import connection
 from django.db import transaction
 from jinjasql import JinjaSql
 from tenant_schemas.utils import schema_context
 
 import koku.presto_database as kpdb
+from api.utils import DateHelper
+from api.utils import materialized_view_month_start
 from koku.database import execute_delete_sql as exec_del_sql
 from masu.config import Config
 from masu.database.koku_database_access import KokuDBAccess
@@ -26,6 +39,227 @@ from reporting_common import REPORT_COLUMN_MAP
 
 LOG = logging.getLogger(__name__)
 
+# Trino rows staged for COPY are kept in memory up to this size before spilling to disk.
+TRINO_COPY_SPOOL_SIZE = 64 * 1024 * 1024
+TRINO_COPY_FETCH_SIZE = 10000
+
+# Field types whose text form never contains characters COPY needs escaped.
+COPY_UNESCAPED_FIELD_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "BigIntegerField",
+    "DateField",
+    "DateTimeField",
+    "DecimalField",
+    "FloatField",
+    "IntegerField",
+    "PositiveIntegerField",
+    "SmallIntegerField",
+    "UUIDField",
+}
+
+
+def _escape_copy_text(text):
+    """Escape the characters the COPY text format treats specially."""
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def encode_copy_text(value):
+    """Encode a value for the COPY text format, treating empty strings as NULL like the CSV path does."""
+    if value is None or value == "":
+        return "\\N"
+    return _escape_copy_text(str(value))
+
+
+def encode_copy_unescaped(value):
+    """Encode a numeric or date value for the COPY text format."""
+    if value is None or value == "":
+        return "\\N"
+    return str(value)
+
+
+def encode_copy_boolean(value):
+    """Encode a boolean value for the COPY text format."""
+    if value is None or value == "":
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return encode_copy_text(value)
+
+
+def _encode_array_element(value):
+    """Encode an array element as a quoted Postgres array literal element."""
+    if value is None:
+        return "NULL"
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{value}"'
+
+
+def encode_copy_trino(value):
+    """Encode a value returned by the Trino client for the COPY text format.
+
+    Unlike encode_copy_text, an empty string is kept as an empty string. Maps are
+    written as JSON and arrays as Postgres array literals.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    elif isinstance(value, list):
+        value = "{" + ",".join(_encode_array_element(element) for element in value) + "}"
+    return _escape_copy_text(str(value))
+
+
+def get_copy_encoder(field_type):
+    """Return the COPY text encoder for a Django internal field type."""
+    if field_type in COPY_UNESCAPED_FIELD_TYPES:
+        return encode_copy_unescaped
+    if field_type == "BooleanField":
+        return encode_copy_boolean
+    return encode_copy_text
+
+
+class CopyRowStream:
+    """A file-like object that encodes rows for COPY ... FROM STDIN as they are read.
+
+    Only the rows needed to fill each read are encoded, so a batch is never
+    held as one large text buffer.
+    """
+
+    def __init__(self, rows, encoders):
+        """Initialize the stream.
+
+        Args:
+            rows (iterable): Tuples of values in column order
+            encoders (list): One encoder function per column
+
+        """
+        self._lines = ("\t".join(encode(value) for encode, value in zip(encoders, row)) + "\n" for row in rows)
+        self._buffer = ""
+
+    def read(self, size=-1):
+        """Return up to size characters of encoded rows."""
+        if size is None or size < 0:
+            data = self._buffer + "".join(self._lines)
+            self._buffer = ""
+            return data
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            if length >= size:
+                break
+        data = "".join(chunks)
+        self._buffer = data[size:]
+        return data[:size]
+
+    def readline(self, size=-1):
+        """Return the next encoded row."""
+        if "\n" not in self._buffer:
+            self._buffer += next(self._lines, "")
+        line, newline, self._buffer = self._buffer.partition("\n")
+        return line + newline
+
+
+def _as_date(value):
+    """Return a date for a date, datetime or ISO date string."""
+    if isinstance(value, str):
+        value = ciso8601.parse_datetime(value)
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return value
+
+
+class PartitionRegistry:
+    """Process-wide record of the monthly range partitions known to exist.
+
+    Keys are (schema, partitioned table, partition start) tuples. The partitions
+    of a table are loaded from the PartitionedTable catalog once, and every known
+    partition, loaded or added, is kept for PARTITION_REGISTRY_TTL seconds, so
+    partitions dropped outside of this process are eventually noticed.
+    """
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._partitions = {}
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def is_loaded(self, schema_name, table_name):
+        """Return whether the partitions of a table were loaded within the TTL."""
+        with self._lock:
+            expires = self._loaded.get((schema_name, table_name))
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                self._forget(schema_name, table_name)
+                return False
+            return True
+
+    def load(self, schema_name, table_name, partition_starts):
+        """Record every existing partition of a table."""
+        with self._lock:
+            self._forget(schema_name, table_name)
+            expires = time.monotonic() + settings.PARTITION_REGISTRY_TTL
+            for start in partition_starts:
+                self._partitions[(schema_name, table_name, _as_date(start))] = expires
+            self._loaded[(schema_name, table_name)] = expires
+
+    def add(self, schema_name, table_name, partition_start):
+        """Record that a partition exists."""
+        with self._lock:
+            expires = time.monotonic() + settings.PARTITION_REGISTRY_TTL
+            self._partitions[(schema_name, table_name, _as_date(partition_start))] = expires
+
+    def exists(self, schema_name, table_name, partition_start):
+        """Return whether a partition is known to exist within the TTL."""
+        with self._lock:
+            return self._is_known((schema_name, table_name, _as_date(partition_start)), time.monotonic())
+
+    def missing(self, schema_name, table_name, partition_starts):
+        """Return the partition starts that are not known to exist within the TTL."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                start
+                for start in map(_as_date, partition_starts)
+                if not self._is_known((schema_name, table_name, start), now)
+            }
+
+    def invalidate(self, schema_name=None):
+        """Forget every partition, or only those of a schema."""
+        with self._lock:
+            if schema_name is None:
+                self._partitions.clear()
+                self._loaded.clear()
+                return
+            for key in [key for key in self._loaded if key[0] == schema_name]:
+                self._forget(*key)
+            self._partitions = {key: expires for key, expires in self._partitions.items() if key[0] != schema_name}
+
+    def _is_known(self, key, now):
+        """Return whether a partition is known and unexpired, the lock must be held."""
+        expires = self._partitions.get(key)
+        if expires is None:
+            return False
+        if expires < now:
+            del self._partitions[key]
+            return False
+        return True
+
+    def _forget(self, schema_name, table_name):
+        """Drop the partitions of a table, the lock must be held."""
+        self._loaded.pop((schema_name, table_name), None)
+        self._partitions = {
+            key: expires for key, expires in self._partitions.items() if key[:2] != (schema_name, table_name)
+        }
+
+
+PARTITION_REGISTRY = PartitionRegistry()
+
 
 class ReportDBAccessorException(Exception):
     """An error in the DB accessor."""
@@ -141,21 +375,118 @@ class ReportDBAccessorBase(KokuDBAccess):
             delete_sql = f"DELETE FROM {temp_table_name}"
             cursor.execute(delete_sql)
 
-    def bulk_insert_rows(self, file_obj, table, columns, sep=","):
-        """Insert many rows using Postgres copy functionality.
+    def bulk_insert_row_values(self, rows, table, columns, column_types=None):
+        """Insert many rows using Postgres copy functionality without a CSV buffer.
+
+        Rows are encoded in the COPY text format while Postgres reads them.
 
         Args:
-            file_obj (file): A file-like object containing CSV rows
+            rows (iterable): Tuples of values in the order of columns
             table (str): The table name in the databse to copy to
-            columns (list): A list of columns in the order of the CSV file
-            sep (str): The separator in the file. Default: ','
+            columns (list): A list of column names
+            column_types (dict): Django internal field types keyed on column name,
+                as in ReportSchema.column_types. Columns not listed are escaped as text.
 
         """
+        column_types = column_types or {}
+        encoders = [get_copy_encoder(column_types.get(column)) for column in columns]
         columns = ", ".join(columns)
         with connection.cursor() as cursor:
             cursor.db.set_schema(self.schema)
-            statement = f"COPY {table} ({columns}) FROM STDIN WITH CSV DELIMITER '{sep}'"
-            cursor.copy_expert(statement, file_obj)
+            statement = f"COPY {table} ({columns}) FROM STDIN"
+            cursor.copy_expert(statement, CopyRowStream(rows, encoders))
+
+    def bulk_upsert_rows(self, table, rows, conflict_columns=None, match_columns=None, update_columns=None):
+        """Insert many rows with COPY and one INSERT ... ON CONFLICT, returning their ids.
+
+        The rows are copied into a temporary table and inserted in a single
+        statement. Rows that already exist are left alone, or have their
+        update_columns overwritten, and the id of the new or existing row is
+        returned for every input row.
+
+        Args:
+            table (DjangoModel): The table to insert into
+            rows (list): A list of dictionaries of data to insert
+            conflict_columns (list): The unique columns to check conflict on
+            match_columns (list): The columns that find an existing row. Default: conflict_columns
+            update_columns (list): Columns to update on conflict. Default: do nothing
+
+        Returns:
+            (list): The row ids, in the order of rows
+
+        """
+        if not rows:
+            return []
+        table_name = table._meta.db_table
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        match_columns = match_columns or conflict_columns or columns
+        temp_table_name = f"{table_name}_{str(uuid.uuid4()).replace('-', '_')}"
+        column_str = ", ".join(columns)
+
+        file_obj = io.StringIO()
+        writer = csv.writer(file_obj, delimiter=",", quoting=csv.QUOTE_MINIMAL, quotechar='"')
+        for row_index, row in enumerate(rows):
+            row = self.clean_data(dict(row), table_name)
+            writer.writerow([row.get(column) for column in columns] + [row_index])
+        file_obj.seek(0)
+
+        if update_columns:
+            set_clause = ", ".join(f"{column} = excluded.{column}" for column in update_columns)
+            conflict_sql = f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {set_clause}"
+        elif conflict_columns:
+            conflict_sql = f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+        else:
+            conflict_sql = "ON CONFLICT DO NOTHING"
+        inserted_match = " AND ".join(f"i.{column} IS NOT DISTINCT FROM t.{column}" for column in match_columns)
+        # Rows with a NULL key never conflict, so they are always found in inserted and
+        # the existing rows can be matched with plain equality that uses the table's index.
+        existing_match = " AND ".join(f"e.{column} = t.{column}" for column in match_columns)
+        upsert_sql = f"""
+            WITH inserted AS (
+                INSERT INTO {table_name} ({column_str})
+                    SELECT {column_str} FROM {temp_table_name} ORDER BY row_index
+                {conflict_sql}
+                RETURNING id, {", ".join(match_columns)}
+            )
+            SELECT DISTINCT ON (t.row_index) t.row_index, coalesce(i.id, e.id)
+              FROM {temp_table_name} AS t
+              LEFT JOIN inserted AS i ON {inserted_match}
+              LEFT JOIN {table_name} AS e ON {existing_match}
+             ORDER BY t.row_index, i.id, e.id
+        """
+        # A row committed by another worker after the upsert's snapshot was taken conflicts, so it is
+        # not in inserted, and is not visible to the join either. A new statement sees it.
+        lookup_sql = f"""
+            SELECT DISTINCT ON (t.row_index) t.row_index, e.id
+              FROM {temp_table_name} AS t
+              JOIN {table_name} AS e ON {existing_match}
+             WHERE t.row_index = ANY(%s)
+             ORDER BY t.row_index, e.id
+        """
+
+        with connection.cursor() as cursor:
+            cursor.db.set_schema(self.schema)
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {temp_table_name} AS SELECT {column_str} FROM {table_name} WITH NO DATA"
+            )
+            cursor.execute(f"ALTER TABLE {temp_table_name} ADD COLUMN row_index integer")
+            cursor.copy_expert(
+                f"COPY {temp_table_name} ({column_str}, row_index) FROM STDIN WITH CSV DELIMITER ','", file_obj
+            )
+            cursor.execute(upsert_sql)
+            ids = dict(cursor.fetchall())
+            missing = [row_index for row_index, row_id in ids.items() if row_id is None]
+            if missing:
+                cursor.execute(lookup_sql, [missing])
+                ids.update(cursor.fetchall())
+            cursor.execute(f"DROP TABLE {temp_table_name}")
+
+        missing = [row_index for row_index, row_id in ids.items() if row_id is None]
+        if missing:
+            raise ReportDBAccessorException(
+                f"Could not find the ids of {len(missing)} rows upserted into {table_name}."
+            )
+        return [ids[row_index] for row_index in range(len(rows))]
 
     def _get_db_obj_query(self, table, columns=None):
         """Return a query on a specific database table.
@@ -363,6 +694,35 @@ class ReportDBAccessorBase(KokuDBAccess):
         presto_conn = kpdb.connect(schema=self.schema)
         return kpdb.executescript(presto_conn, sql, params=bind_params, preprocessor=preprocessor)
 
+    def _execute_presto_insert_with_copy(self, sql):
+        """Run a Trino INSERT INTO postgres... statement by staging its rows and loading them with COPY.
+
+        Trino only runs the query. Its rows are staged in a local spooled file and copied into
+        the Postgres table in one COPY after Trino finishes, instead of being written in row
+        batches by the Trino Postgres connector. Other statements are run in Trino as is.
+
+        Returns:
+            (int) The number of rows copied
+
+        """
+        insert = kpdb.split_postgres_insert(sql)
+        if insert is None:
+            return self._execute_presto_raw_sql_query(self.schema, sql)
+        schema, table, columns, query = insert
+
+        presto_cur = kpdb.connect(schema=self.schema).cursor()
+        presto_cur.execute(query)
+        row_count = 0
+        with tempfile.SpooledTemporaryFile(max_size=TRINO_COPY_SPOOL_SIZE, mode="w+") as staging:
+            for rows in iter(lambda: presto_cur.fetchmany(TRINO_COPY_FETCH_SIZE), []):
+                staging.writelines("\t".join(encode_copy_trino(value) for value in row) + "\n" for row in rows)
+                row_count += len(rows)
+            staging.seek(0)
+            with connection.cursor() as cursor:
+                cursor.copy_expert(f"COPY {schema}.{table} ({', '.join(columns)}) FROM STDIN", staging)
+        LOG.info(f"Copied {row_count} rows from Trino into {schema}.{table}")
+        return row_count
+
     def get_existing_partitions(self, table):
         if isinstance(table, str):
             table_name = table
@@ -387,6 +747,25 @@ class ReportDBAccessorBase(KokuDBAccess):
 
         return exist_partition_start_dates
 
+    def ensure_partitions(self, table, requested_partition_start_dates):
+        """Create the monthly partitions of a table that are not known to exist.
+
+        The catalog is only read the first time a table is seen within
+        PARTITION_REGISTRY_TTL or when a requested month is not known to
+        exist, so batches for months that are already partitioned run no
+        queries.
+        """
+        table_name = table if isinstance(table, str) else table._meta.db_table
+        months = {r.replace(day=1) for r in requested_partition_start_dates}
+        if PARTITION_REGISTRY.is_loaded(self.schema, table_name) and not PARTITION_REGISTRY.missing(
+            self.schema, table_name, months
+        ):
+            return
+
+        existing_partitions = list(self.get_existing_partitions(table_name))
+        PARTITION_REGISTRY.load(self.schema, table_name, self.get_partition_start_dates(existing_partitions))
+        self.add_partitions(existing_partitions, months)
+
     def add_partitions(self, existing_partitions, requested_partition_start_dates):
         tmplpart = existing_partitions[0]
         for needed_partition in {
@@ -409,6 +788,7 @@ class ReportDBAccessorBase(KokuDBAccess):
                 active=True,
             )
             self.add_partition(**newpart_vals)
+            PARTITION_REGISTRY.add(self.schema, tmplpart.partition_of_table_name, needed_partition)
 
     def add_partition(self, **partition_record):
         with transaction.atomic():
@@ -421,6 +801,62 @@ class ReportDBAccessorBase(KokuDBAccess):
         if created:
             LOG.info(f"Created a new partition for {newpart.partition_of_table_name} : {newpart.table_name}")
 
+    def populate_ui_summary_tables(self, tables, start_date=None, end_date=None, source_uuid=None):
+        """Rebuild the rows of partitioned UI summary tables for a source and date range.
+
+        Rows in the range are deleted and re-aggregated from the daily summary table and
+        rows that have aged out of the UI summary window are dropped, so only the affected
+        source and days are recomputed. Without a source_uuid every source is rebuilt.
+
+        Args:
+            tables (list): Summary table models, each with a sql/<db_table>.sql script
+            start_date (date|str): First day to rebuild, defaults to the start of the window
+            end_date (date|str): Last day to rebuild, defaults to today
+            source_uuid (str): The source to rebuild, or None for every source
+
+        """
+        dh = DateHelper()
+        window_start = materialized_view_month_start(dh).date()
+        start_date = max(_as_date(start_date) or window_start, window_start)
+        end_date = _as_date(end_date) or dh.today.date()
+        months = [month.date() for month in rrule(MONTHLY, dtstart=start_date.replace(day=1), until=end_date)]
+        for table in tables:
+            table_name = table._meta.db_table
+            if months:
+                self.ensure_partitions(table_name, months)
+            summary_sql = pkgutil.get_data("masu.database", f"sql/{table_name}.sql")
+            summary_sql = summary_sql.decode("utf-8")
+            summary_sql_params = {
+                "schema": self.schema,
+                "start_date": start_date,
+                "end_date": end_date,
+                "window_start": window_start,
+                "source_uuid": str(source_uuid) if source_uuid else None,
+            }
+            summary_sql, summary_sql_params = JinjaSql().prepare_query(summary_sql, summary_sql_params)
+            self._execute_raw_sql_query(
+                table_name, summary_sql, start_date, end_date, bind_params=list(summary_sql_params)
+            )
+
+    def populate_dimension_tables(self, tables, source_uuid=None):
+        """Rebuild the resource type dimension tables for a source.
+
+        Each table keeps the distinct values of one dimension per source, read from the
+        UI summary tables, so resource type lookups never scan days of summary rows.
+
+        Args:
+            tables (list): Dimension table models, each with a sql/<db_table>.sql script
+            source_uuid (str): The source to rebuild, or None for every source
+
+        """
+        for table in tables:
+            table_name = table._meta.db_table
+            dimension_sql = pkgutil.get_data("masu.database", f"sql/{table_name}.sql")
+            dimension_sql = dimension_sql.decode("utf-8")
+            dimension_sql_params = {"schema": self.schema, "source_uuid": str(source_uuid) if source_uuid else None}
+            dimension_sql, dimension_sql_params = JinjaSql().prepare_query(dimension_sql, dimension_sql_params)
+            self._execute_raw_sql_query(table_name, dimension_sql, bind_params=list(dimension_sql_params))
+
     def delete_line_item_daily_summary_entries_for_date_range(self, source_uuid, start_date, end_date):
         msg = f"Deleting records from {self.line_item_daily_summary_table} from {start_date} to {end_date}"
         LOG.info(msg)
@@ -85,6 +85,27 @@ class ReportManifestDBAccessor(KokuDBAccess):
             manifest_id=manifest_id, last_completed_datetime__isnull=False
         ).count()
 
+    def set_usage_days(self, manifest_id, report_name, usage_days):
+        """Record the days of usage in a manifest's report file."""
+        CostUsageReportStatus.objects.filter(manifest_id=manifest_id, report_name=report_name).update(
+            usage_days=usage_days
+        )
+
+    def get_usage_days(self, manifest_id):
+        """Return the sorted days of usage in a manifest's report files.
+
+        Returns None when the manifest has no report files or the days of any file were not recorded.
+
+        """
+        usage_days = set()
+        for file_days in CostUsageReportStatus.objects.filter(manifest_id=manifest_id).values_list(
+            "usage_days", flat=True
+        ):
+            if not file_days:
+                return None
+            usage_days.update(file_days)
+        return sorted(usage_days) or None
+
     def is_last_completed_datetime_null(self, manifest_id):
         """Determine if nulls exist in last_completed_datetime for manifest_id.
 
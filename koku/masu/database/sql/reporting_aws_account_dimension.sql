@@ -0,0 +1,18 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_account_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_account_dimension (
+    source_uuid,
+    usage_account_id,
+    account_alias_id
+)
+SELECT DISTINCT source_uuid, usage_account_id, account_alias_id
+  FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_account
+ WHERE usage_account_id IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
@@ -0,0 +1,90 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_compute_summary_by_account
+WHERE (
+        usage_start < {{window_start}}
+        OR (usage_start >= {{start_date}} AND usage_start <= {{end_date}})
+    )
+{%- if source_uuid %}
+    AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_compute_summary_by_account (
+    usage_start,
+    usage_end,
+    usage_account_id,
+    account_alias_id,
+    organizational_unit_id,
+    instance_type,
+    resource_ids,
+    resource_count,
+    usage_amount,
+    unit,
+    unblended_cost,
+    markup_cost,
+    currency_code,
+    source_uuid
+)
+SELECT c.usage_start,
+    c.usage_start as usage_end,
+    c.usage_account_id,
+    c.account_alias_id,
+    c.organizational_unit_id,
+    c.instance_type,
+    r.resource_ids,
+    cardinality(r.resource_ids) as resource_count,
+    c.usage_amount,
+    c.unit,
+    c.unblended_cost,
+    c.markup_cost,
+    c.currency_code,
+    c.source_uuid
+FROM (
+    -- this group by gets the counts
+    SELECT usage_start,
+        usage_account_id,
+        max(account_alias_id) as account_alias_id,
+        max(organizational_unit_id) as organizational_unit_id,
+        instance_type,
+        sum(usage_amount) as usage_amount,
+        max(unit) as unit,
+        sum(unblended_cost) as unblended_cost,
+        sum(markup_cost) as markup_cost,
+        max(currency_code) as currency_code,
+        source_uuid
+    FROM {{schema | sqlsafe}}.reporting_awscostentrylineitem_daily_summary
+    WHERE usage_start >= {{start_date}}
+        AND usage_start <= {{end_date}}
+        AND instance_type IS NOT NULL
+    {%- if source_uuid %}
+        AND source_uuid = {{source_uuid}}
+    {%- endif %}
+    GROUP BY usage_start, usage_account_id, instance_type, source_uuid
+) AS c
+JOIN (
+    -- this group by gets the distinct resources running by day
+    SELECT usage_start,
+        usage_account_id,
+        instance_type,
+        source_uuid,
+        array_agg(DISTINCT resource_id ORDER BY resource_id) as resource_ids
+    FROM (
+        SELECT usage_start,
+            usage_account_id,
+            instance_type,
+            source_uuid,
+            unnest(resource_ids) as resource_id
+        FROM {{schema | sqlsafe}}.reporting_awscostentrylineitem_daily_summary
+        WHERE usage_start >= {{start_date}}
+            AND usage_start <= {{end_date}}
+            AND instance_type IS NOT NULL
+        {%- if source_uuid %}
+            AND source_uuid = {{source_uuid}}
+        {%- endif %}
+    ) AS x
+    GROUP BY usage_start, usage_account_id, instance_type, source_uuid
+) AS r
+    ON c.usage_start = r.usage_start
+        AND c.usage_account_id = r.usage_account_id
+        AND c.instance_type = r.instance_type
+        AND c.source_uuid = r.source_uuid
+;
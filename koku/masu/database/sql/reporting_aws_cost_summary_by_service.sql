@@ -0,0 +1,42 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_service
+WHERE (
+        usage_start < {{window_start}}
+        OR (usage_start >= {{start_date}} AND usage_start <= {{end_date}})
+    )
+{%- if source_uuid %}
+    AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_cost_summary_by_service (
+    usage_start,
+    usage_end,
+    usage_account_id,
+    account_alias_id,
+    organizational_unit_id,
+    product_code,
+    product_family,
+    unblended_cost,
+    markup_cost,
+    currency_code,
+    source_uuid
+)
+SELECT usage_start,
+    usage_start as usage_end,
+    usage_account_id,
+    max(account_alias_id) as account_alias_id,
+    max(organizational_unit_id) as organizational_unit_id,
+    product_code,
+    product_family,
+    sum(unblended_cost) as unblended_cost,
+    sum(markup_cost) as markup_cost,
+    max(currency_code) as currency_code,
+    source_uuid
+FROM {{schema | sqlsafe}}.reporting_awscostentrylineitem_daily_summary
+WHERE usage_start >= {{start_date}}
+    AND usage_start <= {{end_date}}
+{%- if source_uuid %}
+    AND source_uuid = {{source_uuid}}
+{%- endif %}
+GROUP BY usage_start, usage_account_id, product_code, product_family, source_uuid
+;
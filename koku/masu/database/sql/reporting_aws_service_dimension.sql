@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_aws_service_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_aws_service_dimension (
+    source_uuid,
+    usage_account_id,
+    product_code
+)
+SELECT DISTINCT source_uuid, usage_account_id, product_code
+  FROM {{schema | sqlsafe}}.reporting_aws_cost_summary_by_service
+ WHERE usage_account_id IS NOT NULL
+   AND product_code IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
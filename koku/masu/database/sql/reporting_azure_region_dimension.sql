@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_azure_region_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_azure_region_dimension (
+    source_uuid,
+    subscription_guid,
+    resource_location
+)
+SELECT DISTINCT source_uuid, subscription_guid, resource_location
+  FROM {{schema | sqlsafe}}.reporting_azure_cost_summary_by_location
+ WHERE subscription_guid IS NOT NULL
+   AND resource_location IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_azure_service_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_azure_service_dimension (
+    source_uuid,
+    subscription_guid,
+    service_name
+)
+SELECT DISTINCT source_uuid, subscription_guid, service_name
+  FROM {{schema | sqlsafe}}.reporting_azure_cost_summary_by_service
+ WHERE subscription_guid IS NOT NULL
+   AND service_name IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
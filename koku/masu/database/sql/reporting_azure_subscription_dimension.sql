@@ -0,0 +1,17 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_azure_subscription_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_azure_subscription_dimension (
+    source_uuid,
+    subscription_guid
+)
+SELECT DISTINCT source_uuid, subscription_guid
+  FROM {{schema | sqlsafe}}.reporting_azure_cost_summary_by_account
+ WHERE subscription_guid IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
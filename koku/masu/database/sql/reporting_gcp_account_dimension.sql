@@ -0,0 +1,17 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_gcp_account_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_gcp_account_dimension (
+    source_uuid,
+    account_id
+)
+SELECT DISTINCT source_uuid, account_id
+  FROM {{schema | sqlsafe}}.reporting_gcp_cost_summary_by_account
+ WHERE account_id IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
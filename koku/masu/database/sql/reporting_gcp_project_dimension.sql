@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_gcp_project_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_gcp_project_dimension (
+    source_uuid,
+    account_id,
+    project_id
+)
+SELECT DISTINCT source_uuid, account_id, project_id
+  FROM {{schema | sqlsafe}}.reporting_gcp_cost_summary_by_project
+ WHERE account_id IS NOT NULL
+   AND project_id IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_gcp_region_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_gcp_region_dimension (
+    source_uuid,
+    account_id,
+    region
+)
+SELECT DISTINCT source_uuid, account_id, region
+  FROM {{schema | sqlsafe}}.reporting_gcp_cost_summary_by_region
+ WHERE account_id IS NOT NULL
+   AND region IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
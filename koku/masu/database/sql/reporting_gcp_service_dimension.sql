@@ -0,0 +1,20 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_gcp_service_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_gcp_service_dimension (
+    source_uuid,
+    account_id,
+    service_id,
+    service_alias
+)
+SELECT DISTINCT source_uuid, account_id, service_id, service_alias
+  FROM {{schema | sqlsafe}}.reporting_gcp_cost_summary_by_service
+ WHERE account_id IS NOT NULL
+   AND service_id IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
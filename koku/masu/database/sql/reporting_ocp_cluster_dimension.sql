@@ -0,0 +1,18 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_cluster_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_ocp_cluster_dimension (
+    source_uuid,
+    cluster_id,
+    cluster_alias
+)
+SELECT DISTINCT source_uuid, cluster_id, cluster_alias
+  FROM {{schema | sqlsafe}}.reporting_ocp_cost_summary
+ WHERE cluster_id IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
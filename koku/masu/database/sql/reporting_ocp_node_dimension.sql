@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_node_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_ocp_node_dimension (
+    source_uuid,
+    cluster_id,
+    node
+)
+SELECT DISTINCT source_uuid, cluster_id, node
+  FROM {{schema | sqlsafe}}.reporting_ocp_cost_summary_by_node
+ WHERE cluster_id IS NOT NULL
+   AND node IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
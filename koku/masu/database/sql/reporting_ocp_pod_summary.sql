@@ -0,0 +1,81 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_pod_summary
+WHERE (
+        usage_start < {{window_start}}
+        OR (usage_start >= {{start_date}} AND usage_start <= {{end_date}})
+    )
+{%- if source_uuid %}
+    AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_ocp_pod_summary (
+    usage_start,
+    usage_end,
+    cluster_id,
+    cluster_alias,
+    data_source,
+    resource_ids,
+    resource_count,
+    supplementary_usage_cost,
+    infrastructure_usage_cost,
+    infrastructure_raw_cost,
+    infrastructure_markup_cost,
+    pod_usage_cpu_core_hours,
+    pod_request_cpu_core_hours,
+    pod_limit_cpu_core_hours,
+    cluster_capacity_cpu_core_hours,
+    pod_usage_memory_gigabyte_hours,
+    pod_request_memory_gigabyte_hours,
+    pod_limit_memory_gigabyte_hours,
+    cluster_capacity_memory_gigabyte_hours,
+    supplementary_monthly_cost_json,
+    infrastructure_monthly_cost_json,
+    source_uuid
+)
+SELECT usage_start as usage_start,
+    usage_start as usage_end,
+    cluster_id,
+    cluster_alias,
+    max(data_source) as data_source,
+    array_agg(DISTINCT resource_id) as resource_ids,
+    count(DISTINCT resource_id) as resource_count,
+    json_build_object(
+        'cpu', sum((supplementary_usage_cost->>'cpu')::decimal),
+        'memory', sum((supplementary_usage_cost->>'memory')::decimal),
+        'storage', sum((supplementary_usage_cost->>'storage')::decimal)
+    ) as supplementary_usage_cost,
+    json_build_object(
+        'cpu', sum((infrastructure_usage_cost->>'cpu')::decimal),
+        'memory', sum((infrastructure_usage_cost->>'memory')::decimal),
+        'storage', sum((infrastructure_usage_cost->>'storage')::decimal)
+    ) as infrastructure_usage_cost,
+    sum(infrastructure_raw_cost) as infrastructure_raw_cost,
+    sum(infrastructure_markup_cost) as infrastructure_markup_cost,
+    sum(pod_usage_cpu_core_hours) as pod_usage_cpu_core_hours,
+    sum(pod_request_cpu_core_hours) as pod_request_cpu_core_hours,
+    sum(pod_limit_cpu_core_hours) as pod_limit_cpu_core_hours,
+    max(cluster_capacity_cpu_core_hours) as cluster_capacity_cpu_core_hours,
+    sum(pod_usage_memory_gigabyte_hours) as pod_usage_memory_gigabyte_hours,
+    sum(pod_request_memory_gigabyte_hours) as pod_request_memory_gigabyte_hours,
+    sum(pod_limit_memory_gigabyte_hours) as pod_limit_memory_gigabyte_hours,
+    max(cluster_capacity_memory_gigabyte_hours) as cluster_capacity_memory_gigabyte_hours,
+    json_build_object(
+        'cpu', sum(((coalesce(supplementary_monthly_cost_json, '{"cpu": 0}'::jsonb))->>'cpu')::decimal),
+        'memory', sum(((coalesce(supplementary_monthly_cost_json, '{"memory": 0}'::jsonb))->>'memory')::decimal),
+        'pvc', sum(((coalesce(supplementary_monthly_cost_json, '{"pvc": 0}'::jsonb))->>'pvc')::decimal)
+    ) as supplementary_monthly_cost_json,
+    json_build_object(
+        'cpu', sum(((coalesce(infrastructure_monthly_cost_json, '{"cpu": 0}'::jsonb))->>'cpu')::decimal),
+        'memory', sum(((coalesce(infrastructure_monthly_cost_json, '{"memory": 0}'::jsonb))->>'memory')::decimal),
+        'pvc', sum(((coalesce(infrastructure_monthly_cost_json, '{"pvc": 0}'::jsonb))->>'pvc')::decimal)
+    ) as infrastructure_monthly_cost_json,
+    source_uuid
+FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary
+WHERE usage_start >= {{start_date}}
+    AND usage_start <= {{end_date}}
+    AND data_source = 'Pod'
+{%- if source_uuid %}
+    AND source_uuid = {{source_uuid}}
+{%- endif %}
+GROUP BY usage_start, cluster_id, cluster_alias, source_uuid
+;
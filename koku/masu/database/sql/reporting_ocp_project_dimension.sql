@@ -0,0 +1,19 @@
+DELETE FROM {{schema | sqlsafe}}.reporting_ocp_project_dimension
+{%- if source_uuid %}
+WHERE source_uuid = {{source_uuid}}
+{%- endif %}
+;
+
+INSERT INTO {{schema | sqlsafe}}.reporting_ocp_project_dimension (
+    source_uuid,
+    cluster_id,
+    namespace
+)
+SELECT DISTINCT source_uuid, cluster_id, namespace
+  FROM {{schema | sqlsafe}}.reporting_ocp_cost_summary_by_project
+ WHERE cluster_id IS NOT NULL
+   AND namespace IS NOT NULL
+{%- if source_uuid %}
+   AND source_uuid = {{source_uuid}}
+{%- endif %}
+;
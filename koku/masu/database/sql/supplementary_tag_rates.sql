@@ -1,31 +1,58 @@
+WITH tag_rates (metric, usage_type, labels_field, tag, rate) AS (
+    VALUES
+    {%- for tag_rate in tag_rates %}
+    (
+        {{tag_rate.metric}},
+        {{tag_rate.usage_type}},
+        {{tag_rate.labels_field}},
+        {{tag_rate.tag}}::jsonb,
+        {{tag_rate.rate}}::numeric
+    ){% if not loop.last %},{% endif %}
+    {%- endfor %}
+),
+tag_costs AS (
+    SELECT lids.uuid,
+        tr.usage_type,
+        sum(
+            coalesce(
+                tr.rate * CASE
+                WHEN tr.metric = 'cpu_core_usage_per_hour' THEN lids.pod_usage_cpu_core_hours
+                WHEN tr.metric = 'cpu_core_request_per_hour' THEN lids.pod_request_cpu_core_hours
+                WHEN tr.metric = 'memory_gb_usage_per_hour' THEN lids.pod_usage_memory_gigabyte_hours
+                WHEN tr.metric = 'memory_gb_request_per_hour' THEN lids.pod_request_memory_gigabyte_hours
+                WHEN tr.metric = 'storage_gb_usage_per_month' THEN lids.persistentvolumeclaim_usage_gigabyte_months
+                WHEN tr.metric = 'storage_gb_request_per_month' THEN lids.volume_request_storage_gigabyte_months
+                END,
+                0.0
+            )
+        ) as cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    JOIN tag_rates AS tr
+        ON (tr.labels_field = 'pod_labels' AND lids.pod_labels @> tr.tag)
+            OR (tr.labels_field = 'volume_labels' AND lids.volume_labels @> tr.tag)
+    WHERE lids.cluster_id = {{cluster_id}}
+        AND lids.usage_start >= {{start_date}}
+        AND lids.usage_start <= {{end_date}}
+    GROUP BY lids.uuid, tr.usage_type
+),
+usage_costs AS (
+    SELECT lids.uuid,
+        jsonb_object_agg(
+            cost.key,
+            cost.value::numeric + coalesce(tc.cost, 0.0)
+        ) as supplementary_usage_cost
+    FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
+    CROSS JOIN LATERAL jsonb_each_text(lids.supplementary_usage_cost) AS cost
+    LEFT JOIN tag_costs AS tc
+        ON tc.uuid = lids.uuid
+            AND tc.usage_type = cost.key
+    WHERE lids.cluster_id = {{cluster_id}}
+        AND lids.usage_start >= {{start_date}}
+        AND lids.usage_start <= {{end_date}}
+        AND lids.uuid IN (SELECT uuid FROM tag_costs)
+    GROUP BY lids.uuid
+)
 UPDATE {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids
-SET supplementary_usage_cost = other_sub.supplementary_usage_cost
-FROM (
-    SELECT sub.uuid,
-        jsonb_object_agg(key,
-            CASE
-            WHEN key = {{usage_type}} THEN value::numeric + coalesce(({{rate}}::numeric * usage), 0.0)
-            ELSE value::numeric
-            END) as supplementary_usage_cost
-    FROM (
-        SELECT lids.uuid,
-            key,
-            value,
-            CASE
-            WHEN {{metric}}='cpu_core_usage_per_hour' THEN lids.pod_usage_cpu_core_hours
-            WHEN {{metric}}='cpu_core_request_per_hour' THEN lids.pod_request_cpu_core_hours
-            WHEN {{metric}}='memory_gb_usage_per_hour' THEN lids.pod_usage_memory_gigabyte_hours
-            WHEN {{metric}}='memory_gb_request_per_hour' THEN lids.pod_request_memory_gigabyte_hours
-            WHEN {{metric}}='storage_gb_usage_per_month' THEN lids.persistentvolumeclaim_usage_gigabyte_months
-            WHEN {{metric}}='storage_gb_request_per_month' THEN lids.volume_request_storage_gigabyte_months
-            END as usage
-        FROM {{schema | sqlsafe}}.reporting_ocpusagelineitem_daily_summary AS lids,
-            jsonb_each_text(lids.supplementary_usage_cost) supplementary_usage_cost
-        WHERE lids.{{labels_field | sqlsafe}} @> {{k_v_pair}}
-            AND lids.cluster_id = {{cluster_id}}
-            AND lids.usage_start >= {{start_date}}
-            AND lids.usage_start <= {{end_date}}
-    ) AS sub
-    GROUP BY sub.uuid
-) other_sub
-WHERE lids.uuid = other_sub.uuid
+SET supplementary_usage_cost = usage_costs.supplementary_usage_cost
+FROM usage_costs
+WHERE lids.uuid = usage_costs.uuid
@@ -9,7 +9,6 @@ import hashlib
 import logging
 import os
 
-import pandas as pd
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
 from google.cloud import bigquery
@@ -29,6 +28,7 @@ from masu.processor import enable_trino_processing
 from masu.util.aws.common import copy_local_report_file_to_s3_bucket
 from masu.util.common import date_range_pair
 from masu.util.common import get_path_prefix
+from masu.util.common import split_csv_daily
 from providers.gcp.provider import GCPProvider
 
 DATA_DIR = Config.TMP_DIR
@@ -39,31 +39,12 @@ def divide_csv_daily(file_path):
     """
     Split local file into daily content.
     """
-    daily_files = []
-    directory = os.path.dirname(file_path)
-
     try:
-        data_frame = pd.read_csv(file_path)
+        return split_csv_daily(file_path, "usage_start_time", "{day}.csv")
     except Exception as error:
         LOG.error(f"File {file_path} could not be parsed. Reason: {str(error)}")
         raise error
 
-    unique_times = data_frame.usage_start_time.unique()
-    days = list({cur_dt[:10] for cur_dt in unique_times})
-    daily_data_frames = [
-        {"data_frame": data_frame[data_frame.usage_start_time.str.contains(cur_day)], "date": cur_day}
-        for cur_day in days
-    ]
-
-    for daily_data in daily_data_frames:
-        day = daily_data.get("date")
-        df = daily_data.get("data_frame")
-        day_file = f"{day}.csv"
-        day_filepath = f"{directory}/{day_file}"
-        df.to_csv(day_filepath, index=False, header=True)
-        daily_files.append({"filename": day_file, "filepath": day_filepath})
-    return daily_files
-
 
 def create_daily_archives(request_id, account, provider_uuid, filename, filepath, manifest_id, start_date, context={}):
     """
@@ -9,7 +9,6 @@ import logging
 import os
 import shutil
 
-import pandas as pd
 from django.conf import settings
 
 from api.common import log_json
@@ -21,7 +20,9 @@ from masu.external.downloader.downloader_interface import DownloaderInterface
 from masu.external.downloader.report_downloader_base import ReportDownloaderBase
 from masu.processor import enable_trino_processing
 from masu.util.aws.common import copy_local_report_file_to_s3_bucket
+from masu.util.common import get_csv_usage_days
 from masu.util.common import get_path_prefix
+from masu.util.common import split_csv_daily
 from masu.util.ocp import common as utils
 
 DATA_DIR = Config.TMP_DIR
@@ -34,32 +35,13 @@ def divide_csv_daily(file_path, filename):
     """
     Split local file into daily content.
     """
-    daily_files = []
-    directory = os.path.dirname(file_path)
-
+    report_type, _ = utils.detect_type(file_path)
     try:
-        data_frame = pd.read_csv(file_path)
+        return split_csv_daily(file_path, "interval_start", f"{report_type}.{{day}}.csv")
     except Exception as error:
         LOG.error(f"File {file_path} could not be parsed. Reason: {str(error)}")
         raise error
 
-    report_type, _ = utils.detect_type(file_path)
-    unique_times = data_frame.interval_start.unique()
-    days = list({cur_dt[:10] for cur_dt in unique_times})
-    daily_data_frames = [
-        {"data_frame": data_frame[data_frame.interval_start.str.contains(cur_day)], "date": cur_day}
-        for cur_day in days
-    ]
-
-    for daily_data in daily_data_frames:
-        day = daily_data.get("date")
-        df = daily_data.get("data_frame")
-        day_file = f"{report_type}.{day}.csv"
-        day_filepath = f"{directory}/{day_file}"
-        df.to_csv(day_filepath, index=False, header=True)
-        daily_files.append({"filename": day_file, "filepath": day_filepath})
-    return daily_files
-
 
 def create_daily_archives(request_id, account, provider_uuid, filename, filepath, manifest_id, start_date, context={}):
     """
@@ -80,8 +62,14 @@ def create_daily_archives(request_id, account, provider_uuid, filename, filepath
     if settings.ENABLE_S3_ARCHIVING or enable_trino_processing(provider_uuid, Provider.PROVIDER_OCP, account):
         if context.get("version"):
             daily_files = [{"filepath": filepath, "filename": filename}]
+            usage_days = get_csv_usage_days(filepath, "interval_start")
         else:
             daily_files = divide_csv_daily(filepath, filename)
+            usage_days = [daily_file.get("date") for daily_file in daily_files]
+        if usage_days and all(usage_days):
+            # Summarization only needs to cover the days this file changed
+            with ReportManifestDBAccessor() as manifest_accessor:
+                manifest_accessor.set_usage_days(manifest_id, filename, usage_days)
         for daily_file in daily_files:
             # Push to S3
             s3_csv_path = get_path_prefix(
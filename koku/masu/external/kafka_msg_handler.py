@@ -49,6 +49,7 @@ from masu.util.ocp import common as utils
 LOG = logging.getLogger(__name__)
 SUCCESS_CONFIRM_STATUS = "success"
 FAILURE_CONFIRM_STATUS = "failure"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class KafkaMsgHandlerError(Exception):
@@ -145,7 +146,7 @@ def download_payload(request_id, url, context={}):
 
     # Download file from quarantine bucket as tar.gz
     try:
-        download_response = requests.get(url)
+        download_response = requests.get(url, stream=True)
         download_response.raise_for_status()
     except requests.exceptions.HTTPError as err:
         shutil.rmtree(temp_dir)
@@ -157,21 +158,60 @@ def download_payload(request_id, url, context={}):
     gzip_filename = f"{sanitized_request_id}.tar.gz"
     temp_file = f"{temp_dir}/{gzip_filename}"
     try:
-        temp_file_hdl = open(temp_file, "wb")
-        temp_file_hdl.write(download_response.content)
-        temp_file_hdl.close()
-    except (OSError, IOError) as error:
+        with open(temp_file, "wb") as temp_file_hdl:
+            for chunk in download_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                temp_file_hdl.write(chunk)
+    except (OSError, IOError, requests.exceptions.RequestException) as error:
         shutil.rmtree(temp_dir)
         msg = f"Unable to write file. Error: {str(error)}"
         LOG.warning(log_json(request_id, msg, context))
         raise KafkaMsgHandlerError(msg)
+    finally:
+        download_response.close()
 
     return (temp_dir, temp_file, gzip_filename)
 
 
+def _safe_member_path(member):
+    """Return the normalized member name, or None when it would escape the extraction directory."""
+    name = os.path.normpath(member.name)
+    if os.path.isabs(name) or name.startswith(".."):
+        return None
+    return name
+
+
+def _iter_payload_files(request_id, tarball, context={}):
+    """
+    Yield the regular file members of a streamed payload with their normalized names.
+
+    Members that are not regular files or whose names would escape the
+    extraction directory are skipped. A member larger than
+    Config.PAYLOAD_MAX_MEMBER_SIZE fails the whole payload.
+    """
+    for member in tarball:
+        name = _safe_member_path(member)
+        if not member.isfile() or name is None:
+            continue
+        if member.size > Config.PAYLOAD_MAX_MEMBER_SIZE:
+            msg = f"Payload file {member.name} is {member.size} bytes, over the {Config.PAYLOAD_MAX_MEMBER_SIZE} limit."
+            LOG.warning(log_json(request_id, msg, context))
+            raise KafkaMsgHandlerError("Extraction failure, payload file too large.")
+        yield name, member
+
+
+def _write_member(tarball, member, destination_path):
+    """Stream a single tar member to destination_path."""
+    with tarball.extractfile(member) as source, open(destination_path, "wb") as destination:
+        shutil.copyfileobj(source, destination, DOWNLOAD_CHUNK_SIZE)
+
+
 def extract_payload_contents(request_id, out_dir, tarball_path, tarball, context={}):
     """
-    Extract the payload contents into a temporary location.
+    Extract the payload manifest into a temporary location.
+
+    Only the manifest is written here; the report files are streamed straight
+    to their final location by extract_report_files once the manifest has
+    been read.
 
         Args:
         request_id (String): Identifier associated with the payload
@@ -183,19 +223,22 @@ def extract_payload_contents(request_id, out_dir, tarball_path, tarball, context
         Returns:
             (String): path to manifest file
     """
-    # Extract tarball into temp directory
+    # Extract manifest into temp directory
 
     if not os.path.isfile(tarball_path):
         msg = f"Unable to find tar file {tarball_path}."
         LOG.warning(log_json(request_id, msg, context))
         raise KafkaMsgHandlerError("Extraction failure, file not found.")
 
+    manifest_path = []
     try:
-        mytar = TarFile.open(tarball_path, mode="r:gz")
-        mytar.extractall(path=out_dir)
-        files = mytar.getnames()
-        manifest_path = [manifest for manifest in files if "manifest.json" in manifest]
-    except (ReadError, EOFError, OSError) as error:
+        with TarFile.open(tarball_path, mode="r|gz") as mytar:
+            for name, member in _iter_payload_files(request_id, mytar, context):
+                if os.path.basename(name) == "manifest.json":
+                    os.makedirs(os.path.join(out_dir, os.path.dirname(name)), exist_ok=True)
+                    _write_member(mytar, member, os.path.join(out_dir, name))
+                    manifest_path.append(name)
+    except (ReadError, EOFError, OSError, KafkaMsgHandlerError) as error:
         msg = f"Unable to untar file {tarball_path}. Reason: {str(error)}"
         LOG.warning(log_json(request_id, msg, context))
         shutil.rmtree(out_dir)
@@ -209,6 +252,38 @@ def extract_payload_contents(request_id, out_dir, tarball_path, tarball, context
     return manifest_path
 
 
+def extract_report_files(request_id, tarball_path, manifest_path, report_files, destination_dir, context={}):
+    """
+    Stream the report files listed in the manifest directly into destination_dir.
+
+        Args:
+        request_id (String): Identifier associated with the payload
+        tarball_path (String): the path to the payload file to extract
+        manifest_path (String): the manifest member name within the payload
+        report_files ([String]): the report file names listed in the manifest
+        destination_dir (String): the directory the report files are written to
+        context (Dict): Context for logging (account, etc)
+
+        Returns:
+            (Set): the report file names that were extracted
+    """
+    manifest_dir = os.path.dirname(manifest_path)
+    wanted = {os.path.normpath(os.path.join(manifest_dir, report_file)): report_file for report_file in report_files}
+    extracted = set()
+    try:
+        with TarFile.open(tarball_path, mode="r|gz") as mytar:
+            for name, member in _iter_payload_files(request_id, mytar, context):
+                report_file = wanted.get(name)
+                if report_file:
+                    _write_member(mytar, member, f"{destination_dir}/{report_file}")
+                    extracted.add(report_file)
+    except (ReadError, EOFError, OSError) as error:
+        msg = f"Unable to untar file {tarball_path}. Reason: {str(error)}"
+        LOG.warning(log_json(request_id, msg, context))
+        raise KafkaMsgHandlerError("Extraction failure.")
+    return extracted
+
+
 def construct_parquet_reports(request_id, context, report_meta, payload_destination_path, report_file):
     """Build, upload and convert parquet reports."""
     daily_parquet_files = create_daily_archives(
@@ -305,35 +380,37 @@ def extract_payload(url, request_id, context={}):  # noqa: C901
     destination_dir = f"{Config.INSIGHTS_LOCAL_REPORT_DIR}/{report_meta.get('cluster_id')}/{usage_month}"
     os.makedirs(destination_dir, exist_ok=True)
 
-    # Copy manifest
+    # Move manifest
     manifest_destination_path = f"{destination_dir}/{os.path.basename(report_meta.get('manifest_path'))}"
-    shutil.copy(report_meta.get("manifest_path"), manifest_destination_path)
+    shutil.move(report_meta.get("manifest_path"), manifest_destination_path)
 
     # Save Manifest
     report_meta["manifest_id"] = create_manifest_entries(report_meta, request_id, context)
 
-    # Copy report payload
+    # Extract report payload
+    try:
+        extracted_files = extract_report_files(
+            request_id, temp_file_path, manifest_path[0], report_meta.get("files"), destination_dir, context
+        )
+    except KafkaMsgHandlerError:
+        shutil.rmtree(temp_dir)
+        raise
+
     report_metas = []
     for report_file in report_meta.get("files"):
         current_meta = report_meta.copy()
-        subdirectory = os.path.dirname(full_manifest_path)
-        payload_source_path = f"{subdirectory}/{report_file}"
         payload_destination_path = f"{destination_dir}/{report_file}"
-        try:
-            shutil.copy(payload_source_path, payload_destination_path)
-            current_meta["current_file"] = payload_destination_path
-            record_all_manifest_files(report_meta["manifest_id"], report_meta.get("files"))
-            if not record_report_status(report_meta["manifest_id"], report_file, request_id, context):
-                msg = f"Successfully extracted OCP for {report_meta.get('cluster_id')}/{usage_month}"
-                LOG.info(log_json(request_id, msg, context))
-                construct_parquet_reports(request_id, context, report_meta, payload_destination_path, report_file)
-                report_metas.append(current_meta)
-            else:
-                # Report already processed
-                pass
-        except FileNotFoundError:
+        if report_file not in extracted_files:
             msg = f"File {str(report_file)} has not downloaded yet."
             LOG.debug(log_json(request_id, msg, context))
+            continue
+        current_meta["current_file"] = payload_destination_path
+        record_all_manifest_files(report_meta["manifest_id"], report_meta.get("files"))
+        if not record_report_status(report_meta["manifest_id"], report_file, request_id, context):
+            msg = f"Successfully extracted OCP for {report_meta.get('cluster_id')}/{usage_month}"
+            LOG.info(log_json(request_id, msg, context))
+            construct_parquet_reports(request_id, context, report_meta, payload_destination_path, report_file)
+            report_metas.append(current_meta)
 
     # Remove temporary directory and files
     shutil.rmtree(temp_dir)
@@ -0,0 +1,63 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Benchmark collapsing AWS resourceTags/user: columns into JSON."""
+import json
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+
+from masu.util.aws.common import resource_tags_to_json
+from masu.util.aws.common import scrub_resource_col_name
+
+
+def legacy_resource_tags_to_json(tag_df):
+    """Collapse the tag columns with a row-wise apply, as aws_post_processor used to."""
+    resource_tags_dict = tag_df.apply(
+        lambda row: {scrub_resource_col_name(column): value for column, value in row.items() if value}, axis=1
+    )
+    resource_tags_dict.where(resource_tags_dict.notna(), lambda _: [{}], inplace=True)
+    return resource_tags_dict.apply(json.dumps)
+
+
+def synthetic_tag_frame(rows, tag_columns, fill_ratio):
+    """Return a wide frame of tag columns where roughly fill_ratio of the cells are set."""
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(tag_columns):
+        values = rng.choice([f"value{j}" for j in range(20)], rows).astype(object)
+        values[rng.random(rows) >= fill_ratio] = ""
+        data[f"resourceTags/user:key{i}"] = values
+    return pd.DataFrame(data)
+
+
+class Command(BaseCommand):
+    """Compare the row-wise and columnar resourceTags collapse on a wide synthetic CUR."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument("--rows", type=int, default=200_000, help="Number of synthetic line items")
+        parser.add_argument("--tag-columns", type=int, default=300, help="Number of resourceTags/user: columns")
+        parser.add_argument("--fill-ratio", type=float, default=0.05, help="Fraction of tag cells that are set")
+
+    def handle(self, *args, **options):
+        """Run both implementations and report the timings."""
+        tag_df = synthetic_tag_frame(options["rows"], options["tag_columns"], options["fill_ratio"])
+
+        start = time.perf_counter()
+        legacy = legacy_resource_tags_to_json(tag_df)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar = resource_tags_to_json(tag_df)
+        columnar_seconds = time.perf_counter() - start
+
+        self.stdout.write(f"Row-wise apply: {legacy_seconds:.2f}s")
+        self.stdout.write(f"Columnar collapse: {columnar_seconds:.2f}s")
+        self.stdout.write(f"Speedup: {legacy_seconds / columnar_seconds:.1f}x")
+        self.stdout.write(f"Identical output: {legacy.tolist() == columnar.tolist()}")
@@ -0,0 +1,130 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Benchmark the per-cell and vectorized CSV column conversion paths."""
+import os
+import tempfile
+import time
+
+import ciso8601
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from django.core.management.base import BaseCommand
+
+from masu.util.aws.common import get_column_converters
+from masu.util.common import convert_columns
+from masu.util.common import datetime_column
+from masu.util.common import safe_float
+from masu.util.common import safe_float_column
+
+
+def legacy_column_converters():
+    """Return the per-cell converters equivalent to the vectorized AWS converters."""
+    legacy = {}
+    for column, converter in get_column_converters().items():
+        if converter is datetime_column:
+            legacy[column] = ciso8601.parse_datetime
+        elif converter is safe_float_column:
+            legacy[column] = safe_float
+    return legacy
+
+
+def write_synthetic_cur(file_path, rows, tag_columns):
+    """Write a synthetic AWS Cost and Usage Report with the given number of rows."""
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2021-06-01T00:00:00")
+    hours = rng.integers(0, 30 * 24, rows).astype("timedelta64[h]")
+    usage_start = np.datetime_as_string(start + hours, unit="s")
+    usage_end = np.datetime_as_string(start + hours + np.timedelta64(1, "h"), unit="s")
+    data = {
+        "identity/LineItemId": np.char.add("id-", np.arange(rows).astype(str)),
+        "bill/BillingPeriodStartDate": np.full(rows, "2021-06-01T00:00:00Z"),
+        "bill/BillingPeriodEndDate": np.full(rows, "2021-07-01T00:00:00Z"),
+        "lineItem/UsageStartDate": np.char.add(usage_start, "Z"),
+        "lineItem/UsageEndDate": np.char.add(usage_end, "Z"),
+        "lineItem/UsageAccountId": rng.choice(["111111111111", "222222222222", "333333333333"], rows),
+        "lineItem/ProductCode": rng.choice(["AmazonEC2", "AmazonS3", "AmazonRDS"], rows),
+        "lineItem/ResourceId": np.char.add("i-", rng.integers(0, 20000, rows).astype(str)),
+        "lineItem/CurrencyCode": np.full(rows, "USD"),
+    }
+    for column in (
+        "lineItem/UsageAmount",
+        "lineItem/NormalizationFactor",
+        "lineItem/NormalizedUsageAmount",
+        "lineItem/UnblendedRate",
+        "lineItem/UnblendedCost",
+        "lineItem/BlendedRate",
+        "lineItem/BlendedCost",
+        "pricing/publicOnDemandCost",
+        "pricing/publicOnDemandRate",
+    ):
+        values = rng.random(rows).astype(str)
+        values[rng.random(rows) < 0.1] = ""
+        data[column] = values
+    for i in range(tag_columns):
+        values = rng.choice([f"value{j}" for j in range(10)], rows).astype(object)
+        values[rng.random(rows) < 0.7] = ""
+        data[f"resourceTags/user:key{i}"] = values
+    pd.DataFrame(data).to_csv(file_path, index=False, compression="gzip")
+
+
+class Command(BaseCommand):
+    """Compare per-cell converters with vectorized column conversion on a synthetic CUR."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument("--rows", type=int, default=5_000_000, help="Number of synthetic line items")
+        parser.add_argument("--tag-columns", type=int, default=10, help="Number of resourceTags/user: columns")
+        parser.add_argument("--chunksize", type=int, default=200_000, help="Rows read per chunk")
+
+    def handle(self, *args, **options):
+        """Run both conversion paths and report the timings."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_file = os.path.join(tmp_dir, "synthetic_cur.csv.gz")
+            self.stdout.write(f"Writing {options['rows']} synthetic line items to {csv_file}")
+            write_synthetic_cur(csv_file, options["rows"], options["tag_columns"])
+
+            legacy_file = os.path.join(tmp_dir, "legacy.parquet")
+            start = time.perf_counter()
+            self.convert_legacy(csv_file, legacy_file, options["chunksize"])
+            legacy_seconds = time.perf_counter() - start
+
+            vectorized_file = os.path.join(tmp_dir, "vectorized.parquet")
+            start = time.perf_counter()
+            self.convert_vectorized(csv_file, vectorized_file, options["chunksize"])
+            vectorized_seconds = time.perf_counter() - start
+
+            legacy_table = pq.read_table(legacy_file).replace_schema_metadata()
+            vectorized_table = pq.read_table(vectorized_file).replace_schema_metadata()
+            self.stdout.write(f"Per-cell converters: {legacy_seconds:.2f}s")
+            self.stdout.write(f"Vectorized converters: {vectorized_seconds:.2f}s")
+            self.stdout.write(f"Speedup: {legacy_seconds / vectorized_seconds:.1f}x")
+            self.stdout.write(f"Identical parquet data: {legacy_table.equals(vectorized_table)}")
+
+    def convert_legacy(self, csv_file, parquet_file, chunksize):
+        """Convert the CSV the way ParquetReportProcessor used to, with per-cell converters."""
+        converters = legacy_column_converters()
+        col_names = pd.read_csv(csv_file, nrows=0, compression="gzip").columns
+        converters.update({col: str for col in col_names if col not in converters})
+        data_frames = []
+        with pd.read_csv(csv_file, converters=converters, chunksize=chunksize, compression="gzip") as reader:
+            for data_frame in reader:
+                data_frames.append(data_frame)
+        self.write_parquet(pd.concat(data_frames, ignore_index=True), parquet_file)
+
+    def convert_vectorized(self, csv_file, parquet_file, chunksize):
+        """Convert the CSV with string dtypes and whole-column converters."""
+        converters = get_column_converters()
+        data_frames = []
+        with pd.read_csv(csv_file, dtype=str, na_filter=False, chunksize=chunksize, compression="gzip") as reader:
+            for data_frame in reader:
+                data_frames.append(convert_columns(data_frame, converters))
+        self.write_parquet(pd.concat(data_frames, ignore_index=True), parquet_file)
+
+    def write_parquet(self, data_frame, parquet_file):
+        """Write the data frame with the same options as ParquetReportProcessor."""
+        data_frame.to_parquet(parquet_file, allow_truncated_timestamps=True, coerce_timestamps="ms", index=False)
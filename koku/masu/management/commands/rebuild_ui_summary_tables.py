@@ -0,0 +1,38 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Rebuild the AWS and OCP UI summary tables for every source in the retention window."""
+from django.core.management.base import BaseCommand
+
+from api.iam.models import Tenant
+from masu.database.report_db_accessor_base import ReportDBAccessorBase
+from reporting.models import AWS_DIMENSION_TABLES
+from reporting.models import AWS_UI_SUMMARY_TABLES
+from reporting.models import OCP_DIMENSION_TABLES
+from reporting.models import OCP_UI_SUMMARY_TABLES
+
+
+class Command(BaseCommand):
+    """Rebuild the AWS and OCP UI summary tables for every source in the retention window."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--schema", action="append", dest="schemas", help="Tenant schema to rebuild, defaults to every tenant"
+        )
+
+    def handle(self, *args, **options):
+        """Repopulate the summary tables of each schema."""
+        schemas = options["schemas"] or [
+            schema_name
+            for schema_name in Tenant.objects.values_list("schema_name", flat=True)
+            if schema_name and schema_name != "public"
+        ]
+        for schema_name in schemas:
+            with ReportDBAccessorBase(schema_name) as accessor:
+                accessor.populate_ui_summary_tables(AWS_UI_SUMMARY_TABLES + OCP_UI_SUMMARY_TABLES)
+                accessor.populate_dimension_tables(AWS_DIMENSION_TABLES + OCP_DIMENSION_TABLES)
+            self.stdout.write(f"Rebuilt UI summary tables for {schema_name}")
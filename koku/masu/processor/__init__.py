@@ -29,3 +29,11 @@ def enable_trino_processing(source_uuid, source_type, account):  # noqa
     ):
         return True
     return False
+
+
+def enable_trino_copy_sink(source_uuid, source_type):
+    """Helper to determine if a source's Trino summary is loaded into Postgres with COPY."""
+    return (
+        str(source_uuid) in settings.ENABLE_TRINO_COPY_SINK_SOURCES
+        or source_type in settings.ENABLE_TRINO_COPY_SINK_SOURCE_TYPE
+    )
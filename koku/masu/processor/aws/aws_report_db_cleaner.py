@@ -12,6 +12,7 @@ from koku.database import cascade_delete
 from koku.database import execute_delete_sql
 from koku.database import get_model
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
 from reporting.models import PartitionedTable
 
 
@@ -122,6 +123,7 @@ class AWSReportDBCleaner:
                     )
                 )
                 LOG.info(f"Deleted {del_count} table partitions")
+                PARTITION_REGISTRY.invalidate(self._schema)
 
                 # Using skip_relations here as we have already dropped partitions above
                 cascade_delete(all_bill_objects.query.model, all_bill_objects, skip_relations=table_models)
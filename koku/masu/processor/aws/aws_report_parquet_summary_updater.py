@@ -13,8 +13,8 @@ from tenant_schemas.utils import schema_context
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.cost_model_db_accessor import CostModelDBAccessor
 from masu.external.date_accessor import DateAccessor
-from masu.util.common import date_range_pair
 from masu.util.common import determine_if_full_summary_update_needed
+from masu.util.common import run_date_range_pairs_in_parallel
 
 LOG = logging.getLogger(__name__)
 
@@ -96,7 +96,9 @@ class AWSReportParquetSummaryUpdater:
                 bill_ids = [str(bill.id) for bill in bills]
                 current_bill_id = bills.first().id if bills else None
 
-            for start, end in date_range_pair(start_date, end_date, step=settings.TRINO_DATE_STEP):
+            def populate_window(start, end):
+                # Each window replaces only its own days, so the rest of the range stays readable
+                accessor.delete_line_item_daily_summary_entries_for_date_range(self._provider.uuid, start, end)
                 LOG.info(
                     "Updating AWS report summary tables from parquet: \n\tSchema: %s"
                     "\n\tProvider: %s \n\tDates: %s - %s",
@@ -105,11 +107,14 @@ class AWSReportParquetSummaryUpdater:
                     start,
                     end,
                 )
-                accessor.delete_line_item_daily_summary_entries_for_date_range(self._provider.uuid, start, end)
                 accessor.populate_line_item_daily_summary_table_presto(
                     start, end, self._provider.uuid, current_bill_id, markup_value
                 )
-                # accessor.populate_enabled_tag_keys(start, end, bill_ids)
+
+            run_date_range_pairs_in_parallel(
+                self._schema, populate_window, start_date, end_date, step=settings.TRINO_DATE_STEP
+            )
+            # accessor.populate_enabled_tag_keys(start_date, end_date, bill_ids)
             accessor.populate_tags_summary_table(bill_ids, start_date, end_date)
             # accessor.update_line_item_daily_summary_with_enabled_tags(start_date, end_date, bill_ids)
             for bill in bills:
@@ -15,6 +15,7 @@ from django.db import transaction
 
 from masu.config import Config
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
+from masu.processor.report_processor_base import DimensionLoader
 from masu.processor.report_processor_base import ReportProcessorBase
 from masu.util.common import split_alphanumeric_string
 from reporting.provider.aws.models import AWSCostEntry
@@ -129,6 +130,7 @@ class AWSReportProcessor(ReportProcessorBase):
                 temp_table = report_db.create_temp_table(self.table_name._meta.db_table, drop_column="id")
                 LOG.info("File %s opened for processing", str(f))
                 reader = csv.DictReader(f)
+                rows = []
                 for row in reader:
                     # If this isn't an initial load and it isn't finalized data
                     # we should only process recent data.
@@ -149,8 +151,10 @@ class AWSReportProcessor(ReportProcessorBase):
                             if li_usage_dt not in self.processed_report.requested_partitions:
                                 self.processed_report.requested_partitions.add(li_usage_dt)
 
-                    bill_id = self.create_cost_entry_objects(row, report_db)
-                    if len(self.processed_report.line_items) >= self._batch_size:
+                    rows.append(row)
+                    if len(rows) >= self._batch_size:
+                        bill_id = self.create_cost_entry_objects(rows, report_db)
+                        rows = []
                         LOG.debug(
                             "Saving report rows %d to %d for %s",
                             row_count,
@@ -162,6 +166,9 @@ class AWSReportProcessor(ReportProcessorBase):
                         row_count += len(self.processed_report.line_items)
                         self._update_mappings()
 
+                if rows:
+                    bill_id = self.create_cost_entry_objects(rows, report_db)
+
                 if self.processed_report.line_items:
                     LOG.debug(
                         "Saving report rows %d to %d for %s",
@@ -282,71 +289,189 @@ class AWSReportProcessor(ReportProcessorBase):
         start, end = interval.split("/")
         return start, end
 
-    def _create_cost_entry_bill(self, row, report_db_accessor):
-        """Create a cost entry bill object.
-
-        Args:
-            row (dict): A dictionary representation of a CSV file row
-
-        Returns:
-            (str): A cost entry bill object id
-
-        """
-        table_name = AWSCostEntryBill
+    def _cost_entry_bill_key(self, row):
+        """Return the key that identifies the bill for a row."""
         start_date = row.get("bill/BillingPeriodStartDate")
         bill_type = row.get("bill/BillType")
         payer_account_id = row.get("bill/PayerAccountId")
+        return (bill_type, payer_account_id, start_date, self._provider_uuid)
 
-        key = (bill_type, payer_account_id, start_date, self._provider_uuid)
-        if key in self.processed_report.bills:
-            return self.processed_report.bills[key]
+    def _cost_entry_bill_data(self, row):
+        """Return the bill data for a row."""
+        data = self._get_data_for_table(row, AWSCostEntryBill._meta.db_table)
+        data["provider_id"] = self._provider_uuid
+        return data
 
-        if key in self.existing_bill_map:
-            return self.existing_bill_map[key]
+    def _cost_entry_key(self, row, bill_id):
+        """Return the key that identifies the cost entry for a row."""
+        start, _ = self._get_cost_entry_time_interval(row.get("identity/TimeInterval"))
+        return (bill_id, start)
 
-        data = self._get_data_for_table(row, table_name._meta.db_table)
+    def _cost_entry_data(self, row, bill_id):
+        """Return the cost entry data for a row."""
+        start, end = self._get_cost_entry_time_interval(row.get("identity/TimeInterval"))
+        return {"bill_id": bill_id, "interval_start": start, "interval_end": end}
 
-        data["provider_id"] = self._provider_uuid
+    def _cost_entry_pricing_key(self, row):
+        """Return the key that identifies the pricing for a row."""
+        term = row.get("pricing/term") if row.get("pricing/term") else "None"
+        unit = row.get("pricing/unit") if row.get("pricing/unit") else "None"
+        return f"{term}-{unit}"
+
+    def _cost_entry_pricing_data(self, row):
+        """Return the pricing data for a row, or None if the row has no pricing."""
+        data = self._get_data_for_table(row, AWSCostEntryPricing._meta.db_table)
+        if set(data.values()) == {""}:
+            return None
+        return data
+
+    def _cost_entry_product_key(self, row):
+        """Return the key that identifies the product for a row."""
+        return (row.get("product/sku"), row.get("product/ProductName"), row.get("product/region"))
+
+    def _cost_entry_product_data(self, row):
+        """Return the product data for a row, or None if the row has no product."""
+        data = self._get_data_for_table(row, AWSCostEntryProduct._meta.db_table)
+        data = self._process_memory_value(data)
+        if set(data.values()) == {""}:
+            return None
+        return data
+
+    def _cost_entry_reservation_data(self, row):
+        """Return the reservation data for a row, or None if the row has no reservation."""
+        data = self._get_data_for_table(row, AWSCostEntryReservation._meta.db_table)
+        if set(data.values()) == {""}:
+            return None
+        return data
 
+    def _get_dimension_id(self, key, processed_map, existing_map):
+        """Return the id for a dimension key from the maps of known rows."""
+        if key in processed_map:
+            return processed_map[key]
+        return existing_map.get(key)
+
+    def _load_dimension(self, rows, loader, processed_map, existing_map, get_key, get_data, report_db_accessor):
+        """Queue the rows whose dimension is not known yet, load them together and record their ids."""
+        for row in rows:
+            key = get_key(row)
+            if key in processed_map or key in existing_map or key in loader:
+                continue
+            data = get_data(row)
+            if data is not None:
+                loader.add(key, data)
         with transaction.atomic():
-            bill_id = report_db_accessor.insert_on_conflict_do_nothing(
-                table_name,
-                data,
+            processed_map.update(loader.load(report_db_accessor))
+
+    def _load_cost_entry_bills(self, rows, report_db_accessor):
+        """Load the bills referenced by rows."""
+        self._load_dimension(
+            rows,
+            DimensionLoader(
+                AWSCostEntryBill,
                 conflict_columns=["bill_type", "payer_account_id", "billing_period_start", "provider_id"],
-            )
+            ),
+            self.processed_report.bills,
+            self.existing_bill_map,
+            self._cost_entry_bill_key,
+            self._cost_entry_bill_data,
+            report_db_accessor,
+        )
 
-        self.processed_report.bills[key] = bill_id
+    def _load_cost_entries(self, rows, bill_ids, report_db_accessor):
+        """Load the cost entries referenced by rows, which belong to the matching bill_ids."""
+        self._load_dimension(
+            list(zip(rows, bill_ids)),
+            DimensionLoader(AWSCostEntry, match_columns=["bill_id", "interval_start"]),
+            self.processed_report.cost_entries,
+            self.existing_cost_entry_map,
+            lambda row_bill: self._cost_entry_key(*row_bill),
+            lambda row_bill: self._cost_entry_data(*row_bill),
+            report_db_accessor,
+        )
 
-        return bill_id
+    def _load_cost_entry_products(self, rows, report_db_accessor):
+        """Load the products referenced by rows."""
+        self._load_dimension(
+            rows,
+            DimensionLoader(AWSCostEntryProduct, conflict_columns=["sku", "product_name", "region"]),
+            self.processed_report.products,
+            self.existing_product_map,
+            self._cost_entry_product_key,
+            self._cost_entry_product_data,
+            report_db_accessor,
+        )
 
-    def _create_cost_entry(self, row, bill_id, report_db_accessor):
-        """Create a cost entry object.
+    def _load_cost_entry_pricing(self, rows, report_db_accessor):
+        """Load the pricing referenced by rows."""
+        self._load_dimension(
+            rows,
+            DimensionLoader(AWSCostEntryPricing),
+            self.processed_report.pricing,
+            self.existing_pricing_map,
+            self._cost_entry_pricing_key,
+            self._cost_entry_pricing_data,
+            report_db_accessor,
+        )
+
+    def _load_cost_entry_reservations(self, rows, report_db_accessor):
+        """Load the reservations referenced by rows.
+
+        RI fee rows carry additional reservation information, so they update the
+        reservation even when it already exists.
+        """
+        new_reservations = DimensionLoader(AWSCostEntryReservation, conflict_columns=["reservation_arn"])
+        fee_reservations = DimensionLoader(AWSCostEntryReservation, conflict_columns=["reservation_arn"], update=True)
+        for row in rows:
+            arn = row.get("reservation/ReservationARN")
+            is_fee = row.get("lineItem/LineItemType", "").lower() == "rifee"
+            known = arn in self.processed_report.reservations or arn in self.existing_reservation_map
+            if known and not is_fee:
+                continue
+            data = self._cost_entry_reservation_data(row)
+            if data is None:
+                continue
+            if is_fee:
+                fee_reservations.add(arn, data)
+            else:
+                new_reservations.add(arn, data)
+        with transaction.atomic():
+            self.processed_report.reservations.update(new_reservations.load(report_db_accessor))
+            self.processed_report.reservations.update(fee_reservations.load(report_db_accessor))
+
+    def _get_bill_id(self, row):
+        """Return the id of the loaded bill for a row."""
+        return self._get_dimension_id(
+            self._cost_entry_bill_key(row), self.processed_report.bills, self.existing_bill_map
+        )
+
+    def _create_cost_entry_bill(self, row, report_db_accessor):
+        """Create a cost entry bill object.
 
         Args:
             row (dict): A dictionary representation of a CSV file row
-            bill_id (str): The current cost entry bill id
 
         Returns:
-            (str): The DB id of the cost entry object
+            (str): A cost entry bill object id
 
         """
-        table_name = AWSCostEntry
-        interval = row.get("identity/TimeInterval")
-        start, end = self._get_cost_entry_time_interval(interval)
+        self._load_cost_entry_bills([row], report_db_accessor)
+        return self._get_bill_id(row)
 
-        key = (bill_id, start)
-        if key in self.processed_report.cost_entries:
-            return self.processed_report.cost_entries[key]
+    def _create_cost_entry(self, row, bill_id, report_db_accessor):
+        """Create a cost entry object.
 
-        if key in self.existing_cost_entry_map:
-            return self.existing_cost_entry_map[key]
+        Args:
+            row (dict): A dictionary representation of a CSV file row
+            bill_id (str): The current cost entry bill id
 
-        data = {"bill_id": bill_id, "interval_start": start, "interval_end": end}
-        with transaction.atomic():
-            cost_entry_id = report_db_accessor.insert_on_conflict_do_nothing(table_name, data)
-        self.processed_report.cost_entries[key] = cost_entry_id
+        Returns:
+            (str): The DB id of the cost entry object
 
-        return cost_entry_id
+        """
+        self._load_cost_entries([row], [bill_id], report_db_accessor)
+        return self._get_dimension_id(
+            self._cost_entry_key(row, bill_id), self.processed_report.cost_entries, self.existing_cost_entry_map
+        )
 
     def _create_cost_entry_line_item(
         self, row, cost_entry_id, bill_id, product_id, pricing_id, reservation_id, report_db_accesor
@@ -391,28 +516,10 @@ class AWSReportProcessor(ReportProcessorBase):
             (str): The DB id of the pricing object
 
         """
-        table_name = AWSCostEntryPricing
-
-        term = row.get("pricing/term") if row.get("pricing/term") else "None"
-        unit = row.get("pricing/unit") if row.get("pricing/unit") else "None"
-
-        key = f"{term}-{unit}"
-        if key in self.processed_report.pricing:
-            return self.processed_report.pricing[key]
-
-        if key in self.existing_pricing_map:
-            return self.existing_pricing_map[key]
-
-        data = self._get_data_for_table(row, table_name._meta.db_table)
-        value_set = set(data.values())
-        if value_set == {""}:
-            return
-
-        with transaction.atomic():
-            pricing_id = report_db_accessor.insert_on_conflict_do_nothing(table_name, data)
-        self.processed_report.pricing[key] = pricing_id
-
-        return pricing_id
+        self._load_cost_entry_pricing([row], report_db_accessor)
+        return self._get_dimension_id(
+            self._cost_entry_pricing_key(row), self.processed_report.pricing, self.existing_pricing_map
+        )
 
     def _create_cost_entry_product(self, row, report_db_accessor):
         """Create a cost entry product object.
@@ -424,29 +531,10 @@ class AWSReportProcessor(ReportProcessorBase):
             (str): The DB id of the product object
 
         """
-        table_name = AWSCostEntryProduct
-        sku = row.get("product/sku")
-        product_name = row.get("product/ProductName")
-        region = row.get("product/region")
-        key = (sku, product_name, region)
-
-        if key in self.processed_report.products:
-            return self.processed_report.products[key]
-
-        if key in self.existing_product_map:
-            return self.existing_product_map[key]
-
-        data = self._get_data_for_table(row, table_name._meta.db_table)
-        data = self._process_memory_value(data)
-        value_set = set(data.values())
-        if value_set == {""}:
-            return
-        with transaction.atomic():
-            product_id = report_db_accessor.insert_on_conflict_do_nothing(
-                table_name, data, conflict_columns=["sku", "product_name", "region"]
-            )
-        self.processed_report.products[key] = product_id
-        return product_id
+        self._load_cost_entry_products([row], report_db_accessor)
+        return self._get_dimension_id(
+            self._cost_entry_product_key(row), self.processed_report.products, self.existing_product_map
+        )
 
     def _create_cost_entry_reservation(self, row, report_db_accessor):
         """Create a cost entry reservation object.
@@ -458,55 +546,51 @@ class AWSReportProcessor(ReportProcessorBase):
             (str): The DB id of the reservation object
 
         """
-        table_name = AWSCostEntryReservation
-        arn = row.get("reservation/ReservationARN")
-        line_item_type = row.get("lineItem/LineItemType", "").lower()
-        reservation_id = None
-
-        if arn in self.processed_report.reservations:
-            reservation_id = self.processed_report.reservations.get(arn)
-        elif arn in self.existing_reservation_map:
-            reservation_id = self.existing_reservation_map[arn]
-
-        if reservation_id is None or line_item_type == "rifee":
-            data = self._get_data_for_table(row, table_name._meta.db_table)
-            value_set = set(data.values())
-            if value_set == {""}:
-                return
-        else:
-            return reservation_id
-
-        # Special rows with additional reservation information
-        with transaction.atomic():
-            if line_item_type == "rifee":
-                reservation_id = report_db_accessor.insert_on_conflict_do_update(
-                    table_name, data, conflict_columns=["reservation_arn"], set_columns=list(data.keys())
-                )
-            else:
-                reservation_id = report_db_accessor.insert_on_conflict_do_nothing(
-                    table_name, data, conflict_columns=["reservation_arn"]
-                )
-        self.processed_report.reservations[arn] = reservation_id
-
-        return reservation_id
-
-    def create_cost_entry_objects(self, row, report_db_accesor):
-        """Create the set of objects required for a row of data."""
-        bill_id = self._create_cost_entry_bill(row, report_db_accesor)
-        cost_entry_id = self._create_cost_entry(row, bill_id, report_db_accesor)
-        product_id = self._create_cost_entry_product(row, report_db_accesor)
-        pricing_id = self._create_cost_entry_pricing(row, report_db_accesor)
-        reservation_id = self._create_cost_entry_reservation(row, report_db_accesor)
-
-        self._create_cost_entry_line_item(
-            row, cost_entry_id, bill_id, product_id, pricing_id, reservation_id, report_db_accesor
+        self._load_cost_entry_reservations([row], report_db_accessor)
+        return self._get_dimension_id(
+            row.get("reservation/ReservationARN"), self.processed_report.reservations, self.existing_reservation_map
         )
 
+    def create_cost_entry_objects(self, rows, report_db_accesor):
+        """Create the set of objects required for a batch of rows.
+
+        The dimension rows the batch references are loaded first, one bulk
+        upsert per table, and every line item is then built from the ids.
+
+        Returns:
+            (str): The bill id of the last row
+
+        """
+        self._load_cost_entry_bills(rows, report_db_accesor)
+        bill_ids = [self._get_bill_id(row) for row in rows]
+        self._load_cost_entries(rows, bill_ids, report_db_accesor)
+        self._load_cost_entry_products(rows, report_db_accesor)
+        self._load_cost_entry_pricing(rows, report_db_accesor)
+        self._load_cost_entry_reservations(rows, report_db_accesor)
+
+        report = self.processed_report
+        bill_id = None
+        for row, bill_id in zip(rows, bill_ids):
+            cost_entry_id = self._get_dimension_id(
+                self._cost_entry_key(row, bill_id), report.cost_entries, self.existing_cost_entry_map
+            )
+            product_id = self._get_dimension_id(
+                self._cost_entry_product_key(row), report.products, self.existing_product_map
+            )
+            pricing_id = self._get_dimension_id(
+                self._cost_entry_pricing_key(row), report.pricing, self.existing_pricing_map
+            )
+            reservation_id = self._get_dimension_id(
+                row.get("reservation/ReservationARN"), report.reservations, self.existing_reservation_map
+            )
+            self._create_cost_entry_line_item(
+                row, cost_entry_id, bill_id, product_id, pricing_id, reservation_id, report_db_accesor
+            )
+
         return bill_id
 
     def _save_to_db(self, temp_table, report_db):
         # Create any needed partitions
-        existing_partitions = report_db.get_existing_partitions(AWSCostEntryLineItemDailySummary)
-        report_db.add_partitions(existing_partitions, self.processed_report.requested_partitions)
+        report_db.ensure_partitions(AWSCostEntryLineItemDailySummary, self.processed_report.requested_partitions)
         # Save batch to DB
         super()._save_to_db(temp_table, report_db)
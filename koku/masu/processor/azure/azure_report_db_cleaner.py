@@ -12,6 +12,7 @@ from koku.database import cascade_delete
 from koku.database import execute_delete_sql
 from koku.database import get_model
 from masu.database.azure_report_db_accessor import AzureReportDBAccessor
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
 from reporting.models import PartitionedTable
 
 
@@ -119,6 +120,7 @@ class AzureReportDBCleaner:
                     )
                 )
                 LOG.info(f"Deleted {del_count} table partitions")
+                PARTITION_REGISTRY.invalidate(self._schema)
 
             if not simulate:
                 cascade_delete(all_bill_objects.query.model, all_bill_objects, skip_relations=table_models)
@@ -411,7 +411,6 @@ class AzureReportProcessor(ReportProcessorBase):
 
     def _save_to_db(self, temp_table, report_db):
         # Create any needed partitions
-        existing_partitions = report_db.get_existing_partitions(AzureCostEntryLineItemDailySummary)
-        report_db.add_partitions(existing_partitions, self.processed_report.requested_partitions)
+        report_db.ensure_partitions(AzureCostEntryLineItemDailySummary, self.processed_report.requested_partitions)
         # Save batch to DB
         super()._save_to_db(temp_table, report_db)
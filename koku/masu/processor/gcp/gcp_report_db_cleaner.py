@@ -12,6 +12,7 @@ from koku.database import cascade_delete
 from koku.database import execute_delete_sql
 from koku.database import get_model
 from masu.database.gcp_report_db_accessor import GCPReportDBAccessor
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
 from reporting.models import PartitionedTable
 
 
@@ -109,6 +110,7 @@ class GCPReportDBCleaner:
                     )
                 )
                 LOG.info(f"Deleted {del_count} table partitions")
+                PARTITION_REGISTRY.invalidate(self._schema)
 
                 # Iterate over the remainder as they could involve much larger amounts of data
             for bill in all_bill_objects:
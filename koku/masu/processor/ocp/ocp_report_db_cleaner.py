@@ -12,6 +12,7 @@ from koku.database import cascade_delete
 from koku.database import execute_delete_sql
 from koku.database import get_model
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
 from reporting.models import PartitionedTable
 
 LOG = logging.getLogger(__name__)
@@ -135,6 +136,7 @@ class OCPReportDBCleaner:
                     )
                 )
                 LOG.info(f"Deleted {del_count} table partitions")
+                PARTITION_REGISTRY.invalidate(self._schema)
 
             if not simulate:
                 cascade_delete(all_usage_periods.query.model, all_usage_periods, skip_relations=table_models)
@@ -4,16 +4,19 @@
 #
 """Updates report summary tables in the database."""
 import calendar
+import datetime
 import logging
 
 import ciso8601
 from django.conf import settings
+from django.core.cache import caches
 from tenant_schemas.utils import schema_context
 
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
+from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.external.date_accessor import DateAccessor
-from masu.util.common import date_range_pair
 from masu.util.common import determine_if_full_summary_update_needed
+from masu.util.common import run_date_range_pairs_in_parallel
 from masu.util.ocp.common import get_cluster_alias_from_cluster_id
 from masu.util.ocp.common import get_cluster_id_from_provider
 
@@ -36,9 +39,12 @@ class OCPReportParquetSummaryUpdater:
         self._cluster_id = get_cluster_id_from_provider(self._provider.uuid)
         self._cluster_alias = get_cluster_alias_from_cluster_id(self._cluster_id)
         self._date_accessor = DateAccessor()
+        self._full_summary_key = f"ocp-full-summary-{self._provider.uuid}"
+        self._changed_days_only = False
 
     def _get_sql_inputs(self, start_date, end_date):
         """Get the required inputs for running summary SQL."""
+        do_month_update = False
         with OCPReportDBAccessor(self._schema) as accessor:
             # This is the normal processing route
             if self._manifest:
@@ -47,7 +53,6 @@ class OCPReportParquetSummaryUpdater:
                 report_periods = accessor.get_usage_period_query_by_provider(self._provider.uuid)
                 report_periods = report_periods.filter(report_period_start=bill_date).all()
                 first_period = report_periods.first()
-                do_month_update = False
                 with schema_context(self._schema):
                     if first_period:
                         do_month_update = determine_if_full_summary_update_needed(first_period)
@@ -62,8 +67,41 @@ class OCPReportParquetSummaryUpdater:
         if isinstance(end_date, str):
             end_date = ciso8601.parse_datetime(end_date).date()
 
+        if self._manifest and not do_month_update:
+            start_date, end_date = self._get_changed_days_range(start_date, end_date)
+
         return start_date, end_date
 
+    def _get_changed_days_range(self, start_date, end_date):
+        """Narrow the dates to the days of usage in the manifest's report files.
+
+        The dates are kept when the days of a file were not recorded, or when the
+        provider has not been summarized without narrowing within
+        settings.OCP_FULL_SUMMARY_INTERVAL_HOURS, so data outside the changed
+        days is still reconciled periodically.
+        """
+        if caches["worker"].get(self._full_summary_key) is None:
+            self._changed_days_only = False
+            return start_date, end_date
+
+        with ReportManifestDBAccessor() as manifest_accessor:
+            usage_days = manifest_accessor.get_usage_days(self._manifest.id) or []
+        start = start_date.date() if isinstance(start_date, datetime.datetime) else start_date
+        end = end_date.date() if isinstance(end_date, datetime.datetime) else end_date
+        usage_days = [day for day in usage_days if start <= day <= end]
+        if not usage_days:
+            self._changed_days_only = False
+            return start_date, end_date
+
+        LOG.info(
+            "Summarizing only the changed days %s - %s for provider %s.",
+            usage_days[0],
+            usage_days[-1],
+            self._provider.uuid,
+        )
+        self._changed_days_only = True
+        return usage_days[0], usage_days[-1]
+
     def update_daily_tables(self, start_date, end_date):
         """Populate the daily tables for reporting.
 
@@ -98,7 +136,9 @@ class OCPReportParquetSummaryUpdater:
                 report_period = accessor.report_periods_for_provider_uuid(self._provider.uuid, start_date)
                 report_period_id = report_period.id
 
-            for start, end in date_range_pair(start_date, end_date, step=settings.TRINO_DATE_STEP):
+            def populate_window(start, end):
+                # Each window replaces only its own days, so the rest of the range stays readable
+                accessor.delete_line_item_daily_summary_entries_for_date_range(self._provider.uuid, start, end)
                 LOG.info(
                     "Updating OpenShift report summary tables for \n\tSchema: %s "
                     "\n\tProvider: %s \n\tCluster: %s \n\tReport Period ID: %s \n\tDates: %s - %s",
@@ -109,12 +149,14 @@ class OCPReportParquetSummaryUpdater:
                     start,
                     end,
                 )
-                # This will process POD and STORAGE together
-                accessor.delete_line_item_daily_summary_entries_for_date_range(self._provider.uuid, start, end)
                 accessor.populate_line_item_daily_summary_table_presto(
                     start, end, report_period_id, self._cluster_id, self._cluster_alias, self._provider.uuid
                 )
 
+            run_date_range_pairs_in_parallel(
+                self._schema, populate_window, start_date, end_date, step=settings.TRINO_DATE_STEP
+            )
+
             # This will process POD and STORAGE together
             LOG.info(
                 "Updating OpenShift label summary tables for \n\tSchema: %s " "\n\tReport Period IDs: %s",
@@ -134,4 +176,7 @@ class OCPReportParquetSummaryUpdater:
             report_period.summary_data_updated_datetime = self._date_accessor.today_with_timezone("UTC")
             report_period.save()
 
+        if not self._changed_days_only:
+            caches["worker"].set(self._full_summary_key, True, settings.OCP_FULL_SUMMARY_INTERVAL_HOURS * 3600)
+
         return start_date, end_date
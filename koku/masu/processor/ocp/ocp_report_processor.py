@@ -286,8 +286,7 @@ class OCPReportProcessorBase(ReportProcessorBase):
 
     def _save_to_db(self, temp_table, report_db):
         # Create any needed partitions
-        existing_partitions = report_db.get_existing_partitions(OCPUsageLineItemDailySummary)
-        report_db.add_partitions(existing_partitions, self.processed_report.requested_partitions)
+        report_db.ensure_partitions(OCPUsageLineItemDailySummary, self.processed_report.requested_partitions)
         # Save batch to DB
         super()._save_to_db(temp_table, report_db)
 
@@ -3,9 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Processor to convert Cost Usage Reports to parquet."""
+import collections
 import datetime
 import logging
+import multiprocessing
 import os
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
 
@@ -22,6 +27,7 @@ from masu.processor.aws.aws_report_parquet_processor import AWSReportParquetProc
 from masu.processor.azure.azure_report_parquet_processor import AzureReportParquetProcessor
 from masu.processor.gcp.gcp_report_parquet_processor import GCPReportParquetProcessor
 from masu.processor.ocp.ocp_report_parquet_processor import OCPReportParquetProcessor
+from masu.processor.parquet.streaming_parquet_writer import StreamingParquetWriter
 from masu.util.aws.common import aws_generate_daily_data
 from masu.util.aws.common import aws_post_processor
 from masu.util.aws.common import copy_data_to_s3_bucket
@@ -30,6 +36,7 @@ from masu.util.aws.common import remove_files_not_in_set_from_s3_bucket
 from masu.util.azure.common import azure_generate_daily_data
 from masu.util.azure.common import azure_post_processor
 from masu.util.azure.common import get_column_converters as azure_column_converters
+from masu.util.common import convert_columns
 from masu.util.common import create_enabled_keys
 from masu.util.common import get_hive_table_path
 from masu.util.common import get_path_prefix
@@ -63,6 +70,96 @@ class ParquetReportProcessorError(Exception):
     pass
 
 
+ParquetConversion = collections.namedtuple(
+    "ParquetConversion", ["parquet_files", "unique_keys", "daily_data_frames", "success", "error"]
+)
+
+
+def keep_local_parquet_file(file_path, file_name):
+    """Upload callback that leaves a finished parquet file on local disk."""
+    return True
+
+
+def convert_csv_file(
+    csv_filename,
+    local_path,
+    parquet_base_filename,
+    converters,
+    post_processor=None,
+    daily_data_processor=None,
+    streaming=False,
+    upload=keep_local_parquet_file,
+):
+    """
+    Convert a CSV file to parquet files, handing each finished file to upload.
+
+    With the default upload the files are only written to local disk, which is how
+    ParquetReportProcessor.convert_files_in_parallel runs this in a worker process
+    that must not touch the database or S3. Errors are returned instead of raised so
+    the caller always learns every file that was written and can remove it.
+
+    Returns:
+        (ParquetConversion): The (file_path, file_name) of every parquet file written, the tag keys found,
+            the daily data frames, whether every upload succeeded and the error message, if any
+
+    """
+    parquet_files = []
+    unique_keys = set()
+    daily_data_frames = []
+    writer = None
+    success = True
+    error = None
+    try:
+        if streaming:
+            writer = StreamingParquetWriter(
+                csv_filename,
+                converters,
+                post_processor=post_processor,
+                daily_data_processor=daily_data_processor,
+                row_group_size=settings.PARQUET_ROW_GROUP_SIZE,
+                max_rows_per_file=settings.PARQUET_MAX_ROWS_PER_FILE,
+            )
+            _, success = writer.write(local_path, f"{parquet_base_filename}_{{index}}{PARQUET_EXT}", upload)
+        else:
+            compression = "gzip" if csv_filename.lower().endswith(CSV_GZIP_EXT) else None
+            # Read every column as raw strings so pandas stays on its C parsing path,
+            # then convert the typed columns a whole column at a time.
+            with pd.read_csv(
+                csv_filename,
+                dtype=str,
+                na_filter=False,
+                chunksize=settings.PARQUET_PROCESSING_BATCH_SIZE,
+                compression=compression,
+            ) as reader:
+                for i, data_frame in enumerate(reader):
+                    data_frame = convert_columns(data_frame, converters)
+                    if post_processor:
+                        data_frame = post_processor(data_frame)
+                        if isinstance(data_frame, tuple):
+                            data_frame, data_frame_tag_keys = data_frame
+                            unique_keys.update(data_frame_tag_keys)
+                    if daily_data_processor is not None:
+                        daily_data_frames.append(daily_data_processor(data_frame))
+                    parquet_filename = f"{parquet_base_filename}_{i}{PARQUET_EXT}"
+                    parquet_file = f"{local_path}/{parquet_filename}"
+                    parquet_files.append((parquet_file, parquet_filename))
+                    data_frame.to_parquet(
+                        parquet_file, allow_truncated_timestamps=True, coerce_timestamps="ms", index=False
+                    )
+                    if not upload(parquet_file, parquet_filename):
+                        success = False
+                        break
+    except Exception as err:
+        success = False
+        error = str(err)
+
+    if writer is not None:
+        parquet_files = writer.parquet_files
+        unique_keys = writer.unique_keys
+        daily_data_frames = writer.daily_data_frames
+    return ParquetConversion(parquet_files, unique_keys, daily_data_frames, success, error)
+
+
 class ParquetReportProcessor:
     """Parquet report processor."""
 
@@ -198,6 +295,27 @@ class ParquetReportProcessor:
 
         return daily_data_processor
 
+    @property
+    def use_streaming_engine(self):
+        """Whether CSV files for this provider type are converted with the pyarrow streaming engine."""
+        return self.provider_type in settings.PARQUET_STREAMING_SOURCE_TYPES
+
+    @property
+    def conversion_workers(self):
+        """The number of processes used to convert split files concurrently.
+
+        The process pool is only used when ENABLE_PARQUET_CONVERSION_POOL is set. Celery prefork
+        children are daemonic billiard processes that billiard also registers as the multiprocessing
+        current process, and daemonic processes cannot start children, so these convert serially.
+        """
+        if not settings.ENABLE_PARQUET_CONVERSION_POOL:
+            return 1
+        if multiprocessing.current_process().daemon:
+            msg = "Parquet conversion pool is enabled but this worker is daemonic, converting files serially."
+            LOG.warning(log_json(self.request_id, msg, self.error_context))
+            return 1
+        return max(1, min(settings.PARQUET_CONVERSION_WORKERS, len(self.file_list)))
+
     @property
     def csv_path_s3(self):
         """The path in the S3 bucket where CSV files are loaded."""
@@ -328,14 +446,18 @@ class ParquetReportProcessor:
             manifest_accessor.mark_s3_parquet_cleared(manifest)
 
         failed_conversion = []
+        csv_filenames = []
         for csv_filename in self.file_list:
             if self.provider_type == Provider.PROVIDER_OCP and self.report_type is None:
                 msg = f"Could not establish report type for {csv_filename}."
                 LOG.warn(log_json(self.request_id, msg, self.error_context))
                 failed_conversion.append(csv_filename)
                 continue
+            csv_filenames.append(csv_filename)
 
-            parquet_base_filename, daily_data_frames, success = self.convert_csv_to_parquet(csv_filename)
+        daily_data_frames = []
+        for csv_filename, conversion in zip(csv_filenames, self._convert_files(csv_filenames)):
+            parquet_base_filename, daily_data_frames, success = conversion
             if self.provider_type not in (Provider.PROVIDER_AZURE, Provider.PROVIDER_GCP):
                 self.create_daily_parquet(parquet_base_filename, daily_data_frames)
             if not success:
@@ -346,6 +468,96 @@ class ParquetReportProcessor:
             LOG.warn(log_json(self.request_id, msg, self.error_context))
         return parquet_base_filename, daily_data_frames
 
+    def _convert_files(self, csv_filenames):
+        """Return the conversion results for csv_filenames, converting them in parallel when configured."""
+        if self.conversion_workers > 1:
+            return self.convert_files_in_parallel(csv_filenames)
+        return (self.convert_csv_to_parquet(csv_filename) for csv_filename in csv_filenames)
+
+    def convert_files_in_parallel(self, csv_filenames):
+        """
+        Convert CSV files to parquet in a process pool and upload them from a thread pool.
+
+        Each file is converted to local parquet files by a worker process. As soon as
+        a file is converted its parquet files are queued for upload, so S3 transfers
+        overlap with the conversion of the remaining files. The Trino table and enabled
+        tag keys are only written once, from this process, after every file is done.
+
+        Returns:
+            [(str, [DataFrame], bool)]: The parquet base filename, daily data frames and success
+                of each file, in the order of csv_filenames
+
+        """
+        msg = f"Converting {len(csv_filenames)} files to parquet with {self.conversion_workers} processes."
+        LOG.info(log_json(self.request_id, msg, self.error_context))
+        converters = self._get_column_converters()
+        results = {}
+        uploads = {}
+        unique_keys = set()
+        with ProcessPoolExecutor(max_workers=self.conversion_workers) as process_pool, ThreadPoolExecutor(
+            max_workers=settings.PARQUET_UPLOAD_WORKERS
+        ) as upload_pool:
+            conversions = {}
+            for csv_filename in csv_filenames:
+                parquet_base_filename = os.path.basename(csv_filename).replace(self.file_extension, "")
+                future = process_pool.submit(
+                    convert_csv_file,
+                    csv_filename,
+                    self.local_path,
+                    parquet_base_filename,
+                    converters,
+                    post_processor=self.post_processor,
+                    daily_data_processor=self.daily_data_processor,
+                    streaming=self.use_streaming_engine,
+                )
+                conversions[future] = (csv_filename, parquet_base_filename)
+
+            for future in as_completed(conversions):
+                csv_filename, parquet_base_filename = conversions[future]
+                try:
+                    conversion = future.result()
+                except Exception as err:
+                    # The worker process itself failed, so there is no record of the files it wrote
+                    msg = f"File {csv_filename} could not be written as parquet. Reason: {str(err)}"
+                    LOG.warn(log_json(self.request_id, msg, self.error_context))
+                    results[csv_filename] = (parquet_base_filename, [], False)
+                    continue
+                self.files_to_remove.extend(file_path for file_path, _ in conversion.parquet_files)
+                if not conversion.success:
+                    msg = f"File {csv_filename} could not be written as parquet. Reason: {conversion.error}"
+                    LOG.warn(log_json(self.request_id, msg, self.error_context))
+                    results[csv_filename] = (parquet_base_filename, conversion.daily_data_frames, False)
+                    continue
+                unique_keys.update(conversion.unique_keys)
+                results[csv_filename] = (parquet_base_filename, conversion.daily_data_frames, True)
+                uploads[csv_filename] = [
+                    (file_path, upload_pool.submit(self._upload_parquet_file, file_path, file_name))
+                    for file_path, file_name in conversion.parquet_files
+                ]
+
+        parquet_file = self._check_parallel_uploads(results, uploads)
+        try:
+            if parquet_file and self.create_table and not self.presto_table_exists.get(self.report_type):
+                self.create_parquet_table(parquet_file)
+            create_enabled_keys(self._schema_name, self.enabled_tags_model, unique_keys)
+        except Exception as err:
+            msg = f"Parquet table for {parquet_file} could not be created. Reason: {str(err)}"
+            LOG.warn(log_json(self.request_id, msg, self.error_context))
+            return [(results[csv_filename][0], results[csv_filename][1], False) for csv_filename in csv_filenames]
+
+        return [results[csv_filename] for csv_filename in csv_filenames]
+
+    def _check_parallel_uploads(self, results, uploads):
+        """Mark files with a failed upload as failed and return the last successfully uploaded parquet file."""
+        parquet_file = None
+        for csv_filename, file_uploads in uploads.items():
+            if not all(upload.result() for _, upload in file_uploads):
+                parquet_base_filename, daily_data_frames, _ = results[csv_filename]
+                results[csv_filename] = (parquet_base_filename, daily_data_frames, False)
+            elif file_uploads:
+                parquet_file = file_uploads[-1][0]
+        return parquet_file
+
     def create_parquet_table(self, parquet_file, daily=False):
         """Create parquet table."""
         processor = self._set_report_processor(parquet_file, daily=daily)
@@ -357,57 +569,49 @@ class ParquetReportProcessor:
         if not daily:
             processor.create_bill(bill_date=bill_date)
         processor.get_or_create_postgres_partition(bill_date=bill_date)
-        processor.sync_hive_partitions()
+        processor.sync_hive_partitions(bill_date=bill_date)
         self.presto_table_exists[self.report_type] = True
 
-    def convert_csv_to_parquet(self, csv_filename):  # noqa: C901
+    def convert_csv_to_parquet(self, csv_filename):
         """Convert CSV file to parquet and send to S3."""
-        daily_data_frames = []
-        converters = self._get_column_converters()
         csv_path, csv_name = os.path.split(csv_filename)
-        unique_keys = set()
-        parquet_file = None
         parquet_base_filename = csv_name.replace(self.file_extension, "")
-        kwargs = {}
-        if self.file_extension == CSV_GZIP_EXT:
-            kwargs = {"compression": "gzip"}
 
         msg = f"Running convert_csv_to_parquet on file {csv_filename}."
         LOG.info(log_json(self.request_id, msg, self.error_context))
 
-        try:
-            col_names = pd.read_csv(csv_filename, nrows=0, **kwargs).columns
-            converters.update({col: str for col in col_names if col not in converters})
-            with pd.read_csv(
-                csv_filename, converters=converters, chunksize=settings.PARQUET_PROCESSING_BATCH_SIZE, **kwargs
-            ) as reader:
-                for i, data_frame in enumerate(reader):
-                    parquet_filename = f"{parquet_base_filename}_{i}{PARQUET_EXT}"
-                    parquet_file = f"{self.local_path}/{parquet_filename}"
-                    if self.post_processor:
-                        data_frame = self.post_processor(data_frame)
-                        if isinstance(data_frame, tuple):
-                            data_frame, data_frame_tag_keys = data_frame
-                            LOG.info(f"Updating unique keys with {len(data_frame_tag_keys)} keys")
-                            unique_keys.update(data_frame_tag_keys)
-                            LOG.info(f"Total unique keys for file {len(unique_keys)}")
-                    if self.daily_data_processor is not None:
-                        daily_data_frames.append(self.daily_data_processor(data_frame))
+        conversion = convert_csv_file(
+            csv_filename,
+            self.local_path,
+            parquet_base_filename,
+            self._get_column_converters(),
+            post_processor=self.post_processor,
+            daily_data_processor=self.daily_data_processor,
+            streaming=self.use_streaming_engine,
+            upload=self._upload_parquet_file,
+        )
+        self.files_to_remove.extend(file_path for file_path, _ in conversion.parquet_files)
+        parquet_file = conversion.parquet_files[-1][0] if conversion.parquet_files else None
+        if conversion.error:
+            msg = (
+                f"File {csv_filename} could not be written as parquet to temp file {parquet_file}. "
+                f"Reason: {conversion.error}"
+            )
+            LOG.warn(log_json(self.request_id, msg, self.error_context))
+        if not conversion.success:
+            return parquet_base_filename, conversion.daily_data_frames, False
 
-                    success = self._write_parquet_to_file(parquet_file, parquet_filename, data_frame)
-                    if not success:
-                        return parquet_base_filename, daily_data_frames, False
+        LOG.info(f"Total unique keys for file {len(conversion.unique_keys)}")
+        try:
             if self.create_table and not self.presto_table_exists.get(self.report_type):
                 self.create_parquet_table(parquet_file)
-            create_enabled_keys(self._schema_name, self.enabled_tags_model, unique_keys)
+            create_enabled_keys(self._schema_name, self.enabled_tags_model, conversion.unique_keys)
         except Exception as err:
-            msg = (
-                f"File {csv_filename} could not be written as parquet to temp file {parquet_file}. Reason: {str(err)}"
-            )
+            msg = f"Parquet table for {parquet_file} could not be created. Reason: {str(err)}"
             LOG.warn(log_json(self.request_id, msg, self.error_context))
-            return parquet_base_filename, daily_data_frames, False
+            return parquet_base_filename, conversion.daily_data_frames, False
 
-        return parquet_base_filename, daily_data_frames, True
+        return parquet_base_filename, conversion.daily_data_frames, True
 
     def create_daily_parquet(self, parquet_base_filename, data_frames):
         """Create a parquet file for daily aggregated data."""
@@ -429,8 +633,12 @@ class ParquetReportProcessor:
 
     def _write_parquet_to_file(self, file_path, file_name, data_frame, file_type=None):
         """Write Parquet file and send to S3."""
-        s3_path = self._determin_s3_path(file_type)
         data_frame.to_parquet(file_path, allow_truncated_timestamps=True, coerce_timestamps="ms", index=False)
+        return self._upload_parquet_file(file_path, file_name, file_type=file_type)
+
+    def _upload_parquet_file(self, file_path, file_name, file_type=None):
+        """Send a local Parquet file to S3."""
+        s3_path = self._determin_s3_path(file_type)
         try:
             with open(file_path, "rb") as fin:
                 copy_data_to_s3_bucket(
@@ -0,0 +1,157 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Stream CSV reports into a bounded number of parquet files with pyarrow."""
+import logging
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from masu.util.common import convert_columns
+
+LOG = logging.getLogger(__name__)
+# pyarrow reads 1MB blocks by default, which makes every record batch only a few thousand rows
+DEFAULT_BLOCK_SIZE = 64 * 1024 * 1024
+
+
+class StreamingParquetWriter:
+    """Convert a CSV file to parquet one record batch at a time.
+
+    Record batches are read with ``pyarrow.csv.open_csv``, passed through the
+    same column converters and post processors as the pandas engine, and
+    written to a single ``ParquetWriter`` in row groups of ``row_group_size``
+    rows. A new file is only started once ``max_rows_per_file`` rows have been
+    written, so a report becomes a few well-sized files instead of one file
+    per processing batch. The daily data processor runs once per row group and
+    its results are combined into one daily data frame per parquet file.
+    """
+
+    def __init__(
+        self,
+        csv_filename,
+        converters,
+        post_processor=None,
+        daily_data_processor=None,
+        row_group_size=200000,
+        max_rows_per_file=2000000,
+        block_size=DEFAULT_BLOCK_SIZE,
+    ):
+        """Initialize the writer."""
+        self.csv_filename = csv_filename
+        self.converters = converters
+        self.post_processor = post_processor
+        self.daily_data_processor = daily_data_processor
+        self.row_group_size = row_group_size
+        self.max_rows_per_file = max_rows_per_file
+        self.block_size = block_size
+        self.unique_keys = set()
+        self.daily_data_frames = []
+        # Every (file_path, file_name) started, including a file left unfinished by an error
+        self.parquet_files = []
+        self.schema = None
+        self._writer = None
+        self._file_path = None
+        self._file_name = None
+        self._file_index = 0
+        self._rows_in_file = 0
+        self._pending = []
+        self._pending_frames = []
+        self._file_daily_frames = []
+
+    def _open_csv(self):
+        """Open a streaming reader that keeps every column as a string."""
+        column_names = pd.read_csv(self.csv_filename, nrows=0).columns
+        read_options = pa_csv.ReadOptions()
+        if self.block_size:
+            read_options.block_size = self.block_size
+        convert_options = pa_csv.ConvertOptions(
+            column_types={column: pa.string() for column in column_names}, strings_can_be_null=False
+        )
+        return pa_csv.open_csv(self.csv_filename, read_options=read_options, convert_options=convert_options)
+
+    def _process_batch(self, batch):
+        """Run a record batch through the converters and post processors."""
+        data_frame = convert_columns(batch.to_pandas(), self.converters)
+        if self.post_processor:
+            data_frame = self.post_processor(data_frame)
+            if isinstance(data_frame, tuple):
+                data_frame, data_frame_tag_keys = data_frame
+                self.unique_keys.update(data_frame_tag_keys)
+        if self.daily_data_processor is not None:
+            self._pending_frames.append(data_frame)
+
+        table = pa.Table.from_pandas(data_frame, preserve_index=False)
+        if self.schema is None:
+            self.schema = table.schema
+        return table.cast(self.schema)
+
+    def _flush(self, local_path, file_name_format, upload):
+        """Write the pending tables as a row group, rolling over to a new file when this one is full."""
+        if not self._pending:
+            return True
+        if self._writer is None:
+            self._file_name = file_name_format.format(index=self._file_index)
+            self._file_path = f"{local_path}/{self._file_name}"
+            self.parquet_files.append((self._file_path, self._file_name))
+            self._writer = pq.ParquetWriter(
+                self._file_path, self.schema, coerce_timestamps="ms", allow_truncated_timestamps=True
+            )
+        table = pa.concat_tables(self._pending)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self._rows_in_file += table.num_rows
+        self._pending = []
+        if self._pending_frames:
+            self._file_daily_frames.append(self.daily_data_processor(pd.concat(self._pending_frames)))
+            self._pending_frames = []
+        if self._rows_in_file >= self.max_rows_per_file:
+            return self._close(upload)
+        return True
+
+    def _close(self, upload):
+        """Close the current file and hand it to upload."""
+        if self._writer is None:
+            return True
+        self._writer.close()
+        self._writer = None
+        self._file_index += 1
+        self._rows_in_file = 0
+        if self._file_daily_frames:
+            self.daily_data_frames.append(pd.concat(self._file_daily_frames, ignore_index=True))
+            self._file_daily_frames = []
+        LOG.info(f"Finished writing {self._file_path}.")
+        return upload(self._file_path, self._file_name)
+
+    def write(self, local_path, file_name_format, upload):
+        """Write the parquet files, handing each completed file to ``upload``.
+
+        Args:
+            local_path (str): The local directory to write parquet files to
+            file_name_format (str): The file name with an {index} placeholder for the file number
+            upload (callable): Called with (file_path, file_name) for each finished file, returns success
+
+        Returns:
+            (str, bool): The path of the last parquet file written and whether every upload succeeded
+
+        """
+        pending_rows = 0
+        try:
+            for batch in self._open_csv():
+                if not batch.num_rows:
+                    continue
+                table = self._process_batch(batch)
+                self._pending.append(table)
+                pending_rows += table.num_rows
+                if pending_rows >= self.row_group_size:
+                    pending_rows = 0
+                    if not self._flush(local_path, file_name_format, upload):
+                        return self._file_path, False
+            success = self._flush(local_path, file_name_format, upload) and self._close(upload)
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        return self._file_path, success
@@ -4,6 +4,9 @@
 #
 """Processor for Parquet files."""
 import logging
+import os
+import threading
+import time
 
 import prestodb
 import pyarrow.parquet as pq
@@ -15,6 +18,8 @@ from prestodb.exceptions import PrestoUserError
 from tenant_schemas.utils import schema_context
 
 from api.models import Provider
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
+from masu.prometheus_stats import TRINO_DDL_CALLS_SAVED_COUNTER
 from masu.util.common import strip_characters_from_column_name
 from reporting.models import PartitionedTable
 
@@ -29,6 +34,76 @@ class TrinoExecutionError(Exception):
     """Postgres summary table is not defined."""
 
 
+class TrinoCatalogCache:
+    """Process-wide record of the Trino schemas, tables and partitions known to exist.
+
+    Keys are tuples that start with the schema name, optionally followed by the
+    table name and a partition. Entries expire after TRINO_CATALOG_CACHE_TTL
+    seconds so objects dropped outside of this process are eventually noticed.
+    """
+
+    def __init__(self):
+        """Initialize the cache."""
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def exists(self, key):
+        """Return whether key was recorded within the TTL."""
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._entries[key]
+                return False
+            return True
+
+    def add(self, key):
+        """Record that key exists."""
+        with self._lock:
+            self._entries[key] = time.monotonic() + settings.TRINO_CATALOG_CACHE_TTL
+
+    def invalidate(self, schema_name=None, table_name=None):
+        """Forget every entry, or only those for a schema or one of its tables."""
+        with self._lock:
+            if schema_name is None:
+                self._entries.clear()
+                return
+            prefix = (schema_name,) if table_name is None else (schema_name, table_name)
+            for key in [key for key in self._entries if key[: len(prefix)] == prefix]:
+                del self._entries[key]
+
+
+CATALOG_CACHE = TrinoCatalogCache()
+_CONNECTIONS = threading.local()
+
+
+def get_trino_connection(schema_name):
+    """Return this thread's Trino connection for schema_name, opening it on first use.
+
+    Connections keep their HTTP session, so statements reuse keep-alive
+    connections instead of paying for a new connect on every statement.
+    """
+    if getattr(_CONNECTIONS, "pid", None) != os.getpid():
+        _CONNECTIONS.pid = os.getpid()
+        _CONNECTIONS.by_schema = {}
+    conn = _CONNECTIONS.by_schema.get(schema_name)
+    if conn is None:
+        conn = prestodb.dbapi.connect(
+            host=settings.PRESTO_HOST, port=settings.PRESTO_PORT, user="admin", catalog="hive", schema=schema_name
+        )
+        _CONNECTIONS.by_schema[schema_name] = conn
+    return conn
+
+
+def close_trino_connection(schema_name):
+    """Close and forget this thread's Trino connection for schema_name."""
+    by_schema = getattr(_CONNECTIONS, "by_schema", {})
+    conn = by_schema.pop(schema_name, None)
+    if conn is not None:
+        conn.close()
+
+
 class ReportParquetProcessorBase:
     def __init__(self, manifest_id, account, s3_path, provider_uuid, parquet_local_path, column_types, table_name):
         self._manifest_id = manifest_id
@@ -49,17 +124,16 @@ class ReportParquetProcessorBase:
         """Execute presto SQL."""
         rows = []
         try:
-            with prestodb.dbapi.connect(
-                host=settings.PRESTO_HOST, port=settings.PRESTO_PORT, user="admin", catalog="hive", schema=schema_name
-            ) as conn:
-                cur = conn.cursor()
-                cur.execute(sql)
-                rows = cur.fetchall()
-                LOG.debug(f"_execute_sql rows: {str(rows)}. Type: {type(rows)}")
+            cur = get_trino_connection(schema_name).cursor()
+            cur.execute(sql)
+            rows = cur.fetchall()
+            LOG.debug(f"_execute_sql rows: {str(rows)}. Type: {type(rows)}")
         except PrestoUserError as err:
             LOG.error(err)
         except (PrestoExternalError, PrestoQueryError) as err:
             LOG.error(err)
+            close_trino_connection(schema_name)
+            CATALOG_CACHE.invalidate(self._schema_name)
             msg = "There was an error running Trino SQL"
             raise TrinoExecutionError(msg)
         return rows
@@ -70,19 +144,27 @@ class ReportParquetProcessorBase:
 
     def schema_exists(self):
         """Check if schema exists."""
+        if CATALOG_CACHE.exists((self._schema_name,)):
+            TRINO_DDL_CALLS_SAVED_COUNTER.labels(statement="show_schemas").inc()
+            return True
         schema_check_sql = f"SHOW SCHEMAS LIKE '{self._schema_name}'"
         schema = self._execute_sql(schema_check_sql, "default")
         LOG.info("Checking for schema")
         if schema:
+            CATALOG_CACHE.add((self._schema_name,))
             return True
         return False
 
     def table_exists(self):
         """Check if table exists."""
+        if CATALOG_CACHE.exists((self._schema_name, self._table_name)):
+            TRINO_DDL_CALLS_SAVED_COUNTER.labels(statement="show_tables").inc()
+            return True
         table_check_sql = f"SHOW TABLES LIKE '{self._table_name}'"
         table = self._execute_sql(table_check_sql, self._schema_name)
         LOG.info("Checking for table")
         if table:
+            CATALOG_CACHE.add((self._schema_name, self._table_name))
             return True
         return False
 
@@ -91,6 +173,7 @@ class ReportParquetProcessorBase:
         schema_create_sql = f"CREATE SCHEMA IF NOT EXISTS {self._schema_name}"
         self._execute_sql(schema_create_sql, "default")
         LOG.info(f"Create Trino/Hive schema SQL: {schema_create_sql}")
+        CATALOG_CACHE.add((self._schema_name,))
         return self._schema_name
 
     def _generate_column_list(self):
@@ -133,12 +216,15 @@ class ReportParquetProcessorBase:
         sql = self._generate_create_table_sql()
         self._execute_sql(sql, self._schema_name)
         LOG.info(f"Presto Table: {self._table_name} created.")
+        CATALOG_CACHE.add((self._schema_name, self._table_name))
 
     def get_or_create_postgres_partition(self, bill_date, **kwargs):
         """Make sure we have a Postgres partition for a billing period."""
         table_name = self.postgres_summary_table._meta.db_table
         partition_type = kwargs.get("partition_type", PartitionedTable.RANGE)
         partition_column = kwargs.get("partition_column", "usage_start")
+        if PARTITION_REGISTRY.exists(self._schema_name, table_name, bill_date):
+            return False
 
         with schema_context(self._schema_name):
             record, created = PartitionedTable.objects.get_or_create(
@@ -154,14 +240,29 @@ class ReportParquetProcessorBase:
                 },
                 active=True,
             )
+        PARTITION_REGISTRY.add(self._schema_name, table_name, bill_date)
         if created:
             LOG.info(f"Created a new partition for {record.partition_of_table_name} : {record.table_name}")
 
         return created
 
-    def sync_hive_partitions(self):
-        """Sync hive partition metadata for new partitions."""
+    def sync_hive_partitions(self, bill_date=None):
+        """Sync hive partition metadata for new partitions.
+
+        When bill_date is given the sync is skipped if this source's partition
+        for that month has already been synced, since files added to an existing
+        partition are visible to Trino without a sync.
+        """
+        partition_key = None
+        if bill_date is not None:
+            partition = (str(self._provider_uuid), bill_date.strftime("%Y"), bill_date.strftime("%m"))
+            partition_key = (self._schema_name, self._table_name, partition)
+            if CATALOG_CACHE.exists(partition_key):
+                TRINO_DDL_CALLS_SAVED_COUNTER.labels(statement="sync_partition_metadata").inc()
+                return
         LOG.info("Syncing Trino/Hive partitions.")
         sql = f"CALL system.sync_partition_metadata('{self._schema_name}', '{self._table_name}', 'FULL')"
         LOG.info(sql)
         self._execute_sql(sql, self._schema_name)
+        if partition_key:
+            CATALOG_CACHE.add(partition_key)
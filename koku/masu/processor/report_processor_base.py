@@ -3,9 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Report Processor base class."""
-import csv
 import gzip
-import io
 import logging
 
 import ciso8601
@@ -25,6 +23,62 @@ from reporting_common import REPORT_COLUMN_MAP
 LOG = logging.getLogger(__name__)
 
 
+class DimensionLoader:
+    """Collect unseen dimension rows and load them with one bulk upsert.
+
+    A processor queues a row with ``add`` for each dimension key a batch
+    references that is not in its maps yet. ``load`` then writes all queued
+    rows with ReportDBAccessorBase.bulk_upsert_rows and returns their ids
+    keyed the same way.
+    """
+
+    def __init__(self, table, conflict_columns=None, match_columns=None, update=False):
+        """Initialize the loader.
+
+        Args:
+            table (DjangoModel): The dimension table
+            conflict_columns (list): The unique columns to check conflict on
+            match_columns (list): The columns that find an existing row. Default: conflict_columns
+            update (bool): Overwrite existing rows with the latest queued data instead of leaving them alone
+
+        """
+        self.table = table
+        self.conflict_columns = conflict_columns
+        self.match_columns = match_columns
+        self.update = update
+        self._pending = {}
+
+    def __contains__(self, key):
+        """Return whether a row is queued for key."""
+        return key in self._pending
+
+    def add(self, key, data):
+        """Queue data for key, keeping the first row unless this loader updates."""
+        if self.update:
+            self._pending[key] = data
+        else:
+            self._pending.setdefault(key, data)
+
+    def load(self, report_db_accessor):
+        """Upsert the queued rows and return their ids keyed on the queued keys."""
+        if not self._pending:
+            return {}
+        keys = list(self._pending)
+        rows = list(self._pending.values())
+        update_columns = None
+        if self.update:
+            update_columns = list(dict.fromkeys(column for row in rows for column in row))
+        ids = report_db_accessor.bulk_upsert_rows(
+            self.table,
+            rows,
+            conflict_columns=self.conflict_columns,
+            match_columns=self.match_columns,
+            update_columns=update_columns,
+        )
+        self._pending = {}
+        return dict(zip(keys, ids))
+
+
 class ReportProcessorBase:
     """
     Download cost reports from a provider.
@@ -100,23 +154,13 @@ class ReportProcessorBase:
             return gzip.open, "rt"
         return open, "r"  # assume uncompressed by default
 
-    def _write_processed_rows_to_csv(self):
-        """Output CSV content to file stream object."""
-        values = [tuple(item.values()) for item in self.processed_report.line_items]
-
-        file_obj = io.StringIO()
-        writer = csv.writer(file_obj, delimiter=",", quoting=csv.QUOTE_MINIMAL, quotechar='"')
-        writer.writerows(values)
-        file_obj.seek(0)
-
-        return file_obj
-
     def _save_to_db(self, temp_table, report_db_accessor):
         """Save current batch of records to the database."""
         columns = tuple(self.processed_report.line_items[0].keys())
-        csv_file = self._write_processed_rows_to_csv()
+        column_types = report_db_accessor.report_schema.column_types.get(self.table_name._meta.db_table, {})
+        rows = (tuple(item.values()) for item in self.processed_report.line_items)
 
-        report_db_accessor.bulk_insert_rows(csv_file, temp_table, columns)
+        report_db_accessor.bulk_insert_row_values(rows, temp_table, columns, column_types)
 
     def _should_process_row(self, row, date_column, is_full_month, is_finalized=None):
         """Determine if we want to process this row.
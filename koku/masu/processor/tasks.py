@@ -13,6 +13,7 @@ from decimal import InvalidOperation
 from celery import chain
 from dateutil import parser
 from django.db import connection
+from django.db import transaction
 from django.db.utils import IntegrityError
 from tenant_schemas.utils import schema_context
 
@@ -21,10 +22,13 @@ from api.common import log_json
 from api.iam.models import Tenant
 from api.provider.models import Provider
 from koku import celery_app
+from koku.cache import invalidate_tag_keys_cache_for_tenant
 from koku.cache import invalidate_view_cache_for_tenant_and_source_type
 from koku.middleware import KokuTenantMiddleware
+from masu.config import Config
 from masu.database.cost_model_db_accessor import CostModelDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
+from masu.database.report_db_accessor_base import ReportDBAccessorBase
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.database.report_stats_db_accessor import ReportStatsDBAccessor
 from masu.external.accounts_accessor import AccountsAccessor
@@ -39,14 +43,21 @@ from masu.processor.report_processor import ReportProcessorDBError
 from masu.processor.report_processor import ReportProcessorError
 from masu.processor.report_summary_updater import ReportSummaryUpdater
 from masu.processor.report_summary_updater import ReportSummaryUpdaterCloudError
+from masu.processor.worker_cache import create_single_task_cache_key
 from masu.processor.worker_cache import WorkerCache
-from reporting.models import AWS_MATERIALIZED_VIEWS
+from reporting.models import AWS_DIMENSION_TABLES
+from reporting.models import AWS_UI_SUMMARY_TABLES
+from reporting.models import AZURE_DIMENSION_TABLES
 from reporting.models import AZURE_MATERIALIZED_VIEWS
+from reporting.models import GCP_DIMENSION_TABLES
 from reporting.models import GCP_MATERIALIZED_VIEWS
-from reporting.models import OCP_MATERIALIZED_VIEWS
+from reporting.models import OCP_DIMENSION_TABLES
 from reporting.models import OCP_ON_AWS_MATERIALIZED_VIEWS
 from reporting.models import OCP_ON_AZURE_MATERIALIZED_VIEWS
 from reporting.models import OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
+from reporting.models import OCP_ON_INFRASTRUCTURE_UI_SUMMARY_TABLES
+from reporting.models import OCP_UI_SUMMARY_TABLES
+from reporting_common.models import RefreshRequest
 
 LOG = logging.getLogger(__name__)
 
@@ -61,6 +72,9 @@ UPDATE_COST_MODEL_COSTS_QUEUE = "cost_model"
 UPDATE_SUMMARY_TABLES_QUEUE = "summary"
 VACUUM_SCHEMA_QUEUE = "summary"
 
+REFRESH_REQUESTS_KEY = "masu.processor.tasks.refresh_requests"
+REFRESH_REQUESTS_TIMEOUT = 3600
+
 # any additional queues should be added to this list
 QUEUE_LIST = [
     DEFAULT,
@@ -252,9 +266,9 @@ def remove_expired_data(schema_name, provider, simulate, provider_uuid=None, que
     )
     LOG.info(stmt)
     _remove_expired_data(schema_name, provider, simulate, provider_uuid)
-    refresh_materialized_views.s(schema_name, provider, provider_uuid=provider_uuid).apply_async(
-        queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE
-    )
+    schedule_refresh_materialized_views.s(
+        schema_name, provider, provider_uuid=provider_uuid, queue_name=queue_name
+    ).apply_async(queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE)
 
 
 @celery_app.task(name="masu.processor.tasks.summarize_reports", queue=SUMMARIZE_REPORTS_QUEUE)
@@ -362,6 +376,8 @@ def update_summary_tables(  # noqa: C901
         updater = ReportSummaryUpdater(schema_name, provider_uuid, manifest_id)
         start_date, end_date = updater.update_daily_tables(start_date, end_date)
         updater.update_summary_tables(start_date, end_date)
+        # The tag summary tables were rebuilt, report requests must see the new tag keys
+        invalidate_tag_keys_cache_for_tenant(schema_name)
     except ReportSummaryUpdaterCloudError as ex:
         LOG.info(f"Failed to correlate OpenShift metrics for provider: {str(provider_uuid)}. Error: {str(ex)}")
     except Exception as ex:
@@ -370,7 +386,7 @@ def update_summary_tables(  # noqa: C901
         raise ex
 
     if not provider_uuid:
-        refresh_materialized_views.s(
+        schedule_refresh_materialized_views.s(
             schema_name, provider, manifest_id=manifest_id, queue_name=queue_name
         ).apply_async(queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE)
         return
@@ -395,8 +411,14 @@ def update_summary_tables(  # noqa: C901
     if cost_model is not None:
         linked_tasks = update_cost_model_costs.s(schema_name, provider_uuid, start_date, end_date).set(
             queue=queue_name or UPDATE_COST_MODEL_COSTS_QUEUE
-        ) | refresh_materialized_views.si(
-            schema_name, provider, provider_uuid=provider_uuid, manifest_id=manifest_id
+        ) | schedule_refresh_materialized_views.si(
+            schema_name,
+            provider,
+            provider_uuid=provider_uuid,
+            manifest_id=manifest_id,
+            queue_name=queue_name,
+            start_date=start_date,
+            end_date=end_date,
         ).set(
             queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE
         )
@@ -407,8 +429,14 @@ def update_summary_tables(  # noqa: C901
             f" provider_uuid: {provider_uuid}"
         )
         LOG.info(stmt)
-        linked_tasks = refresh_materialized_views.s(
-            schema_name, provider, provider_uuid=provider_uuid, manifest_id=manifest_id
+        linked_tasks = schedule_refresh_materialized_views.s(
+            schema_name,
+            provider,
+            provider_uuid=provider_uuid,
+            manifest_id=manifest_id,
+            queue_name=queue_name,
+            start_date=start_date,
+            end_date=end_date,
         ).set(queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE)
 
     chain(linked_tasks).apply_async()
@@ -513,9 +541,20 @@ def update_cost_model_costs(
 )
 # fmt: on
 def refresh_materialized_views(  # noqa: C901
-    schema_name, provider_type, manifest_id=None, provider_uuid=None, synchronous=False, queue_name=None
+    schema_name,
+    provider_type,
+    manifest_id=None,
+    provider_uuid=None,
+    synchronous=False,
+    queue_name=None,
+    start_date=None,
+    end_date=None,
 ):
-    """Refresh the database's materialized views for reporting."""
+    """Refresh the database's materialized views and UI summary tables for reporting.
+
+    The AWS and OCP UI summary tables are only rebuilt for the source and dates that
+    were summarized, the remaining materialized views are refreshed in full.
+    """
     task_name = "masu.processor.tasks.refresh_materialized_views"
     cache_args = [schema_name, provider_type]
     if not synchronous:
@@ -530,51 +569,231 @@ def refresh_materialized_views(  # noqa: C901
                 provider_uuid=provider_uuid,
                 synchronous=synchronous,
                 queue_name=queue_name,
+                start_date=start_date,
+                end_date=end_date,
             ).apply_async(queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE)
             return
         worker_cache.lock_single_task(task_name, cache_args, timeout=600)
+    try:
+        _refresh_materialized_views(
+            schema_name, provider_type, [provider_uuid], [manifest_id], start_date=start_date, end_date=end_date
+        )
+    except Exception as ex:
+        if not synchronous:
+            worker_cache.release_single_task(task_name, cache_args)
+        raise ex
+
+    if not synchronous:
+        worker_cache.release_single_task(task_name, cache_args)
+
+
+def _refresh_request_date(value):
+    """Return a refresh request date as a YYYY-MM-DD string, None meaning the whole window."""
+    if value is None or isinstance(value, str):
+        return value[:10] if value else None
+    return value.strftime("%Y-%m-%d")
+
+
+def merge_refresh_requests(pending, request):
+    """Union two refresh requests for the same schema and provider type.
+
+    The merged request covers every source and manifest of both requests and the
+    smallest date range containing both, where a missing date means the whole window.
+    """
+    start_dates = (pending["start_date"], request["start_date"])
+    end_dates = (pending["end_date"], request["end_date"])
+    return {
+        "provider_uuids": list(dict.fromkeys(pending["provider_uuids"] + request["provider_uuids"])),
+        "manifest_ids": list(dict.fromkeys(pending["manifest_ids"] + request["manifest_ids"])),
+        "start_date": None if None in start_dates else min(start_dates),
+        "end_date": None if None in end_dates else max(end_dates),
+        "requests": pending["requests"] + request["requests"],
+    }
+
+
+@celery_app.task(
+    name="masu.processor.tasks.schedule_refresh_materialized_views", queue=REFRESH_MATERIALIZED_VIEWS_QUEUE
+)
+def schedule_refresh_materialized_views(
+    schema_name,
+    provider_type,
+    manifest_id=None,
+    provider_uuid=None,
+    queue_name=None,
+    start_date=None,
+    end_date=None,
+):
+    """Add a refresh request to the pending refresh of this schema and provider type.
+
+    The first request starts a flush_refresh_requests task delayed by REFRESH_COALESCE_SECONDS,
+    requests arriving before it runs are merged into the same refresh.
+    """
+    with schema_context("public"):
+        RefreshRequest.objects.create(
+            schema_name=schema_name,
+            provider_type=provider_type,
+            provider_uuids=[str(provider_uuid) if provider_uuid else None],
+            manifest_ids=[manifest_id],
+            start_date=_refresh_request_date(start_date),
+            end_date=_refresh_request_date(end_date),
+        )
+
+    if not _schedule_refresh_flush(schema_name, provider_type, queue_name):
+        LOG.info(f"Merged refresh request for {schema_name} {provider_type} into the pending refresh.")
+
+
+def _schedule_refresh_flush(schema_name, provider_type, queue_name=None):
+    """Start a delayed flush_refresh_requests unless one is already pending, return whether it was started."""
+    cache_key = create_single_task_cache_key(REFRESH_REQUESTS_KEY, [schema_name, provider_type])
+    if not WorkerCache.cache.add(f"{cache_key}:scheduled", "true", REFRESH_REQUESTS_TIMEOUT):
+        return False
+    flush_refresh_requests.s(schema_name, provider_type, queue_name=queue_name).apply_async(
+        queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE, countdown=Config.REFRESH_COALESCE_SECONDS
+    )
+    return True
+
+
+def _take_refresh_requests(schema_name, provider_type):
+    """Delete the pending refresh requests of a schema and provider type and return them merged."""
+    request = None
+    with schema_context("public"), transaction.atomic():
+        rows = list(
+            RefreshRequest.objects.select_for_update().filter(schema_name=schema_name, provider_type=provider_type)
+        )
+        RefreshRequest.objects.filter(id__in=[row.id for row in rows]).delete()
+    for row in rows:
+        row_request = {
+            "provider_uuids": row.provider_uuids,
+            "manifest_ids": row.manifest_ids,
+            "start_date": _refresh_request_date(row.start_date),
+            "end_date": _refresh_request_date(row.end_date),
+            "requests": row.requests,
+        }
+        request = merge_refresh_requests(request, row_request) if request else row_request
+    return request
+
+
+def _put_back_refresh_request(schema_name, provider_type, request, queue_name=None):
+    """Store a merged refresh request again and schedule the flush that retries it."""
+    with schema_context("public"):
+        RefreshRequest.objects.create(
+            schema_name=schema_name,
+            provider_type=provider_type,
+            provider_uuids=request["provider_uuids"],
+            manifest_ids=request["manifest_ids"],
+            start_date=request["start_date"],
+            end_date=request["end_date"],
+            requests=request["requests"],
+        )
+    _schedule_refresh_flush(schema_name, provider_type, queue_name)
+
+
+@celery_app.task(name="masu.processor.tasks.flush_refresh_requests", queue=REFRESH_MATERIALIZED_VIEWS_QUEUE)
+def flush_refresh_requests(schema_name, provider_type, queue_name=None):
+    """Run a single refresh for every request merged since the flush was scheduled."""
+    task_name = "masu.processor.tasks.refresh_materialized_views"
+    cache_args = [schema_name, provider_type]
+    cache = WorkerCache.cache
+    lock_key = create_single_task_cache_key(task_name, cache_args)
+    # cache.add only succeeds for one caller, so checking and taking the lock is a single step
+    if not cache.add(lock_key, "true", 600):
+        LOG.info(f"Task {task_name} already running for {cache_args}. Delaying flush.")
+        flush_refresh_requests.s(schema_name, provider_type, queue_name=queue_name).apply_async(
+            queue=queue_name or REFRESH_MATERIALIZED_VIEWS_QUEUE, countdown=Config.REFRESH_COALESCE_SECONDS
+        )
+        return
+
+    try:
+        cache_key = create_single_task_cache_key(REFRESH_REQUESTS_KEY, cache_args)
+        # Later requests schedule a new flush rather than joining a refresh that has already started
+        cache.delete(f"{cache_key}:scheduled")
+        request = _take_refresh_requests(schema_name, provider_type)
+        if not request:
+            return
+
+        worker_stats.REFRESH_REQUESTS_COALESCED_COUNTER.labels(provider_type=provider_type).inc(
+            request["requests"] - 1
+        )
+        LOG.info(
+            f"Refreshing {schema_name} {provider_type} for {request['requests']} requests, "
+            f"sources {request['provider_uuids']}, {request['start_date']} to {request['end_date']}."
+        )
+        try:
+            _refresh_materialized_views(
+                schema_name,
+                provider_type,
+                request["provider_uuids"],
+                request["manifest_ids"],
+                start_date=request["start_date"],
+                end_date=request["end_date"],
+            )
+        except Exception:
+            _put_back_refresh_request(schema_name, provider_type, request, queue_name)
+            raise
+    finally:
+        cache.delete(lock_key)
+
+
+def _refresh_materialized_views(  # noqa: C901
+    schema_name, provider_type, provider_uuids, manifest_ids, start_date=None, end_date=None
+):
+    """Refresh the views and summary tables of a provider type for one or more sources."""
+    sources = [None] if None in provider_uuids else provider_uuids
     materialized_views = ()
+    # (tables, source_uuid) pairs, a source_uuid of None rebuilds every source in the date range
+    ui_summary_tables = ()
+    dimension_tables = ()
     if provider_type in (Provider.PROVIDER_AWS, Provider.PROVIDER_AWS_LOCAL):
-        materialized_views = (
-            AWS_MATERIALIZED_VIEWS + OCP_ON_AWS_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
-        )
+        materialized_views = OCP_ON_AWS_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
+        ui_summary_tables = [(AWS_UI_SUMMARY_TABLES, source_uuid) for source_uuid in sources]
+        ui_summary_tables.append((OCP_ON_INFRASTRUCTURE_UI_SUMMARY_TABLES, None))
+        dimension_tables = [(AWS_DIMENSION_TABLES, source_uuid) for source_uuid in sources]
+        dimension_tables.append((OCP_DIMENSION_TABLES, None))
     elif provider_type in (Provider.PROVIDER_OCP):
         materialized_views = (
-            OCP_MATERIALIZED_VIEWS
-            + OCP_ON_AWS_MATERIALIZED_VIEWS
-            + OCP_ON_AZURE_MATERIALIZED_VIEWS
-            + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
+            OCP_ON_AWS_MATERIALIZED_VIEWS + OCP_ON_AZURE_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
         )
+        ui_summary_tables = [(OCP_UI_SUMMARY_TABLES, source_uuid) for source_uuid in sources]
+        dimension_tables = [(OCP_DIMENSION_TABLES, source_uuid) for source_uuid in sources]
     elif provider_type in (Provider.PROVIDER_AZURE, Provider.PROVIDER_AZURE_LOCAL):
         materialized_views = (
             AZURE_MATERIALIZED_VIEWS + OCP_ON_AZURE_MATERIALIZED_VIEWS + OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS
         )
+        ui_summary_tables = [(OCP_ON_INFRASTRUCTURE_UI_SUMMARY_TABLES, None)]
+        dimension_tables = [(AZURE_DIMENSION_TABLES, source_uuid) for source_uuid in sources]
+        dimension_tables.append((OCP_DIMENSION_TABLES, None))
     elif provider_type in (Provider.PROVIDER_GCP, Provider.PROVIDER_GCP_LOCAL):
         materialized_views = GCP_MATERIALIZED_VIEWS
-    try:
-        with schema_context(schema_name):
-            for view in materialized_views:
-                table_name = view._meta.db_table
-                with connection.cursor() as cursor:
-                    cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {table_name}")
-                    LOG.info(f"Refreshed {table_name}.")
+        dimension_tables = [(GCP_DIMENSION_TABLES, source_uuid) for source_uuid in sources]
 
-        invalidate_view_cache_for_tenant_and_source_type(schema_name, provider_type)
+    with ReportDBAccessorBase(schema_name) as accessor:
+        for tables, source_uuid in ui_summary_tables:
+            accessor.populate_ui_summary_tables(tables, start_date, end_date, source_uuid)
+            LOG.info(f"Populated {len(tables)} UI summary tables for source {source_uuid}.")
+
+    with schema_context(schema_name):
+        for view in materialized_views:
+            table_name = view._meta.db_table
+            with connection.cursor() as cursor:
+                cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {table_name}")
+                LOG.info(f"Refreshed {table_name}.")
 
+    # The dimension tables are read from the summary tables and views refreshed above
+    with ReportDBAccessorBase(schema_name) as accessor:
+        for tables, source_uuid in dimension_tables:
+            accessor.populate_dimension_tables(tables, source_uuid)
+
+    invalidate_view_cache_for_tenant_and_source_type(schema_name, provider_type)
+
+    for provider_uuid in provider_uuids:
         if provider_uuid:
             ProviderDBAccessor(provider_uuid).set_data_updated_timestamp()
+    for manifest_id in manifest_ids:
         if manifest_id:
             # Processing for this monifest should be complete after this step
             with ReportManifestDBAccessor() as manifest_accessor:
                 manifest = manifest_accessor.get_manifest_by_id(manifest_id)
                 manifest_accessor.mark_manifest_as_completed(manifest)
-    except Exception as ex:
-        if not synchronous:
-            worker_cache.release_single_task(task_name, cache_args)
-        raise ex
-
-    if not synchronous:
-        worker_cache.release_single_task(task_name, cache_args)
 
 
 @celery_app.task(name="masu.processor.tasks.vacuum_schema", queue=DEFAULT)
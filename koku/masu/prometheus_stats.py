@@ -48,6 +48,20 @@ KAFKA_CONNECTION_ERRORS_COUNTER = Counter(
     "kafka_connection_errors", "Number of Kafka connection errors", registry=WORKER_REGISTRY
 )
 
+TRINO_DDL_CALLS_SAVED_COUNTER = Counter(
+    "trino_ddl_calls_saved",
+    "Number of Trino/Hive metadata statements skipped by the catalog cache",
+    ["statement"],
+    registry=WORKER_REGISTRY,
+)
+
+REFRESH_REQUESTS_COALESCED_COUNTER = Counter(
+    "refresh_requests_coalesced",
+    "Number of refresh requests merged into another pending refresh",
+    ["provider_type"],
+    registry=WORKER_REGISTRY,
+)
+
 CELERY_ERRORS_COUNTER = Counter("celery_errors", "Number of celery errors", registry=WORKER_REGISTRY)
 
 DOWNLOAD_BACKLOG = Gauge("download_backlog", "Number of celery tasks in the download queue", registry=WORKER_REGISTRY)
@@ -2,6 +2,7 @@
 from api.iam.test.iam_test_case import IamTestCase
 from api.models import Customer
 from api.provider.models import Provider
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
 
 
 class MasuTestCase(IamTestCase):
@@ -17,6 +18,8 @@ class MasuTestCase(IamTestCase):
 
     def setUp(self):
         """Set up each test case."""
+        # Partitions created by a previous test are rolled back with its transaction
+        PARTITION_REGISTRY.invalidate()
         self.customer, __ = Customer.objects.get_or_create(account_id=self.acct, schema_name=self.schema)
 
         self.aws_provider = Provider.objects.filter(type=Provider.PROVIDER_AWS_LOCAL).first()
@@ -13,14 +13,17 @@ from unittest.mock import patch
 import django.apps
 from dateutil import relativedelta
 from django.db import connection
+from django.db.backends.utils import CursorWrapper
 from django.db.models import F
 from django.db.models import Max
 from django.db.models import Min
 from django.db.models import Sum
 from django.db.models.query import QuerySet
+from django.test.utils import override_settings
 from tenant_schemas.utils import schema_context
 
 from api.utils import DateHelper
+from api.utils import materialized_view_month_start
 from koku.database import get_model
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database import OCP_REPORT_TABLE_MAP
@@ -28,16 +31,28 @@ from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.cost_model_db_accessor import CostModelDBAccessor
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
+from masu.database.report_db_accessor_base import CopyRowStream
+from masu.database.report_db_accessor_base import encode_copy_trino
+from masu.database.report_db_accessor_base import get_copy_encoder
+from masu.database.report_db_accessor_base import PARTITION_REGISTRY
+from masu.database.report_db_accessor_base import ReportDBAccessorBase
+from masu.database.report_db_accessor_base import ReportDBAccessorException
 from masu.database.report_db_accessor_base import ReportSchema
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.external.date_accessor import DateAccessor
 from masu.test import MasuTestCase
 from masu.test.database.helpers import map_django_field_type_to_python_type
 from masu.test.database.helpers import ReportObjectCreator
+from reporting.models import AWS_DIMENSION_TABLES
+from reporting.models import AWS_UI_SUMMARY_TABLES
+from reporting.models import PartitionedTable
 from reporting.provider.aws.models import AWSCostEntryLineItemDailySummary
 from reporting.provider.aws.models import AWSCostEntryProduct
 from reporting.provider.aws.models import AWSCostEntryReservation
+from reporting.provider.aws.models import AWSCostSummaryByAccount
+from reporting.provider.aws.models import AWSCostSummaryByRegion
 from reporting.provider.aws.models import AWSEnabledTagKeys
+from reporting.provider.aws.models import AWSRegionDimension
 from reporting.provider.aws.models import AWSTagsSummary
 from reporting_common import REPORT_COLUMN_MAP
 
@@ -207,11 +222,9 @@ class AWSReportDBAccessorTest(MasuTestCase):
                 columns[name] = "FLOAT"
         return columns
 
-    def test_bulk_insert_rows(self):
-        """Test that the bulk insert method inserts line items."""
-        # Get data commited for foreign key relationships to work
+    def test_bulk_insert_row_values(self):
+        """Test that line items are streamed to the database with typed COPY encoders."""
         with schema_context(self.schema):
-
             table_name = AWS_CUR_TABLE_MAP["line_item"]
             query = self.accessor._get_db_obj_query(table_name)
             initial_count = query.count()
@@ -223,18 +236,15 @@ class AWSReportDBAccessorTest(MasuTestCase):
             data_dict["cost_entry_product_id"] = cost_entry.cost_entry_product_id
             data_dict["cost_entry_pricing_id"] = cost_entry.cost_entry_pricing_id
             data_dict["cost_entry_reservation_id"] = cost_entry.cost_entry_reservation_id
+            data_dict["line_item_type"] = "Usage\twith\\escapes"
 
             columns = list(data_dict.keys())
-            values = list(data_dict.values())
-            file_obj = self.creator.create_csv_file_stream(values)
+            column_types = self.accessor.report_schema.column_types[table_name]
+            self.accessor.bulk_insert_row_values([tuple(data_dict.values())], table_name, columns, column_types)
 
-            self.accessor.bulk_insert_rows(file_obj, table_name, columns)
             new_query = self.accessor._get_db_obj_query(table_name)
-
-            new_count = new_query.count()
+            self.assertEqual(new_query.count(), initial_count + 1)
             new_line_item = new_query.order_by("-id").first()
-
-            self.assertTrue(new_count > initial_count)
             for column in columns:
                 value = getattr(new_line_item, column)
                 if isinstance(value, datetime.datetime):
@@ -242,6 +252,147 @@ class AWSReportDBAccessorTest(MasuTestCase):
                     data_dict[column] = self.creator.stringify_datetime(data_dict[column])
                 self.assertEqual(value, data_dict[column])
 
+    def test_populate_ui_summary_tables(self):
+        """Test that the UI summary tables are rebuilt for only the requested source and dates."""
+        window_start = materialized_view_month_start(DateHelper()).date()
+        with schema_context(self.schema):
+            daily_summary = AWSCostEntryLineItemDailySummary.objects.filter(
+                source_uuid=self.aws_provider_uuid, usage_start__gte=window_start
+            )
+            expected_cost = daily_summary.aggregate(cost=Sum("unblended_cost"))["cost"]
+            AWSCostSummaryByAccount.objects.filter(source_uuid=self.aws_provider_uuid).update(unblended_cost=0)
+            other_sources = AWSCostSummaryByAccount.objects.exclude(source_uuid=self.aws_provider_uuid)
+            other_source_ids = set(other_sources.values_list("id", flat=True))
+
+        self.accessor.populate_ui_summary_tables(AWS_UI_SUMMARY_TABLES, source_uuid=self.aws_provider_uuid)
+
+        with schema_context(self.schema):
+            summary = AWSCostSummaryByAccount.objects.filter(source_uuid=self.aws_provider_uuid)
+            self.assertAlmostEqual(summary.aggregate(cost=Sum("unblended_cost"))["cost"], expected_cost, places=5)
+            self.assertFalse(summary.filter(usage_start__lt=window_start).exists())
+            self.assertEqual(set(other_sources.values_list("id", flat=True)), other_source_ids)
+
+    @patch.object(
+        AWSReportDBAccessor,
+        "get_existing_partitions",
+        autospec=True,
+        side_effect=ReportDBAccessorBase.get_existing_partitions,
+    )
+    def test_ensure_partitions(self, mock_get_partitions):
+        """Test that the partition catalog is only read for tables and months not yet known."""
+        table_name = AWSCostEntryLineItemDailySummary._meta.db_table
+        this_month = DateHelper().this_month_start.date()
+        future_month = this_month + relativedelta.relativedelta(months=24)
+
+        self.accessor.ensure_partitions(AWSCostEntryLineItemDailySummary, [this_month])
+        self.accessor.ensure_partitions(AWSCostEntryLineItemDailySummary, [this_month.replace(day=5)])
+        self.assertEqual(mock_get_partitions.call_count, 1)
+
+        self.accessor.ensure_partitions(AWSCostEntryLineItemDailySummary, [this_month, future_month])
+        self.accessor.ensure_partitions(AWSCostEntryLineItemDailySummary, [future_month])
+        self.assertEqual(mock_get_partitions.call_count, 2)
+        self.assertTrue(PARTITION_REGISTRY.exists(self.schema, table_name, future_month))
+        with schema_context(self.schema):
+            self.assertTrue(
+                PartitionedTable.objects.filter(table_name=f"{table_name}_{future_month.strftime('%Y_%m')}").exists()
+            )
+
+        PARTITION_REGISTRY.invalidate(self.schema)
+        self.accessor.ensure_partitions(AWSCostEntryLineItemDailySummary, [this_month])
+        self.assertEqual(mock_get_partitions.call_count, 3)
+
+    @override_settings(PARTITION_REGISTRY_TTL=-1)
+    def test_partition_registry_expires(self):
+        """Test that loaded and added partitions are forgotten once the TTL has passed."""
+        partition_start = datetime.date(2021, 2, 1)
+        PARTITION_REGISTRY.load(self.schema, "reporting_table", [partition_start])
+
+        self.assertFalse(PARTITION_REGISTRY.exists(self.schema, "reporting_table", partition_start))
+        self.assertFalse(PARTITION_REGISTRY.is_loaded(self.schema, "reporting_table"))
+
+        added_start = datetime.date(2021, 3, 1)
+        PARTITION_REGISTRY.add(self.schema, "reporting_table", added_start)
+        self.assertFalse(PARTITION_REGISTRY.exists(self.schema, "reporting_table", added_start))
+        PARTITION_REGISTRY.add(self.schema, "reporting_table", added_start)
+        self.assertEqual(PARTITION_REGISTRY.missing(self.schema, "reporting_table", [added_start]), {added_start})
+
+    def test_populate_dimension_tables(self):
+        """Test that the dimension tables hold the distinct summary values of only the requested source."""
+        with schema_context(self.schema):
+            AWSRegionDimension.objects.all().delete()
+            AWSRegionDimension.objects.create(source_uuid=self.aws_provider_uuid, usage_account_id="1", region="gone")
+            expected = set(
+                AWSCostSummaryByRegion.objects.filter(source_uuid=self.aws_provider_uuid, region__isnull=False)
+                .values_list("usage_account_id", "region")
+                .distinct()
+            )
+
+        self.accessor.populate_dimension_tables(AWS_DIMENSION_TABLES, source_uuid=self.aws_provider_uuid)
+
+        with schema_context(self.schema):
+            regions = AWSRegionDimension.objects.values_list("source_uuid", "usage_account_id", "region")
+            self.assertEqual(len(regions), len(expected))
+            self.assertEqual({(usage_account_id, region) for _, usage_account_id, region in regions}, expected)
+            self.assertEqual({str(source_uuid) for source_uuid, _, _ in regions}, {self.aws_provider_uuid})
+
+    def test_copy_row_stream(self):
+        """Test that rows are encoded in the COPY text format as they are read."""
+        encoders = [get_copy_encoder("IntegerField"), get_copy_encoder("BooleanField"), get_copy_encoder(None)]
+        rows = [(1, True, "a\tb"), (2, False, ""), (None, None, "c\\d\ne")]
+        expected = "1\tt\ta\\tb\n2\tf\t\\N\n\\N\t\\N\tc\\\\d\\ne\n"
+
+        self.assertEqual(CopyRowStream(rows, encoders).read(), expected)
+
+        stream = CopyRowStream(rows, encoders)
+        chunks = []
+        chunk = stream.read(5)
+        while chunk:
+            self.assertLessEqual(len(chunk), 5)
+            chunks.append(chunk)
+            chunk = stream.read(5)
+        self.assertEqual("".join(chunks), expected)
+
+        stream = CopyRowStream(rows, encoders)
+        first_line = stream.readline()
+        self.assertEqual(first_line, "1\tt\ta\\tb\n")
+        self.assertEqual(first_line + stream.read(), expected)
+
+    def test_encode_copy_trino(self):
+        """Test that Trino values keep empty strings and encode maps and arrays."""
+        self.assertEqual(encode_copy_trino(None), "\\N")
+        self.assertEqual(encode_copy_trino(""), "")
+        self.assertEqual(encode_copy_trino(False), "f")
+        self.assertEqual(encode_copy_trino({"app": "a\tb"}), '{"app": "a\\\\tb"}')
+        self.assertEqual(encode_copy_trino(["i-1", 'i"2', None]), '{"i-1","i\\\\"2",NULL}')
+
+    @patch("masu.database.report_db_accessor_base.kpdb.connect")
+    def test_execute_presto_insert_with_copy(self, mock_connect):
+        """Test that a Trino insert into Postgres runs its query in Trino and loads the rows with COPY."""
+        mock_cursor = mock_connect.return_value.cursor.return_value
+        mock_cursor.fetchmany.side_effect = [[["copy\tsink", True], ["", False]], [["copy_sink", True]], []]
+        sql = f"""
+INSERT INTO postgres.{self.schema}.reporting_awsenabledtagkeys (
+    key,
+    enabled
+)
+SELECT key, enabled FROM aws_tags;
+"""
+        row_count = self.accessor._execute_presto_insert_with_copy(sql)
+
+        self.assertEqual(row_count, 3)
+        mock_cursor.execute.assert_called_once_with("SELECT key, enabled FROM aws_tags")
+        with schema_context(self.schema):
+            keys = dict(
+                AWSEnabledTagKeys.objects.filter(key__in=["copy\tsink", "", "copy_sink"]).values_list("key", "enabled")
+            )
+        self.assertEqual(keys, {"copy\tsink": True, "": False, "copy_sink": True})
+
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_raw_sql_query")
+    def test_execute_presto_insert_with_copy_other_statement(self, mock_presto):
+        """Test that statements which do not insert into Postgres are run in Trino."""
+        self.accessor._execute_presto_insert_with_copy("SELECT 1")
+        mock_presto.assert_called_with(self.schema, "SELECT 1")
+
     def test_insert_on_conflict_do_nothing_with_conflict(self):
         """Test that an INSERT succeeds ignoring the conflicting row."""
         table_name = AWS_CUR_TABLE_MAP["product"]
@@ -334,6 +485,86 @@ class AWSReportDBAccessorTest(MasuTestCase):
                 previous_count = count
                 previous_row_id = row_id
 
+    def test_bulk_upsert_rows(self):
+        """Test that new and existing rows are upserted in bulk and their ids returned in order."""
+        table_name = AWS_CUR_TABLE_MAP["product"]
+        table = AWSCostEntryProduct
+        with schema_context(self.schema):
+            existing = self.creator.create_columns_for_table(table_name)
+            existing_id = self.accessor.insert_on_conflict_do_nothing(table, dict(existing))
+            data = [self.creator.create_columns_for_table(table_name), existing]
+            query = self.accessor._get_db_obj_query(table_name)
+            initial_count = query.count()
+
+            row_ids = self.accessor.bulk_upsert_rows(table, data, conflict_columns=["sku", "product_name", "region"])
+
+            self.assertEqual(query.count(), initial_count + 1)
+            self.assertEqual(len(row_ids), 2)
+            self.assertEqual(row_ids[1], existing_id)
+            self.assertEqual(query.get(id=row_ids[0]).sku, data[0]["sku"])
+            self.assertEqual(self.accessor.bulk_upsert_rows(table, []), [])
+
+    def test_bulk_upsert_rows_rereads_ids_missed_by_snapshot(self):
+        """Test that a conflicting row the upsert statement can not see is looked up again."""
+        table_name = AWS_CUR_TABLE_MAP["product"]
+        table = AWSCostEntryProduct
+        execute = CursorWrapper.execute
+
+        def hide_existing_rows(cursor, sql, params=None):
+            """Simulate a row committed by another worker after the upsert's snapshot was taken."""
+            return execute(cursor, sql.replace("coalesce(i.id, e.id)", "i.id"), params)
+
+        with schema_context(self.schema):
+            existing = self.creator.create_columns_for_table(table_name)
+            existing_id = self.accessor.insert_on_conflict_do_nothing(table, dict(existing))
+            data = [self.creator.create_columns_for_table(table_name), existing]
+
+            with patch.object(CursorWrapper, "execute", autospec=True, side_effect=hide_existing_rows):
+                row_ids = self.accessor.bulk_upsert_rows(
+                    table, data, conflict_columns=["sku", "product_name", "region"]
+                )
+
+            self.assertNotIn(None, row_ids)
+            self.assertEqual(row_ids[1], existing_id)
+
+    def test_bulk_upsert_rows_missing_id(self):
+        """Test that an error is raised when the id of an upserted row can not be found."""
+        table_name = AWS_CUR_TABLE_MAP["product"]
+        table = AWSCostEntryProduct
+        execute = CursorWrapper.execute
+
+        def drop_ids(cursor, sql, params=None):
+            """Return no id from either the upsert or the lookup."""
+            sql = sql.replace("coalesce(i.id, e.id)", "NULL::integer")
+            sql = sql.replace("WHERE t.row_index", "WHERE FALSE AND t.row_index")
+            return execute(cursor, sql, params)
+
+        with schema_context(self.schema):
+            data = [self.creator.create_columns_for_table(table_name)]
+            with patch.object(CursorWrapper, "execute", autospec=True, side_effect=drop_ids):
+                with self.assertRaises(ReportDBAccessorException):
+                    self.accessor.bulk_upsert_rows(table, data, conflict_columns=["sku", "product_name", "region"])
+
+    def test_bulk_upsert_rows_update(self):
+        """Test that conflicting rows are updated when update columns are given."""
+        table_name = AWS_CUR_TABLE_MAP["reservation"]
+        table = AWSCostEntryReservation
+        with schema_context(self.schema):
+            data = self.creator.create_columns_for_table(table_name)
+            data["number_of_reservations"] = 1
+            row_id = self.accessor.insert_on_conflict_do_nothing(
+                table, dict(data), conflict_columns=["reservation_arn"]
+            )
+
+            data["number_of_reservations"] = 2
+            row_ids = self.accessor.bulk_upsert_rows(
+                table, [data], conflict_columns=["reservation_arn"], update_columns=list(data.keys())
+            )
+
+            self.assertEqual(row_ids, [row_id])
+            query = self.accessor._get_db_obj_query(table_name)
+            self.assertEqual(query.get(id=row_id).number_of_reservations, 2)
+
     def test_get_primary_key(self):
         """Test that a primary key is returned."""
         table_name = random.choice(self.foreign_key_tables)
@@ -363,7 +594,7 @@ class AWSReportDBAccessorTest(MasuTestCase):
     def test_clean_data(self):
         """Test that data cleaning produces proper data types."""
         table_name = random.choice(self.all_tables)
-        column_types = self.report_schema.column_types[table_name]
+        column_types = self.accessor.report_schema.column_types[table_name]
 
         data = self.creator.create_columns_for_table(table_name)
         cleaned_data = self.accessor.clean_data(data, table_name)
@@ -978,6 +1209,23 @@ class AWSReportDBAccessorTest(MasuTestCase):
         )
         mock_presto.assert_called()
 
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_insert_with_copy")
+    @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_raw_sql_query")
+    def test_populate_line_item_daily_summary_table_presto_copy_sink(self, mock_presto, mock_copy):
+        """Test that the summary is loaded with COPY when the copy sink is enabled for the source type."""
+        dh = DateHelper()
+        start_date = dh.this_month_start.date()
+        end_date = dh.this_month_end.date()
+
+        with override_settings(ENABLE_TRINO_COPY_SINK_SOURCE_TYPE=["AWS"]):
+            self.accessor.populate_line_item_daily_summary_table_presto(
+                start_date, end_date, self.aws_provider_uuid, 1, 0
+            )
+        mock_copy.assert_called()
+        expected_insert = f"INSERT INTO postgres.{self.schema}.reporting_awscostentrylineitem_daily_summary"
+        self.assertIn(expected_insert, mock_copy.call_args[0][0])
+        mock_presto.assert_not_called()
+
     @patch("masu.database.aws_report_db_accessor.AWSReportDBAccessor._execute_presto_multipart_sql_query")
     def test_populate_ocp_on_aws_cost_daily_summary_presto(self, mock_presto):
         """Test that we construst our SQL and query using Presto."""
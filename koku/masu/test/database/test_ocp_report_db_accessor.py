@@ -3,9 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Test the OCPReportDBAccessor utility object."""
+import logging
+import os
 import random
 import string
+import time
 import uuid
+from unittest import skipUnless
 from unittest.mock import patch
 
 from dateutil import relativedelta
@@ -13,6 +17,7 @@ from django.db import connection
 from django.db.models import Max
 from django.db.models import Min
 from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
 from tenant_schemas.utils import schema_context
 
 from api.iam.test.iam_test_case import FakePrestoConn
@@ -40,6 +45,8 @@ from reporting.provider.ocp.models import OCPProject
 from reporting.provider.ocp.models import OCPPVC
 from reporting_common import REPORT_COLUMN_MAP
 
+LOG = logging.getLogger(__name__)
+
 
 class OCPReportDBAccessorTest(MasuTestCase):
     """Test Cases for the OCPReportDBAccessor object."""
@@ -2511,6 +2518,97 @@ select * from eek where val1 in {{report_period_ids}} ;
                                 )
                                 self.assertAlmostEqual(actual_diff, expected_diff)
 
+    def test_populate_tag_usage_costs_per_rate_type(self):
+        """Test that each rate type adds the tag rate costs of every matching row in one UPDATE."""
+        dh = DateHelper()
+        start_date = dh.this_month_start
+        end_date = dh.this_month_end
+        self.cluster_id = "OCP-on-Azure"
+        infrastructure_rates = {
+            "cpu_core_usage_per_hour": {"app": {"banking": 5, "unused": 1}},
+            "memory_gb_request_per_hour": {"app": {"banking": 2}},
+        }
+        supplementary_rates = {
+            "cpu_core_request_per_hour": {"app": {"banking": 3}},
+            "storage_gb_usage_per_month": {"app": {"banking": 7}},
+        }
+        fields = (
+            "uuid",
+            "pod_labels",
+            "volume_labels",
+            "pod_usage_cpu_core_hours",
+            "pod_request_cpu_core_hours",
+            "pod_request_memory_gigabyte_hours",
+            "persistentvolumeclaim_usage_gigabyte_months",
+            "infrastructure_usage_cost",
+            "supplementary_usage_cost",
+        )
+
+        def expected_costs(row):
+            """Return the expected infrastructure and supplementary cost increase of a row by usage type."""
+            pod_banking = (row["pod_labels"] or {}).get("app") == "banking"
+            volume_banking = (row["volume_labels"] or {}).get("app") == "banking"
+            infrastructure = {"cpu": 0.0, "memory": 0.0, "storage": 0.0}
+            supplementary = {"cpu": 0.0, "memory": 0.0, "storage": 0.0}
+            if pod_banking:
+                infrastructure["cpu"] = 5 * float(row["pod_usage_cpu_core_hours"] or 0)
+                infrastructure["memory"] = 2 * float(row["pod_request_memory_gigabyte_hours"] or 0)
+                supplementary["cpu"] = 3 * float(row["pod_request_cpu_core_hours"] or 0)
+            if volume_banking:
+                supplementary["storage"] = 7 * float(row["persistentvolumeclaim_usage_gigabyte_months"] or 0)
+            return infrastructure, supplementary
+
+        with schema_context(self.schema):
+            qset = OCPUsageLineItemDailySummary.objects.filter(
+                cluster_id=self.cluster_id, usage_start__gte=start_date.date(), usage_start__lte=end_date.date()
+            )
+            before = {row["uuid"]: row for row in qset.values(*fields)}
+            self.assertTrue(any((row["pod_labels"] or {}).get("app") == "banking" for row in before.values()))
+
+            with CaptureQueriesContext(connection) as captured:
+                self.accessor.populate_tag_usage_costs(
+                    infrastructure_rates, supplementary_rates, start_date, end_date, self.cluster_id
+                )
+            updates = [query for query in captured.captured_queries if "UPDATE" in query["sql"]]
+            self.assertEqual(len(updates), 2)
+
+            for row in qset.values("uuid", "infrastructure_usage_cost", "supplementary_usage_cost"):
+                previous = before[row["uuid"]]
+                infrastructure, supplementary = expected_costs(previous)
+                for usage_type in ("cpu", "memory", "storage"):
+                    with self.subTest(uuid=row["uuid"], usage_type=usage_type):
+                        self.assertAlmostEqual(
+                            row["infrastructure_usage_cost"][usage_type]
+                            - previous["infrastructure_usage_cost"][usage_type],
+                            infrastructure[usage_type],
+                            places=6,
+                        )
+                        self.assertAlmostEqual(
+                            row["supplementary_usage_cost"][usage_type]
+                            - previous["supplementary_usage_cost"][usage_type],
+                            supplementary[usage_type],
+                            places=6,
+                        )
+
+    @skipUnless(os.environ.get("KOKU_BENCHMARKS"), "Set KOKU_BENCHMARKS to run benchmarks.")
+    def test_populate_tag_usage_costs_scales_with_tag_values(self):
+        """Benchmark tag rate application as the number of tag values grows."""
+        dh = DateHelper()
+        start_date = dh.this_month_start
+        end_date = dh.this_month_end
+        self.cluster_id = "OCP-on-Azure"
+        timings = {}
+        with schema_context(self.schema):
+            for value_count in (1, 30, 300):
+                tag_values = {f"unused-{i}": 1 for i in range(value_count - 1)}
+                tag_values["banking"] = 5
+                infrastructure_rates = {"cpu_core_usage_per_hour": {"app": tag_values}}
+
+                start = time.perf_counter()
+                self.accessor.populate_tag_usage_costs(infrastructure_rates, {}, start_date, end_date, self.cluster_id)
+                timings[value_count] = time.perf_counter() - start
+        LOG.info(f"populate_tag_usage_costs seconds by tag value count: {timings}")
+
     def test_update_line_item_daily_summary_with_enabled_tags(self):
         """Test that we filter the daily summary table's tags with only enabled tags."""
         dh = DateHelper()
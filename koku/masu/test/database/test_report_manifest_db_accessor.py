@@ -169,6 +169,21 @@ class ReportManifestDBAccessorTest(IamTestCase):
 
         self.assertFalse(ReportManifestDBAccessor().is_last_completed_datetime_null(manifest_id))
 
+    def test_get_usage_days(self):
+        """Test that the usage days of every report file in a manifest are combined."""
+        manifest_id = 123456789
+        self.assertIsNone(self.manifest_accessor.get_usage_days(manifest_id))
+        baker.make(CostUsageReportManifest, id=manifest_id)
+        baker.make(CostUsageReportStatus, manifest_id=manifest_id, report_name="one.csv")
+        baker.make(CostUsageReportStatus, manifest_id=manifest_id, report_name="two.csv")
+
+        self.manifest_accessor.set_usage_days(manifest_id, "one.csv", ["2021-02-03", "2021-02-01"])
+        self.assertIsNone(self.manifest_accessor.get_usage_days(manifest_id))
+
+        self.manifest_accessor.set_usage_days(manifest_id, "two.csv", ["2021-02-01", "2021-02-02"])
+        usage_days = [day.isoformat() for day in self.manifest_accessor.get_usage_days(manifest_id)]
+        self.assertEqual(usage_days, ["2021-02-01", "2021-02-02", "2021-02-03"])
+
     def test_get_s3_csv_cleared(self):
         """Test that s3 CSV clear status is reported."""
         with schema_context(self.schema):
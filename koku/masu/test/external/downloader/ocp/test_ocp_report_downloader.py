@@ -168,24 +168,33 @@ class OCPReportDownloaderTest(MasuTestCase):
         with tempfile.TemporaryDirectory() as td:
             filename = "storage_data.csv"
             file_path = f"{td}/{filename}"
-            with patch("masu.external.downloader.ocp.ocp_report_downloader.pd") as mock_pd:
-                with patch(
-                    "masu.external.downloader.ocp.ocp_report_downloader.utils.detect_type",
-                    return_value=("storage_usage", None),
-                ):
-                    mock_report = {
-                        "interval_start": ["2020-01-01 00:00:00 +UTC", "2020-01-02 00:00:00 +UTC"],
-                        "persistentvolumeclaim_labels": ["label1", "label2"],
-                    }
-                    df = pd.DataFrame(data=mock_report)
-                    mock_pd.read_csv.return_value = df
-                    daily_files = divide_csv_daily(file_path, filename)
-                    self.assertNotEqual([], daily_files)
-                    self.assertEqual(len(daily_files), 2)
-                    gen_files = ["storage_usage.2020-01-01.csv", "storage_usage.2020-01-02.csv"]
-                    expected = [{"filename": gen_file, "filepath": f"{td}/{gen_file}"} for gen_file in gen_files]
-                    for expected_item in expected:
-                        self.assertIn(expected_item, daily_files)
+            with patch(
+                "masu.external.downloader.ocp.ocp_report_downloader.utils.detect_type",
+                return_value=("storage_usage", None),
+            ):
+                mock_report = {
+                    "interval_start": [
+                        "2020-01-01 00:00:00 +UTC",
+                        "2020-01-02 00:00:00 +UTC",
+                        "2020-01-01 01:00:00 +UTC",
+                    ],
+                    "persistentvolumeclaim_labels": ["label1", "label2", ""],
+                }
+                df = pd.DataFrame(data=mock_report)
+                df.to_csv(file_path, index=False, header=True)
+                daily_files = divide_csv_daily(file_path, filename)
+                self.assertNotEqual([], daily_files)
+                self.assertEqual(len(daily_files), 2)
+                gen_files = ["storage_usage.2020-01-01.csv", "storage_usage.2020-01-02.csv"]
+                expected = [
+                    {"filename": gen_file, "filepath": f"{td}/{gen_file}", "date": gen_file.split(".")[1]}
+                    for gen_file in gen_files
+                ]
+                for expected_item in expected:
+                    self.assertIn(expected_item, daily_files)
+
+                first_day = pd.read_csv(f"{td}/storage_usage.2020-01-01.csv", dtype=str, na_filter=False)
+                self.assertEqual(first_day["persistentvolumeclaim_labels"].tolist(), ["label1", ""])
 
     def test_divide_csv_daily_failure(self):
         """Test the divide_csv_daily method throw error on reading CSV."""
@@ -194,12 +203,12 @@ class OCPReportDownloaderTest(MasuTestCase):
             filename = "storage_data.csv"
             file_path = f"{td}/{filename}"
             errorMsg = "CParserError: Error tokenizing data. C error: Expected 53 fields in line 1605634, saw 54"
-            with patch("masu.external.downloader.ocp.ocp_report_downloader.pd") as mock_pd:
+            with patch("masu.external.downloader.ocp.ocp_report_downloader.split_csv_daily") as mock_split:
                 with patch(
                     "masu.external.downloader.ocp.ocp_report_downloader.utils.detect_type",
                     return_value=("storage_usage", None),
                 ):
-                    mock_pd.read_csv.side_effect = Exception(errorMsg)
+                    mock_split.side_effect = Exception(errorMsg)
                     with patch("masu.external.downloader.ocp.ocp_report_downloader.LOG.error") as mock_debug:
                         with self.assertRaises(Exception):
                             divide_csv_daily(file_path, filename)
@@ -238,13 +247,14 @@ class OCPReportDownloaderTest(MasuTestCase):
     @override_settings(ENABLE_PARQUET_PROCESSING=True)
     @patch("masu.external.downloader.ocp.ocp_report_downloader.os")
     @patch("masu.external.downloader.ocp.ocp_report_downloader.copy_local_report_file_to_s3_bucket")
+    @patch("masu.external.downloader.ocp.ocp_report_downloader.ReportManifestDBAccessor.set_usage_days")
     @patch("masu.external.downloader.ocp.ocp_report_downloader.divide_csv_daily")
-    def test_create_daily_archives(self, mock_divide, mock_s3_copy, mock_os):
+    def test_create_daily_archives(self, mock_divide, mock_set_usage_days, mock_s3_copy, mock_os):
         """Test that this method returns a file list."""
         start_date = DateHelper().this_month_start
         daily_files = [
-            {"filename": "file_one", "filepath": "path/to/file_one"},
-            {"filename": "file_two", "filepath": "path/to/file_two"},
+            {"filename": "file_one", "filepath": "path/to/file_one", "date": "2021-02-01"},
+            {"filename": "file_two", "filepath": "path/to/file_two", "date": "2021-02-02"},
         ]
         expected_filenames = ["path/to/file_one", "path/to/file_two"]
 
@@ -255,6 +265,7 @@ class OCPReportDownloaderTest(MasuTestCase):
         result = create_daily_archives(1, "10001", self.ocp_provider_uuid, file_name, file_path, 1, start_date)
 
         self.assertEqual(result, expected_filenames)
+        mock_set_usage_days.assert_called_with(1, file_name, ["2021-02-01", "2021-02-02"])
 
         context = {"version": "1"}
         expected = [file_path]
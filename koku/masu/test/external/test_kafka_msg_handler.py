@@ -592,8 +592,8 @@ class KafkaMsgHandlerTest(MasuTestCase):
                                 shutil.rmtree(fake_dir)
                                 shutil.rmtree(fake_pvc_dir)
 
-    @patch("masu.external.kafka_msg_handler.TarFile.extractall", side_effect=raise_OSError)
-    def test_extract_bad_payload_not_tar(self, mock_extractall):
+    @patch("masu.external.kafka_msg_handler.TarFile.extractfile", side_effect=raise_OSError)
+    def test_extract_bad_payload_not_tar(self, mock_extractfile):
         """Test to verify extracting payload missing report files is not successful."""
         fake_account = {"provider_uuid": uuid.uuid4(), "provider_type": "OCP", "schema_name": "testschema"}
         payload_url = "http://insights-upload.com/quarnantine/file_to_validate"
@@ -614,6 +614,37 @@ class KafkaMsgHandlerTest(MasuTestCase):
                                 shutil.rmtree(fake_dir)
                                 shutil.rmtree(fake_pvc_dir)
 
+    def test_extract_payload_member_too_large(self):
+        """Test that a payload with an oversized file is rejected before it is written out."""
+        payload_url = "http://insights-upload.com/quarnantine/file_to_validate"
+        with requests_mock.mock() as m:
+            m.get(payload_url, content=self.tarball_file)
+
+            fake_dir = tempfile.mkdtemp()
+            with patch.object(Config, "INSIGHTS_LOCAL_REPORT_DIR", fake_dir):
+                with patch.object(Config, "PAYLOAD_MAX_MEMBER_SIZE", 1000):
+                    with self.assertRaises(msg_handler.KafkaMsgHandlerError):
+                        msg_handler.extract_payload(payload_url, "test_request_id")
+                    self.assertEqual(os.listdir(fake_dir), [])
+            shutil.rmtree(fake_dir)
+
+    def test_extract_report_files(self):
+        """Test that report files are streamed from the payload straight into the destination directory."""
+        payload_path = "./koku/masu/test/data/ocp/payload2.tar.gz"
+        manifest_path = "costreport3/5997a261-f23e-45d1-8e01-ee3c765f3aec/20210101-20210201/manifest.json"
+        report_files = [
+            "40e278e5-7bb8-4f3a-ad68-a5c05b2d7e6c_openshift_report.0.csv",
+            "40e278e5-7bb8-4f3a-ad68-a5c05b2d7e6c_openshift_report.1.csv",
+            "not_in_payload.csv",
+        ]
+        destination_dir = tempfile.mkdtemp()
+        extracted = msg_handler.extract_report_files(
+            "test_request_id", payload_path, manifest_path, report_files, destination_dir
+        )
+        self.assertEqual(extracted, set(report_files[:2]))
+        self.assertEqual(sorted(os.listdir(destination_dir)), report_files[:2])
+        shutil.rmtree(destination_dir)
+
     def test_extract_payload_bad_url(self):
         """Test to verify extracting payload exceptions are handled."""
         payload_url = "http://insights-upload.com/quarnantine/file_to_validate"
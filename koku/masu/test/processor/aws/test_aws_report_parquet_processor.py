@@ -107,3 +107,12 @@ class AWSReportProcessorParquetTest(MasuTestCase):
 
         with schema_context(self.schema):
             self.assertNotEqual(PartitionedTable.objects.filter(table_name=table_name).count(), 0)
+
+    def test_get_or_create_postgres_partition_registered(self):
+        """Test that a partition known to exist is not looked up in the catalog again."""
+        bill_date = DateHelper().next_month_start
+        self.assertTrue(self.processor.get_or_create_postgres_partition(bill_date))
+
+        with patch("masu.processor.report_parquet_processor_base.PartitionedTable.objects.get_or_create") as mock_get:
+            self.assertFalse(self.processor.get_or_create_postgres_partition(bill_date))
+            mock_get.assert_not_called()
@@ -24,6 +24,7 @@ from api.utils import DateHelper
 from masu.config import Config
 from masu.database import AWS_CUR_TABLE_MAP
 from masu.database.aws_report_db_accessor import AWSReportDBAccessor
+from masu.database.report_db_accessor_base import ReportDBAccessorBase
 from masu.database.report_manifest_db_accessor import ReportManifestDBAccessor
 from masu.exceptions import MasuProcessingError
 from masu.external import GZIP_COMPRESSED
@@ -454,6 +455,25 @@ class AWSReportProcessorTest(MasuTestCase):
             final_count = bill_table.objects.filter(finalized_datetime__isnull=False).count()
             self.assertEqual(final_count, 1)
 
+    @patch.object(
+        AWSReportDBAccessor,
+        "get_existing_partitions",
+        autospec=True,
+        side_effect=ReportDBAccessorBase.get_existing_partitions,
+    )
+    def test_process_reads_partition_catalog_once(self, mock_get_partitions):
+        """Test that the partition catalog is not queried again for every batch."""
+        processor = AWSReportProcessor(
+            schema_name=self.schema,
+            report_path=self.test_report,
+            compression=UNCOMPRESSED,
+            provider_uuid=self.aws_provider_uuid,
+        )
+        processor._batch_size = 2
+        processor.process()
+
+        mock_get_partitions.assert_called_once()
+
     def test_do_not_overwrite_finalized_bill_timestamp(self):
         """Test that a finalized bill timestamp does not get overwritten."""
         data = []
@@ -557,32 +577,6 @@ class AWSReportProcessorTest(MasuTestCase):
             for key in test_entry:
                 self.assertIn(key, ce_map)
 
-    def test_write_processed_rows_to_csv(self):
-        """Test that the CSV bulk upload file contains proper data."""
-        bill_id = self.processor._create_cost_entry_bill(self.row, self.accessor)
-        cost_entry_id = self.processor._create_cost_entry(self.row, bill_id, self.accessor)
-        product_id = self.processor._create_cost_entry_product(self.row, self.accessor)
-        pricing_id = self.processor._create_cost_entry_pricing(self.row, self.accessor)
-        reservation_id = self.processor._create_cost_entry_reservation(self.row, self.accessor)
-        self.processor._create_cost_entry_line_item(
-            self.row, cost_entry_id, bill_id, product_id, pricing_id, reservation_id, self.accessor
-        )
-
-        file_obj = self.processor._write_processed_rows_to_csv()
-
-        line_item_data = self.processor.processed_report.line_items.pop()
-        # Convert data to CSV format
-        expected_values = [str(value) if value else None for value in line_item_data.values()]
-
-        reader = csv.reader(file_obj)
-        new_row = next(reader)
-        actual = {}
-        for i, key in enumerate(line_item_data.keys()):
-            actual[key] = new_row[i] if new_row[i] else None
-
-        self.assertEqual(actual.keys(), line_item_data.keys())
-        self.assertEqual(list(actual.values()), expected_values)
-
     def test_get_data_for_table(self):
         """Test that a row is disected into appropriate data structures."""
 
@@ -848,6 +842,25 @@ class AWSReportProcessorTest(MasuTestCase):
 
         self.assertEqual(product_id, expected_id)
 
+    def test_create_cost_entry_objects(self):
+        """Test that a batch of rows loads each dimension table with one bulk upsert."""
+        with open(self.test_report_test_path, "r") as f:
+            rows = list(csv.DictReader(f))
+
+        with patch.object(self.accessor, "bulk_upsert_rows", wraps=self.accessor.bulk_upsert_rows) as mock_upsert:
+            bill_id = self.processor.create_cost_entry_objects(rows, self.accessor)
+            self.assertLessEqual(mock_upsert.call_count, 6)
+
+        self.assertEqual(len(self.processor.processed_report.line_items), len(rows))
+        self.assertEqual(bill_id, self.processor._create_cost_entry_bill(rows[-1], self.accessor))
+        with schema_context(self.schema):
+            for line_item in self.processor.processed_report.line_items:
+                cost_entry_id = line_item["cost_entry_id"]
+                self.assertEqual(
+                    self.accessor._get_db_obj_query(AWS_CUR_TABLE_MAP["cost_entry"]).get(id=cost_entry_id).bill_id,
+                    line_item["cost_entry_bill_id"],
+                )
+
     def test_check_for_finalized_bill_bill_is_finalized(self):
         """Verify that a file with invoice_id is marked as finalzed."""
         data = []
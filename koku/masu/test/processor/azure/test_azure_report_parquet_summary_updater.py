@@ -104,8 +104,11 @@ class AzureReportParquetSummaryUpdaterTest(MasuTestCase):
             markup_value = float(markup.get("value", 0)) / 100
 
         start_return, end_return = self.updater.update_summary_tables(start, end)
-        mock_delete.assert_called_with(self.azure_provider.uuid, expected_start, expected_end)
-        mock_presto.assert_called_with(
+        windows = list(date_range_pair(start, end, step=settings.TRINO_DATE_STEP))
+        self.assertEqual(mock_delete.call_count, len(windows))
+        for window_start, window_end in windows:
+            mock_delete.assert_any_call(self.azure_provider.uuid, window_start, window_end)
+        mock_presto.assert_any_call(
             expected_start, expected_end, self.azure_provider.uuid, current_bill_id, markup_value
         )
         mock_tag_update.assert_called_with(bill_ids, start, end)
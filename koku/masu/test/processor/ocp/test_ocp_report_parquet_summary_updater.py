@@ -6,6 +6,8 @@
 import datetime
 from unittest.mock import patch
 
+from django.core.cache import caches
+
 from api.utils import DateHelper
 from masu.database import OCP_REPORT_TABLE_MAP
 from masu.database.ocp_report_db_accessor import OCPReportDBAccessor
@@ -89,6 +91,32 @@ class OCPReportSummaryUpdaterTest(MasuTestCase):
         mock_tag_sum.assert_called()
         mock_vol_tag_sum.assert_called()
 
+    @patch(
+        "masu.processor.ocp.ocp_report_parquet_summary_updater.ReportManifestDBAccessor.get_usage_days",
+        return_value=[datetime.date(2021, 2, 3), datetime.date(2021, 2, 5), datetime.date(2021, 3, 1)],
+    )
+    def test_get_changed_days_range(self, mock_usage_days):
+        """Test that the dates are narrowed to the changed days once a full summary has run."""
+        start_date = datetime.date(2021, 2, 1)
+        end_date = datetime.date(2021, 2, 28)
+        caches["worker"].delete(self.updater._full_summary_key)
+
+        result = self.updater._get_changed_days_range(start_date, end_date)
+        self.assertEqual(result, (start_date, end_date))
+        self.assertFalse(self.updater._changed_days_only)
+        mock_usage_days.assert_not_called()
+
+        caches["worker"].set(self.updater._full_summary_key, True)
+        result = self.updater._get_changed_days_range(start_date, end_date)
+        self.assertEqual(result, (datetime.date(2021, 2, 3), datetime.date(2021, 2, 5)))
+        self.assertTrue(self.updater._changed_days_only)
+
+        mock_usage_days.return_value = None
+        result = self.updater._get_changed_days_range(start_date, end_date)
+        self.assertEqual(result, (start_date, end_date))
+        self.assertFalse(self.updater._changed_days_only)
+        caches["worker"].delete(self.updater._full_summary_key)
+
     def test_update_daily_tables(self):
         start_date = self.dh.today
         end_date = start_date
@@ -354,32 +354,6 @@ class OCPReportProcessorTest(MasuTestCase):
             for key in test_entry:
                 self.assertIn(key, ce_map)
 
-    def test_write_processed_rows_to_csv(self):
-        """Test that the CSV bulk upload file contains proper data."""
-        cluster_id = "12345"
-        report_period_id = self.ocp_processor._processor._create_report_period(
-            self.row, cluster_id, self.accessor, self.cluster_alias
-        )
-        report_id = self.ocp_processor._processor._create_report(self.row, report_period_id, self.accessor)
-        self.ocp_processor._processor._create_usage_report_line_item(
-            self.row, report_period_id, report_id, self.accessor
-        )
-
-        file_obj = self.ocp_processor._processor._write_processed_rows_to_csv()
-        line_item_data = self.ocp_processor._processor.processed_report.line_items.pop()
-        # Convert data to CSV format
-        expected_values = [str(value) if value else None for value in line_item_data.values()]
-
-        reader = csv.reader(file_obj, delimiter=",")
-        new_row = next(reader)
-
-        actual = {}
-        for i, key in enumerate(line_item_data.keys()):
-            actual[key] = new_row[i] if new_row[i] else None
-
-        self.assertEqual(actual.keys(), line_item_data.keys())
-        self.assertEqual(list(actual.values()), expected_values)
-
     def test_create_report_period(self):
         """Test that a report period id is returned."""
         table_name = OCP_REPORT_TABLE_MAP["report_period"]
@@ -6,12 +6,14 @@ import datetime
 import logging
 import os
 import shutil
+import tempfile
 from datetime import timedelta
 from functools import partial
 from pathlib import Path
 from unittest.mock import patch
 from unittest.mock import PropertyMock
 
+import billiard
 import faker
 import pandas as pd
 from django.test import override_settings
@@ -23,6 +25,7 @@ from masu.processor.aws.aws_report_parquet_processor import AWSReportParquetProc
 from masu.processor.azure.azure_report_parquet_processor import AzureReportParquetProcessor
 from masu.processor.gcp.gcp_report_parquet_processor import GCPReportParquetProcessor
 from masu.processor.ocp.ocp_report_parquet_processor import OCPReportParquetProcessor
+from masu.processor.parquet.parquet_report_processor import convert_csv_file
 from masu.processor.parquet.parquet_report_processor import CSV_EXT
 from masu.processor.parquet.parquet_report_processor import CSV_GZIP_EXT
 from masu.processor.parquet.parquet_report_processor import ParquetReportProcessor
@@ -31,6 +34,7 @@ from masu.processor.report_parquet_processor_base import ReportParquetProcessorB
 from masu.test import MasuTestCase
 from masu.util.aws.common import aws_generate_daily_data
 from masu.util.aws.common import aws_post_processor
+from masu.util.aws.common import get_column_converters as aws_column_converters
 from masu.util.azure.common import azure_generate_daily_data
 from masu.util.azure.common import azure_post_processor
 from masu.util.gcp.common import gcp_post_processor
@@ -537,6 +541,117 @@ class TestParquetReportProcessor(MasuTestCase):
         mock_partition.assert_called()
         mock_sync.assert_called()
 
+    def test_convert_csv_file(self):
+        """Test that a CSV file is converted to local parquet files only."""
+        local_path = tempfile.mkdtemp()
+        conversion = convert_csv_file(
+            "./koku/masu/test/data/test_cur.csv.gz",
+            local_path,
+            "test_cur",
+            aws_column_converters(),
+            post_processor=aws_post_processor,
+            daily_data_processor=aws_generate_daily_data,
+        )
+        self.assertTrue(conversion.success)
+        self.assertIsNone(conversion.error)
+        self.assertEqual(conversion.parquet_files, [(f"{local_path}/test_cur_0.parquet", "test_cur_0.parquet")])
+        self.assertTrue(os.path.exists(conversion.parquet_files[0][0]))
+        self.assertIsInstance(conversion.unique_keys, set)
+        self.assertEqual(len(conversion.daily_data_frames), 1)
+        shutil.rmtree(local_path)
+
+    def test_convert_csv_file_failure(self):
+        """Test that a failed conversion still reports the files it wrote."""
+        local_path = tempfile.mkdtemp()
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                conversion = convert_csv_file(
+                    "./koku/masu/test/data/test_cur.csv.gz",
+                    local_path,
+                    "test_cur",
+                    aws_column_converters(),
+                    streaming=streaming,
+                    upload=lambda file_path, file_name: False,
+                )
+                self.assertFalse(conversion.success)
+                self.assertEqual(conversion.parquet_files, [(f"{local_path}/test_cur_0.parquet", "test_cur_0.parquet")])
+
+        with patch("masu.processor.parquet.parquet_report_processor.convert_columns", side_effect=ValueError("bad")):
+            conversion = convert_csv_file(
+                "./koku/masu/test/data/test_cur.csv.gz", local_path, "test_cur", aws_column_converters()
+            )
+        self.assertFalse(conversion.success)
+        self.assertEqual(conversion.error, "bad")
+        self.assertEqual(conversion.parquet_files, [])
+        shutil.rmtree(local_path)
+
+    @override_settings(ENABLE_PARQUET_CONVERSION_POOL=True, PARQUET_CONVERSION_WORKERS=2)
+    @patch("masu.processor.parquet.parquet_report_processor.create_enabled_keys")
+    @patch("masu.processor.parquet.parquet_report_processor.ParquetReportProcessor.create_parquet_table")
+    @patch("masu.processor.parquet.parquet_report_processor.ParquetReportProcessor._upload_parquet_file")
+    def test_convert_files_in_parallel(self, mock_upload, mock_create_table, mock_enabled_keys):
+        """Test that split files are converted in a process pool and uploaded from this process."""
+        temp_dir = tempfile.mkdtemp()
+        file_list = []
+        for i in range(3):
+            file_path = f"{temp_dir}/test_cur_{i}.csv.gz"
+            shutil.copy("./koku/masu/test/data/test_cur.csv.gz", file_path)
+            file_list.append(file_path)
+        with open(f"{temp_dir}/test_cur_3.csv.gz", "wb") as f:
+            f.write(b"not a gzip file")
+        file_list.append(f"{temp_dir}/test_cur_3.csv.gz")
+        mock_upload.side_effect = lambda file_path, file_name: not file_name.startswith("test_cur_2")
+
+        report_processor = ParquetReportProcessor(
+            schema_name=self.schema,
+            report_path=self.report_path,
+            provider_uuid=self.aws_provider_uuid,
+            provider_type=Provider.PROVIDER_AWS_LOCAL,
+            manifest_id=self.manifest_id,
+            context={
+                "request_id": self.request_id,
+                "start_date": DateHelper().today,
+                "create_table": True,
+                "split_files": file_list,
+            },
+        )
+        self.assertEqual(report_processor.conversion_workers, 2)
+        results = report_processor.convert_files_in_parallel(file_list)
+
+        self.assertEqual([result[0] for result in results], ["test_cur_0", "test_cur_1", "test_cur_2", "test_cur_3"])
+        self.assertEqual([result[2] for result in results], [True, True, False, False])
+        self.assertEqual(mock_upload.call_count, 3)
+        self.assertEqual(
+            sorted(report_processor.files_to_remove),
+            [f"{report_processor.local_path}/test_cur_{i}_0.parquet" for i in range(3)],
+        )
+        mock_create_table.assert_called_once()
+        mock_enabled_keys.assert_called_once()
+        shutil.rmtree(temp_dir)
+
+    @override_settings(PARQUET_CONVERSION_WORKERS=2)
+    def test_conversion_workers(self):
+        """Test that the conversion pool is opt in and never used from a prefork worker process."""
+        report_processor = ParquetReportProcessor(
+            schema_name=self.schema,
+            report_path=self.report_path,
+            provider_uuid=self.aws_provider_uuid,
+            provider_type=Provider.PROVIDER_AWS_LOCAL,
+            manifest_id=self.manifest_id,
+            context={"request_id": self.request_id, "split_files": ["file_one", "file_two", "file_three"]},
+        )
+        self.assertEqual(report_processor.conversion_workers, 1)
+
+        with override_settings(ENABLE_PARQUET_CONVERSION_POOL=True):
+            self.assertEqual(report_processor.conversion_workers, 2)
+
+            # Celery prefork pool children are daemonic billiard processes
+            queue = billiard.Queue()
+            child = billiard.Process(target=lambda: queue.put(report_processor.conversion_workers), daemon=True)
+            child.start()
+            child.join()
+            self.assertEqual(queue.get(timeout=10), 1)
+
     @patch("masu.processor.parquet.parquet_report_processor.ParquetReportProcessor.convert_to_parquet")
     def test_process(self, mock_convert):
         """Test that the process method starts parquet conversion."""
@@ -0,0 +1,112 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+"""Test the StreamingParquetWriter."""
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from api.models import Provider
+from api.utils import DateHelper
+from masu.processor.parquet.parquet_report_processor import ParquetConversion
+from masu.processor.parquet.parquet_report_processor import ParquetReportProcessor
+from masu.processor.parquet.streaming_parquet_writer import StreamingParquetWriter
+from masu.test import MasuTestCase
+from masu.util.aws.common import aws_post_processor
+from masu.util.aws.common import get_column_converters
+
+
+class TestStreamingParquetWriter(MasuTestCase):
+    """Test cases for the StreamingParquetWriter."""
+
+    def setUp(self):
+        """Set up shared test variables."""
+        super().setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_file = os.path.join(self.temp_dir, "test_cur.csv.gz")
+        data_frame = pd.read_csv("./koku/masu/test/data/test_cur.csv.gz", dtype=str, na_filter=False)
+        data_frame = pd.concat([data_frame] * 50, ignore_index=True)
+        data_frame.to_csv(self.csv_file, index=False, compression="gzip")
+        self.row_count = len(data_frame)
+
+    def tearDown(self):
+        """Remove the temporary files."""
+        super().tearDown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_write_rolls_over_files(self):
+        """Test that files are bounded by max_rows_per_file and every row is written once."""
+        uploaded = []
+        writer = StreamingParquetWriter(
+            self.csv_file,
+            get_column_converters(),
+            post_processor=aws_post_processor,
+            row_group_size=100,
+            max_rows_per_file=300,
+            block_size=65536,
+        )
+        last_file, success = writer.write(
+            self.temp_dir, "test_cur_{index}.parquet", lambda path, name: uploaded.append(path) or True
+        )
+        self.assertTrue(success)
+        self.assertEqual(last_file, uploaded[-1])
+        self.assertGreater(len(uploaded), 1)
+        self.assertEqual(sum(pq.ParquetFile(path).metadata.num_rows for path in uploaded), self.row_count)
+
+        table = pq.read_table(uploaded[0])
+        self.assertIn("resourcetags", table.column_names)
+        self.assertEqual(str(table.schema.field("lineitem_unblendedcost").type), "double")
+
+    def test_write_daily_data_per_file(self):
+        """Test that the daily data is aggregated into one frame per parquet file, not per record batch."""
+        uploaded = []
+        daily_data_processor = Mock(side_effect=lambda data_frame: data_frame.head(1))
+        writer = StreamingParquetWriter(
+            self.csv_file,
+            get_column_converters(),
+            daily_data_processor=daily_data_processor,
+            row_group_size=100,
+            max_rows_per_file=300,
+            block_size=4096,
+        )
+        _, success = writer.write(
+            self.temp_dir, "test_cur_{index}.parquet", lambda path, name: uploaded.append(path) or True
+        )
+        self.assertTrue(success)
+        self.assertGreater(len(uploaded), 1)
+        self.assertEqual(len(writer.daily_data_frames), len(uploaded))
+        row_groups = sum(pq.ParquetFile(path).metadata.num_row_groups for path in uploaded)
+        self.assertLessEqual(daily_data_processor.call_count, row_groups)
+
+    def test_write_upload_failure(self):
+        """Test that a failed upload stops the conversion."""
+        writer = StreamingParquetWriter(self.csv_file, get_column_converters(), row_group_size=10, max_rows_per_file=10)
+        _, success = writer.write(self.temp_dir, "test_cur_{index}.parquet", lambda path, name: False)
+        self.assertFalse(success)
+        self.assertEqual(writer.parquet_files, [(f"{self.temp_dir}/test_cur_0.parquet", "test_cur_0.parquet")])
+
+    def test_processor_uses_streaming_engine(self):
+        """Test that the processor uses the streaming engine for configured provider types."""
+        report_processor = ParquetReportProcessor(
+            schema_name=self.schema,
+            report_path=self.csv_file,
+            provider_uuid=self.aws_provider_uuid,
+            provider_type=Provider.PROVIDER_AWS_LOCAL,
+            manifest_id=1,
+            context={"request_id": 1, "start_date": DateHelper().today, "create_table": True},
+        )
+        with patch("masu.processor.parquet.parquet_report_processor.settings") as mock_settings:
+            mock_settings.PARQUET_STREAMING_SOURCE_TYPES = [Provider.PROVIDER_AWS]
+            with patch("masu.processor.parquet.parquet_report_processor.convert_csv_file") as mock_convert:
+                mock_convert.return_value = ParquetConversion([], set(), [], False, None)
+                report_processor.convert_csv_to_parquet(self.csv_file)
+                self.assertTrue(mock_convert.call_args[1]["streaming"])
+
+            mock_settings.PARQUET_STREAMING_SOURCE_TYPES = []
+            self.assertFalse(report_processor.use_streaming_engine)
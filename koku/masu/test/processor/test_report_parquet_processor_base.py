@@ -6,11 +6,13 @@
 import shutil
 import tempfile
 import uuid
+from datetime import date
 from unittest.mock import patch
 
 import pandas as pd
 from django.test.utils import override_settings
 
+from masu.processor.report_parquet_processor_base import CATALOG_CACHE
 from masu.processor.report_parquet_processor_base import PostgresSummaryTableError
 from masu.processor.report_parquet_processor_base import ReportParquetProcessorBase
 from masu.test import MasuTestCase
@@ -59,6 +61,7 @@ class ReportParquetProcessorBaseTest(MasuTestCase):
             self.column_types,
             self.table_name,
         )
+        CATALOG_CACHE.invalidate()
 
     def tearDown(self):
         """Cleanup test case."""
@@ -152,3 +155,40 @@ class ReportParquetProcessorBaseTest(MasuTestCase):
         with self.assertLogs("masu.processor.report_parquet_processor_base", level="INFO") as logger:
             self.processor.create_schema()
             self.assertIn(expected_log, logger.output)
+
+    @patch("masu.processor.report_parquet_processor_base.ReportParquetProcessorBase._execute_sql")
+    def test_catalog_cache(self, mock_execute):
+        """Test that existing schemas, tables and synced partitions are only checked once."""
+        mock_execute.return_value = [["found"]]
+        bill_date = date(2021, 6, 1)
+        for _ in range(3):
+            self.assertTrue(self.processor.schema_exists())
+            self.assertTrue(self.processor.table_exists())
+            self.processor.sync_hive_partitions(bill_date=bill_date)
+        self.assertEqual(mock_execute.call_count, 3)
+
+        self.processor.sync_hive_partitions(bill_date=date(2021, 7, 1))
+        self.assertEqual(mock_execute.call_count, 4)
+
+        CATALOG_CACHE.invalidate(self.processor._schema_name, self.processor._table_name)
+        self.assertTrue(self.processor.schema_exists())
+        self.assertTrue(self.processor.table_exists())
+        self.assertEqual(mock_execute.call_count, 5)
+
+    @override_settings(TRINO_CATALOG_CACHE_TTL=-1)
+    @patch("masu.processor.report_parquet_processor_base.ReportParquetProcessorBase._execute_sql")
+    def test_catalog_cache_expires(self, mock_execute):
+        """Test that expired entries are checked again."""
+        mock_execute.return_value = [["found"]]
+        self.processor.schema_exists()
+        self.processor.schema_exists()
+        self.assertEqual(mock_execute.call_count, 2)
+
+    @patch("masu.processor.report_parquet_processor_base.ReportParquetProcessorBase._execute_sql")
+    def test_schema_not_found_not_cached(self, mock_execute):
+        """Test that a missing schema is not cached."""
+        mock_execute.return_value = []
+        self.assertFalse(self.processor.schema_exists())
+        self.processor.create_schema()
+        self.assertTrue(self.processor.schema_exists())
+        self.assertEqual(mock_execute.call_count, 2)
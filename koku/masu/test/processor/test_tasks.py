@@ -43,7 +43,9 @@ from masu.processor.expired_data_remover import ExpiredDataRemover
 from masu.processor.report_processor import ReportProcessorError
 from masu.processor.report_summary_updater import ReportSummaryUpdaterCloudError
 from masu.processor.tasks import autovacuum_tune_schema
+from masu.processor.tasks import flush_refresh_requests
 from masu.processor.tasks import get_report_files
+from masu.processor.tasks import merge_refresh_requests
 from masu.processor.tasks import normalize_table_options
 from masu.processor.tasks import record_all_manifest_files
 from masu.processor.tasks import record_report_status
@@ -51,6 +53,7 @@ from masu.processor.tasks import refresh_materialized_views
 from masu.processor.tasks import REFRESH_MATERIALIZED_VIEWS_QUEUE
 from masu.processor.tasks import remove_expired_data
 from masu.processor.tasks import remove_stale_tenants
+from masu.processor.tasks import schedule_refresh_materialized_views
 from masu.processor.tasks import summarize_reports
 from masu.processor.tasks import update_all_summary_tables
 from masu.processor.tasks import update_cost_model_costs
@@ -58,14 +61,22 @@ from masu.processor.tasks import UPDATE_COST_MODEL_COSTS_QUEUE
 from masu.processor.tasks import update_summary_tables
 from masu.processor.tasks import vacuum_schema
 from masu.processor.worker_cache import create_single_task_cache_key
+from masu.processor.worker_cache import WorkerCache
 from masu.test import MasuTestCase
 from masu.test.database.helpers import ReportObjectCreator
 from masu.test.external.downloader.aws import fake_arn
-from reporting.models import AWS_MATERIALIZED_VIEWS
+from reporting.models import AWS_UI_SUMMARY_TABLES
+from reporting.models import AWSAccountDimension
+from reporting.models import AWSCostSummaryByAccount
 from reporting.models import AZURE_MATERIALIZED_VIEWS
+from reporting.models import AzureSubscriptionDimension
 from reporting.models import GCP_MATERIALIZED_VIEWS
-from reporting.models import OCP_MATERIALIZED_VIEWS
+from reporting.models import GCPAccountDimension
+from reporting.models import OCP_UI_SUMMARY_TABLES
+from reporting.models import OCPCostSummaryByProject
+from reporting.models import OCPProjectDimension
 from reporting_common.models import CostUsageReportStatus
+from reporting_common.models import RefreshRequest
 
 
 LOG = logging.getLogger(__name__)
@@ -473,7 +484,7 @@ class TestRemoveExpiredDataTasks(MasuTestCase):
     """Test cases for Processor Celery tasks."""
 
     @patch.object(ExpiredDataRemover, "remove")
-    @patch("masu.processor.tasks.refresh_materialized_views.s")
+    @patch("masu.processor.tasks.schedule_refresh_materialized_views.s")
     def test_remove_expired_data(self, fake_view, fake_remover):
         """Test task."""
         expected_results = [{"account_payer_id": "999999999", "billing_period_start": "2018-06-24 15:47:33.052509"}]
@@ -737,8 +748,14 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
             update_cost_model_costs.s(self.schema, provider_aws_uuid, expected_start_date, expected_end_date).set(
                 queue=UPDATE_COST_MODEL_COSTS_QUEUE
             )
-            | refresh_materialized_views.si(
-                self.schema, provider, provider_uuid=provider_aws_uuid, manifest_id=manifest_id
+            | schedule_refresh_materialized_views.si(
+                self.schema,
+                provider,
+                provider_uuid=provider_aws_uuid,
+                manifest_id=manifest_id,
+                queue_name=None,
+                start_date=expected_start_date,
+                end_date=expected_end_date,
             ).set(queue=REFRESH_MATERIALIZED_VIEWS_QUEUE)
         )
 
@@ -768,11 +785,18 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
             self.schema, Provider.PROVIDER_AWS, provider_uuid=self.aws_provider_uuid, manifest_id=manifest.id
         )
 
-        views_to_check = [view for view in AWS_MATERIALIZED_VIEWS if "Cost" in view._meta.db_table]
+        views_to_check = [view for view in AWS_UI_SUMMARY_TABLES if "Cost" in view._meta.db_table]
 
         with schema_context(self.schema):
             for view in views_to_check:
                 self.assertNotEqual(view.objects.count(), 0)
+            summary_accounts = AWSCostSummaryByAccount.objects.filter(source_uuid=self.aws_provider_uuid)
+            dimension_accounts = AWSAccountDimension.objects.filter(source_uuid=self.aws_provider_uuid)
+            self.assertNotEqual(dimension_accounts.count(), 0)
+            self.assertEqual(
+                set(dimension_accounts.values_list("usage_account_id", flat=True)),
+                set(summary_accounts.values_list("usage_account_id", flat=True)),
+            )
 
         with ReportManifestDBAccessor() as manifest_accessor:
             manifest = manifest_accessor.get_manifest_by_id(manifest.id)
@@ -800,6 +824,7 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
         )
 
         views_to_check = [view for view in AZURE_MATERIALIZED_VIEWS if "Cost" in view._meta.db_table]
+        views_to_check.append(AzureSubscriptionDimension)
 
         with schema_context(self.schema):
             for view in views_to_check:
@@ -830,11 +855,18 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
             self.schema, Provider.PROVIDER_OCP, provider_uuid=self.ocp_provider_uuid, manifest_id=manifest.id
         )
 
-        views_to_check = [view for view in OCP_MATERIALIZED_VIEWS if "Cost" in view._meta.db_table]
+        views_to_check = [view for view in OCP_UI_SUMMARY_TABLES if "Cost" in view._meta.db_table]
 
         with schema_context(self.schema):
             for view in views_to_check:
                 self.assertNotEqual(view.objects.count(), 0)
+            summary_projects = OCPCostSummaryByProject.objects.filter(source_uuid=self.ocp_provider_uuid)
+            dimension_projects = OCPProjectDimension.objects.filter(source_uuid=self.ocp_provider_uuid)
+            self.assertNotEqual(dimension_projects.count(), 0)
+            self.assertEqual(
+                set(dimension_projects.values_list("namespace", flat=True)),
+                set(summary_projects.values_list("namespace", flat=True)),
+            )
 
         with ReportManifestDBAccessor() as manifest_accessor:
             manifest = manifest_accessor.get_manifest_by_id(manifest.id)
@@ -862,6 +894,7 @@ class TestUpdateSummaryTablesTask(MasuTestCase):
         )
 
         views_to_check = [view for view in GCP_MATERIALIZED_VIEWS if "Cost" in view._meta.db_table]
+        views_to_check.append(GCPAccountDimension)
 
         with schema_context(self.schema):
             for view in views_to_check:
@@ -1284,6 +1317,131 @@ class TestWorkerCacheThrottling(MasuTestCase):
         time.sleep(3)
         self.assertFalse(self.single_task_is_running(task_name, cache_args))
 
+    @patch("masu.processor.tasks.flush_refresh_requests.s")
+    def test_schedule_refresh_materialized_views_coalesces(self, mock_flush):
+        """Test that refresh requests within the window are merged into one flush."""
+        caches["worker"].clear()
+        provider_type = Provider.PROVIDER_AWS
+        schedule_refresh_materialized_views(
+            self.schema,
+            provider_type,
+            manifest_id=1,
+            provider_uuid=self.aws_provider_uuid,
+            start_date="2021-06-10",
+            end_date="2021-06-12",
+        )
+        schedule_refresh_materialized_views(
+            self.schema, provider_type, manifest_id=2, provider_uuid=self.aws_provider_uuid, start_date="2021-06-01"
+        )
+        schedule_refresh_materialized_views(
+            self.schema,
+            provider_type,
+            manifest_id=3,
+            provider_uuid=self.aws_provider_uuid,
+            start_date=date(2021, 5, 28),
+            end_date=date(2021, 6, 15),
+        )
+        mock_flush.assert_called_once_with(self.schema, provider_type, queue_name=None)
+
+        with patch("masu.processor.tasks._refresh_materialized_views") as mock_refresh, patch(
+            "masu.processor.worker_cache.CELERY_INSPECT"
+        ):
+            flush_refresh_requests(self.schema, provider_type)
+            mock_refresh.assert_called_once_with(
+                self.schema,
+                provider_type,
+                [str(self.aws_provider_uuid)],
+                [1, 2, 3],
+                start_date="2021-05-28",
+                end_date=None,
+            )
+            mock_refresh.reset_mock()
+            flush_refresh_requests(self.schema, provider_type)
+            mock_refresh.assert_not_called()
+
+    @patch("masu.processor.tasks.flush_refresh_requests.s")
+    def test_flush_refresh_requests_keeps_request_on_failure(self, mock_flush):
+        """Test that a failed refresh puts its merged request back and schedules the next flush."""
+        caches["worker"].clear()
+        provider_type = Provider.PROVIDER_AWS
+        schedule_refresh_materialized_views(
+            self.schema, provider_type, manifest_id=1, provider_uuid=self.aws_provider_uuid, start_date="2021-06-10"
+        )
+        schedule_refresh_materialized_views(
+            self.schema, provider_type, manifest_id=2, provider_uuid=self.aws_provider_uuid, start_date="2021-06-01"
+        )
+        mock_flush.reset_mock()
+        with patch("masu.processor.tasks._refresh_materialized_views", side_effect=ReportProcessorError("fail")):
+            with self.assertRaises(ReportProcessorError):
+                flush_refresh_requests(self.schema, provider_type)
+
+        mock_flush.assert_called_once_with(self.schema, provider_type, queue_name=None)
+        mock_flush.return_value.apply_async.assert_called_once_with(
+            queue=REFRESH_MATERIALIZED_VIEWS_QUEUE, countdown=Config.REFRESH_COALESCE_SECONDS
+        )
+        with schema_context("public"):
+            requests = RefreshRequest.objects.filter(schema_name=self.schema, provider_type=provider_type)
+            self.assertEqual(requests.count(), 1)
+            self.assertEqual(requests.first().manifest_ids, [1, 2])
+            self.assertEqual(requests.first().requests, 2)
+
+        task_name = "masu.processor.tasks.refresh_materialized_views"
+        self.assertFalse(WorkerCache().single_task_is_running(task_name, [self.schema, provider_type]))
+        with patch("masu.processor.tasks._refresh_materialized_views") as mock_refresh:
+            flush_refresh_requests(self.schema, provider_type)
+            mock_refresh.assert_called_once_with(
+                self.schema,
+                provider_type,
+                [str(self.aws_provider_uuid)],
+                [1, 2],
+                start_date="2021-06-01",
+                end_date=None,
+            )
+
+    @patch("masu.processor.tasks.flush_refresh_requests.s")
+    def test_flush_refresh_requests_delayed_while_locked(self, mock_flush):
+        """Test that a flush leaves the pending requests alone while a refresh holds the lock."""
+        caches["worker"].clear()
+        provider_type = Provider.PROVIDER_AWS
+        task_name = "masu.processor.tasks.refresh_materialized_views"
+        schedule_refresh_materialized_views(self.schema, provider_type, manifest_id=1)
+        WorkerCache().lock_single_task(task_name, [self.schema, provider_type], timeout=600)
+        mock_flush.reset_mock()
+
+        with patch("masu.processor.tasks._refresh_materialized_views") as mock_refresh:
+            flush_refresh_requests(self.schema, provider_type)
+            mock_refresh.assert_not_called()
+        mock_flush.assert_called_once_with(self.schema, provider_type, queue_name=None)
+        with schema_context("public"):
+            self.assertTrue(
+                RefreshRequest.objects.filter(schema_name=self.schema, provider_type=provider_type).exists()
+            )
+
+    def test_merge_refresh_requests(self):
+        """Test that merged requests union their sources and date ranges."""
+        pending = {
+            "provider_uuids": ["a"],
+            "manifest_ids": [1],
+            "start_date": "2021-06-10",
+            "end_date": "2021-06-12",
+            "requests": 2,
+        }
+        request = {
+            "provider_uuids": ["b"],
+            "manifest_ids": [None],
+            "start_date": "2021-06-01",
+            "end_date": "2021-06-11",
+            "requests": 1,
+        }
+        expected = {
+            "provider_uuids": ["a", "b"],
+            "manifest_ids": [1, None],
+            "start_date": "2021-06-01",
+            "end_date": "2021-06-12",
+            "requests": 3,
+        }
+        self.assertEqual(merge_refresh_requests(pending, request), expected)
+
 
 class TestRemoveStaleTenants(MasuTestCase):
     def setUp(self):
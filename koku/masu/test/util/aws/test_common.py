@@ -3,6 +3,7 @@
 # Copyright 2021 Red Hat Inc.
 # SPDX-License-Identifier: Apache-2.0
 #
+import json
 import random
 from datetime import datetime
 from unittest import TestCase
@@ -384,6 +385,25 @@ class TestAWSUtils(MasuTestCase):
         for column in PRESTO_REQUIRED_COLUMNS:
             self.assertIn(column.replace("-", "_").replace("/", "_").replace(":", "_").lower(), columns)
 
+    def test_resource_tags_to_json(self):
+        """Test that tag columns collapse to the same JSON as a per row dictionary."""
+        data = {
+            "resourceTags/user:app": ["web", "", "db"],
+            "resourceTags/user:env": ["prod", "", 'q"uoted'],
+            "resourceTags/user:zone": ["", "", "ünï"],
+        }
+        tag_df = pd.DataFrame.from_dict(data)
+        expected = [
+            json.dumps({key.replace("resourceTags/user:", ""): value for key, value in row.items() if value})
+            for row in tag_df.to_dict("records")
+        ]
+        result = utils.resource_tags_to_json(tag_df)
+        self.assertEqual(result.tolist(), expected)
+        self.assertEqual(result.tolist()[1], "{}")
+
+        result = utils.resource_tags_to_json(tag_df[[]])
+        self.assertEqual(result.tolist(), ["{}", "{}", "{}"])
+
     def test_aws_generate_daily_data(self):
         """Test that we aggregate data at a daily level."""
         lineitem_usageamount = random.randint(1, 10)
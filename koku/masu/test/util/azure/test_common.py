@@ -7,6 +7,7 @@ import pandas as pd
 
 from api.utils import DateHelper
 from masu.test import MasuTestCase
+from masu.util.azure.common import azure_date_column_converter
 from masu.util.azure.common import azure_date_converter
 from masu.util.azure.common import azure_generate_daily_data
 from masu.util.azure.common import azure_json_converter
@@ -27,6 +28,13 @@ class TestAzureUtils(MasuTestCase):
         self.assertEqual(azure_date_converter(old_azure_format).date(), today.date())
         self.assertEqual(azure_date_converter(new_azure_format).date(), today.date())
 
+    def test_azure_date_column_converter(self):
+        """Test that a column mixing both Azure date formats is converted."""
+        today = DateHelper().today
+        column = pd.Series([today.strftime("%m/%d/%Y"), today.strftime("%Y-%m-%d")])
+        out = azure_date_column_converter(column)
+        self.assertEqual([value.date() for value in out], [today.date(), today.date()])
+
     def test_azure_json_converter(self):
         """Test that we successfully process both Azure JSON formats."""
 
@@ -102,6 +102,18 @@ class OCPUtilTests(MasuTestCase):
         dt = utils.process_openshift_datetime("2020-07-01 00:00:00 +0000 UTC")
         self.assertEqual(expected, dt)
 
+    def test_process_openshift_datetime_column(self):
+        """Test process_openshift_datetime_column matches the per value conversion."""
+        column = pd.Series(["2020-07-01 00:00:00 +0000 UTC", "2020-07-01 01:00:00 +0000 UTC"])
+        out = utils.process_openshift_datetime_column(column)
+        self.assertEqual(out.tolist(), [utils.process_openshift_datetime(value) for value in column])
+
+    def test_process_openshift_labels_column(self):
+        """Test process_openshift_labels_column matches the per value conversion."""
+        column = pd.Series(["label_key1:value1|label_key2:value2", "", "label_key1:value1|label_key2:value2"])
+        out = utils.process_openshift_labels_column(column)
+        self.assertEqual(out.tolist(), [utils.process_openshift_labels_to_json(value) for value in column])
+
     def test_ocp_generate_daily_data(self):
         """Test that OCP data is aggregated to daily."""
         usage = random.randint(1, 10)
@@ -260,6 +272,37 @@ class OCPUtilTests(MasuTestCase):
             result = utils.match_openshift_labels(td, matched_tags, cluster_topology)
             self.assertEqual(result, expected)
 
+    def test_substring_index(self):
+        """Test that the substring index matches like a per pattern substring check."""
+        patterns = ["i-123", "vol-456", "node-1", ""]
+        index = utils.SubstringIndex(patterns)
+        values = ["i-123", "arn:aws:ec2:instance/i-123", "vol-45", "/subscriptions/x/node-10", "other", None]
+        expected = [True, True, False, True, False, False]
+        self.assertEqual([index.search(value) for value in values], expected)
+
+    def test_openshift_topology_matcher(self):
+        """Test that the matcher filters by resource id and tags with one pass per distinct value."""
+        cluster_topology = {
+            "cluster_id": self.ocp_cluster_id,
+            "cluster_alias": "my-ocp-cluster",
+            "nodes": ["Compute-1"],
+            "projects": ["cost-management"],
+            "resource_ids": ["id1"],
+        }
+        matched_tags = [{"key": "value"}]
+        matcher = utils.OpenShiftTopologyMatcher(cluster_topology, matched_tags)
+        data_frame = pd.DataFrame(
+            {
+                "resource": ["id1", "id2", "id3", "id1"],
+                "tags": ['{"Key": "Value"}', '{"openshift_node": "compute-1"}', '{"other": "tag"}', "{}"],
+            }
+        )
+        matched = matcher.match(data_frame, data_frame["resource"], "tags", ("resource_ids",))
+        self.assertEqual(matched["resource"].tolist(), ["id1", "id2", "id1"])
+        self.assertEqual(matched["matched_tag"].tolist(), ['"key": "value"', '"openshift_node": "compute-1"', ""])
+        self.assertEqual(matched["uuid"].nunique(), 3)
+        self.assertIs(matcher.resource_index(("resource_ids",)), matcher.resource_index(("resource_ids",)))
+
     def test_get_report_details(self):
         """Test that we handle manifest files properly."""
         with tempfile.TemporaryDirectory() as manifest_path:
@@ -5,15 +5,20 @@
 """Test the common util functions."""
 import gzip
 import json
+import tempfile
+import threading
 import types
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
 from decimal import Decimal
 from os.path import exists
+from unittest.mock import patch
 
+import pandas as pd
 from dateutil import parser
 from django.test import TestCase
+from django.test.utils import override_settings
 from tenant_schemas.utils import schema_context
 
 import masu.util.common as common_utils
@@ -171,6 +176,38 @@ class CommonUtilTests(MasuTestCase):
             self.assertLessEqual(end, end_date.date())
         self.assertEqual(end, end_date.date())
 
+    def test_run_date_range_pairs_in_parallel(self):
+        """Test that every window is run and the first error is raised after all of them."""
+        start_date = date(2020, 1, 1)
+        end_date = date(2020, 1, 31)
+        expected = list(common_utils.date_range_pair(start_date, end_date, step=5))
+        lock = threading.Lock()
+        called = []
+
+        def populate(start, end):
+            with lock:
+                called.append((start, end))
+            return start
+
+        with override_settings(TRINO_TENANT_CONCURRENCY=3), patch("masu.util.common.connection") as mock_connection:
+            results = common_utils.run_date_range_pairs_in_parallel(
+                "acct_parallel", populate, start_date, end_date, step=5
+            )
+        self.assertEqual(results, [start for start, _ in expected])
+        self.assertCountEqual(called, expected)
+        self.assertEqual(mock_connection.close.call_count, len(expected))
+
+        def fail(start, end):
+            with lock:
+                called.append((start, end))
+            if start == start_date:
+                raise ValueError("Trino error")
+
+        called.clear()
+        with self.assertRaises(ValueError):
+            common_utils.run_date_range_pairs_in_parallel("acct_parallel_fail", fail, start_date, end_date, step=5)
+        self.assertCountEqual(called, expected)
+
     def test_date_range_pair_one_day(self):
         """Test that generator works for a single day."""
         start_date = "2020-01-01"
@@ -198,6 +235,118 @@ class CommonUtilTests(MasuTestCase):
         out = common_utils.safe_float("1.1")
         self.assertEqual(out, float("1.1"))
 
+    def test_safe_float_column(self):
+        """Test the safe_float_column method matches safe_float for good and bad inputs."""
+        column = pd.Series(["1.1", "", "0.06630913566020373", "foo"])
+        out = common_utils.safe_float_column(column)
+        self.assertEqual(out.tolist(), [common_utils.safe_float(value) for value in column])
+
+        out = common_utils.safe_float_column(pd.Series(["1.1", "", "2"]))
+        self.assertEqual(out.tolist(), [1.1, 0.0, 2.0])
+
+    def test_datetime_column(self):
+        """Test that a column of ISO 8601 strings is converted to datetimes."""
+        column = pd.Series(["2021-06-01T00:00:00Z", "2021-06-01T01:00:00Z", "2021-06-01T00:00:00Z"])
+        out = common_utils.datetime_column(column)
+        self.assertEqual(out.tolist(), pd.to_datetime(column).tolist())
+        self.assertTrue(out.index.equals(column.index))
+
+    def test_datetime_column_bad_values(self):
+        """Test that values that do not parse become NaT."""
+        column = pd.Series(["2021-06-01 00:00:00", "", "not a date", "2021-06-01 00:00:00"])
+        for datetime_format in (None, "%Y-%m-%d %H:%M:%S"):
+            with self.subTest(datetime_format=datetime_format):
+                out = common_utils.datetime_column(column, datetime_format=datetime_format)
+                self.assertEqual(out[0], pd.Timestamp("2021-06-01 00:00:00"))
+                self.assertEqual(out[3], out[0])
+                self.assertTrue(out[1:3].isna().all())
+
+    def test_datetime_column_format_fallback(self):
+        """Test that values that do not match the format are still parsed and unparsable values are logged."""
+        column = pd.Series(["2021-06-01 00:00:00", "2021-06-01T01:00:00Z", "not a date"], name="usage_start")
+        with self.assertLogs("masu.util.common", level="WARNING") as logger:
+            out = common_utils.datetime_column(column, datetime_format="%Y-%m-%d %H:%M:%S")
+        self.assertEqual(out[0], pd.Timestamp("2021-06-01 00:00:00"))
+        self.assertEqual(out[1], pd.Timestamp("2021-06-01 01:00:00"))
+        self.assertTrue(pd.isna(out[2]))
+        self.assertIn("1 distinct values of column usage_start", logger.output[0])
+
+    def test_map_distinct_values(self):
+        """Test that the converter is called once per distinct value."""
+        column = pd.Series(["a", "b", "a", "a"])
+        calls = []
+
+        def converter(value):
+            calls.append(value)
+            return value.upper()
+
+        out = common_utils.map_distinct_values(column, converter)
+        self.assertEqual(out.tolist(), ["A", "B", "A", "A"])
+        self.assertEqual(sorted(calls), ["a", "b"])
+
+    def test_convert_columns(self):
+        """Test that only the columns present in the data frame are converted."""
+        data_frame = pd.DataFrame({"cost": ["1.5", ""], "name": ["a", ""]})
+        converters = {"cost": common_utils.safe_float_column, "missing": common_utils.safe_float_column}
+        out = common_utils.convert_columns(data_frame, converters)
+        self.assertEqual(out["cost"].tolist(), [1.5, 0.0])
+        self.assertEqual(out["name"].tolist(), ["a", ""])
+        self.assertNotIn("missing", out)
+
+    def test_split_csv_daily(self):
+        """Test that a CSV is streamed into one file per day with the values unchanged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = f"{temp_dir}/report.csv"
+            data_frame = pd.DataFrame(
+                {
+                    "interval_start": ["2021-02-01 00:00:00", "2021-02-02 00:00:00", "2021-02-01 01:00:00"],
+                    "usage": ["1", "", "3.50"],
+                }
+            )
+            data_frame.to_csv(file_path, index=False)
+
+            daily_files = common_utils.split_csv_daily(file_path, "interval_start", "usage.{day}.csv", chunksize=1)
+            self.assertEqual(
+                daily_files,
+                [
+                    {
+                        "filename": "usage.2021-02-01.csv",
+                        "filepath": f"{temp_dir}/usage.2021-02-01.csv",
+                        "date": "2021-02-01",
+                    },
+                    {
+                        "filename": "usage.2021-02-02.csv",
+                        "filepath": f"{temp_dir}/usage.2021-02-02.csv",
+                        "date": "2021-02-02",
+                    },
+                ],
+            )
+            first_day = pd.read_csv(daily_files[0]["filepath"], dtype=str, na_filter=False)
+            self.assertEqual(first_day["usage"].tolist(), ["1", "3.50"])
+
+            daily_files = common_utils.split_csv_daily(
+                file_path, "interval_start", "usage.{day}.csv", compress=True
+            )
+            self.assertEqual(daily_files[0]["filename"], "usage.2021-02-01.csv.gz")
+            with gzip.open(daily_files[0]["filepath"], "rt") as daily_file:
+                self.assertEqual(len(daily_file.readlines()), 3)
+
+    def test_get_csv_usage_days(self):
+        """Test that the sorted usage days of a CSV are returned."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = f"{temp_dir}/report.csv"
+            data_frame = pd.DataFrame(
+                {
+                    "interval_start": ["2021-02-02 00:00:00", "2021-02-01 00:00:00", "2021-02-02 01:00:00"],
+                    "usage": ["1", "2", "3"],
+                }
+            )
+            data_frame.to_csv(file_path, index=False)
+
+            self.assertEqual(common_utils.get_csv_usage_days(file_path, "interval_start"), ["2021-02-01", "2021-02-02"])
+            self.assertIsNone(common_utils.get_csv_usage_days(file_path, "usage_start"))
+            self.assertIsNone(common_utils.get_csv_usage_days(f"{temp_dir}/missing.csv", "interval_start"))
+
     def test_safe_dict(self):
         """Test the safe_dict method handles good and bad inputs."""
         out = common_utils.safe_dict(1)
@@ -7,10 +7,8 @@ import datetime
 import json
 import logging
 import re
-import uuid
 
 import boto3
-import ciso8601
 import pandas as pd
 from botocore.exceptions import ClientError
 from botocore.exceptions import EndpointConnectionError
@@ -24,9 +22,11 @@ from masu.database.aws_report_db_accessor import AWSReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
 from masu.processor import enable_trino_processing
 from masu.util import common as utils
-from masu.util.common import safe_float
+from masu.util.common import datetime_column
+from masu.util.common import map_distinct_values
+from masu.util.common import safe_float_column
 from masu.util.common import strip_characters_from_column_name
-from masu.util.ocp.common import match_openshift_labels
+from masu.util.ocp.common import OpenShiftTopologyMatcher
 from reporting.provider.aws.models import PRESTO_REQUIRED_COLUMNS
 
 LOG = logging.getLogger(__name__)
@@ -354,27 +354,48 @@ def remove_files_not_in_set_from_s3_bucket(request_id, s3_path, manifest_id, con
     return removed
 
 
-def aws_post_processor(data_frame):
+def scrub_resource_col_name(res_col_name):
+    """Return the tag key for a resourceTags/user: column."""
+    return res_col_name.replace("resourceTags/user:", "")
+
+
+def resource_tags_to_json(tag_df):
     """
-    Consume the AWS data and add a column creating a dictionary for the aws tags
+    Collapse resourceTags/user: columns into a JSON dictionary string per row.
+
+    Only the tag cells that are set are stacked and joined, so the work scales
+    with the number of tags present instead of rows times tag columns. The
+    result matches json.dumps of the per row {key: value} dictionary.
     """
+    resource_tags = pd.Series("{}", index=tag_df.index, dtype=object)
+    if tag_df.columns.empty:
+        return resource_tags
 
-    def scrub_resource_col_name(res_col_name):
-        return res_col_name.replace("resourceTags/user:", "")
+    stacked = tag_df.stack()
+    stacked = stacked[stacked.astype(bool).to_numpy()]
+    if stacked.empty:
+        return resource_tags
 
+    json_keys = {column: json.dumps(scrub_resource_col_name(column)) for column in tag_df.columns}
+    keys = stacked.index.get_level_values(1).map(json_keys).to_numpy()
+    values = map_distinct_values(stacked, json.dumps).to_numpy()
+    pairs = pd.Series(keys + ": " + values, index=stacked.index.get_level_values(0))
+    joined = pairs.groupby(level=0, sort=False).agg(", ".join)
+    resource_tags.loc[joined.index] = "{" + joined + "}"
+    return resource_tags
+
+
+def aws_post_processor(data_frame):
+    """
+    Consume the AWS data and add a column creating a dictionary for the aws tags
+    """
     columns = set(list(data_frame))
     columns = set(PRESTO_REQUIRED_COLUMNS).union(columns)
     columns = sorted(list(columns))
 
     resource_tag_columns = [column for column in columns if "resourceTags/user:" in column]
     unique_keys = {scrub_resource_col_name(column) for column in resource_tag_columns}
-    tag_df = data_frame[resource_tag_columns]
-    resource_tags_dict = tag_df.apply(
-        lambda row: {scrub_resource_col_name(column): value for column, value in row.items() if value}, axis=1
-    )
-    resource_tags_dict.where(resource_tags_dict.notna(), lambda _: [{}], inplace=True)
-
-    data_frame["resourceTags"] = resource_tags_dict.apply(json.dumps)
+    data_frame["resourceTags"] = resource_tags_to_json(data_frame[resource_tag_columns])
     # Make sure we have entries for our required columns
     data_frame = data_frame.reindex(columns=columns)
 
@@ -431,41 +452,32 @@ def aws_generate_daily_data(data_frame):
     return daily_data_frame
 
 
-def match_openshift_resources_and_labels(data_frame, cluster_topology, matched_tags):
+def match_openshift_resources_and_labels(data_frame, cluster_topology, matched_tags, matcher=None):
     """Filter a dataframe to the subset that matches an OpenShift source."""
-    resource_ids = cluster_topology.get("resource_ids", [])
-    resource_id_df = data_frame["lineitem_resourceid"]
-    resource_id_matched = resource_id_df.apply(lambda row: any([value in row for value in resource_ids]))
-    data_frame["resource_id_matched"] = resource_id_matched
-
-    tags = data_frame["resourcetags"]
-    tag_matched = tags.apply(match_openshift_labels, args=(matched_tags, cluster_topology))
-    data_frame["matched_tag"] = tag_matched
-    openshift_matched_data_frame = data_frame[
-        (data_frame["resource_id_matched"] == True) | (data_frame["matched_tag"] != "")  # noqa: E712
-    ]
-
-    openshift_matched_data_frame["uuid"] = openshift_matched_data_frame.apply(lambda _: str(uuid.uuid4()), axis=1)
-
-    return openshift_matched_data_frame
+    if matcher is None:
+        matcher = OpenShiftTopologyMatcher(cluster_topology, matched_tags)
+    return matcher.match(data_frame, data_frame["lineitem_resourceid"], "resourcetags", ("resource_ids",))
 
 
 def get_column_converters():
-    """Return source specific parquet column converters."""
+    """Return source specific parquet column converters.
+
+    Each converter takes and returns a whole pandas Series of the raw string values.
+    """
     return {
-        "bill/BillingPeriodStartDate": ciso8601.parse_datetime,
-        "bill/BillingPeriodEndDate": ciso8601.parse_datetime,
-        "lineItem/UsageStartDate": ciso8601.parse_datetime,
-        "lineItem/UsageEndDate": ciso8601.parse_datetime,
-        "lineItem/UsageAmount": safe_float,
-        "lineItem/NormalizationFactor": safe_float,
-        "lineItem/NormalizedUsageAmount": safe_float,
-        "lineItem/UnblendedRate": safe_float,
-        "lineItem/UnblendedCost": safe_float,
-        "lineItem/BlendedRate": safe_float,
-        "lineItem/BlendedCost": safe_float,
-        "pricing/publicOnDemandCost": safe_float,
-        "pricing/publicOnDemandRate": safe_float,
+        "bill/BillingPeriodStartDate": datetime_column,
+        "bill/BillingPeriodEndDate": datetime_column,
+        "lineItem/UsageStartDate": datetime_column,
+        "lineItem/UsageEndDate": datetime_column,
+        "lineItem/UsageAmount": safe_float_column,
+        "lineItem/NormalizationFactor": safe_float_column,
+        "lineItem/NormalizedUsageAmount": safe_float_column,
+        "lineItem/UnblendedRate": safe_float_column,
+        "lineItem/UnblendedCost": safe_float_column,
+        "lineItem/BlendedRate": safe_float_column,
+        "lineItem/BlendedCost": safe_float_column,
+        "pricing/publicOnDemandCost": safe_float_column,
+        "pricing/publicOnDemandRate": safe_float_column,
     }
 
 
@@ -7,7 +7,6 @@ import datetime
 import json
 import logging
 import re
-import uuid
 
 import ciso8601
 from tenant_schemas.utils import schema_context
@@ -15,9 +14,11 @@ from tenant_schemas.utils import schema_context
 from api.models import Provider
 from masu.database.azure_report_db_accessor import AzureReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
-from masu.util.common import safe_float
+from masu.util.common import datetime_column
+from masu.util.common import map_distinct_values
+from masu.util.common import safe_float_column
 from masu.util.common import strip_characters_from_column_name
-from masu.util.ocp.common import match_openshift_labels
+from masu.util.ocp.common import OpenShiftTopologyMatcher
 from reporting.provider.azure.models import PRESTO_COLUMNS
 
 LOG = logging.getLogger(__name__)
@@ -152,23 +153,36 @@ def azure_post_processor(data_frame):
     return data_frame
 
 
+def azure_date_column_converter(column):
+    """Convert a column of Azure dates in either export format to datetimes."""
+    return datetime_column(column.str.replace(r"^(\d+)/(\d+)/(\d+)$", r"\3-\1-\2", regex=True))
+
+
+def azure_json_column_converter(column):
+    """Convert a column of either Azure JSON field format to proper JSON."""
+    return map_distinct_values(column, azure_json_converter)
+
+
 def get_column_converters():
-    """Return source specific parquet column converters."""
+    """Return source specific parquet column converters.
+
+    Each converter takes and returns a whole pandas Series of the raw string values.
+    """
     return {
-        "UsageDateTime": azure_date_converter,
-        "Date": azure_date_converter,
-        "BillingPeriodStartDate": azure_date_converter,
-        "BillingPeriodEndDate": azure_date_converter,
-        "UsageQuantity": safe_float,
-        "Quantity": safe_float,
-        "ResourceRate": safe_float,
-        "PreTaxCost": safe_float,
-        "CostInBillingCurrency": safe_float,
-        "EffectivePrice": safe_float,
-        "UnitPrice": safe_float,
-        "PayGPrice": safe_float,
-        "Tags": azure_json_converter,
-        "AdditionalInfo": azure_json_converter,
+        "UsageDateTime": azure_date_column_converter,
+        "Date": azure_date_column_converter,
+        "BillingPeriodStartDate": azure_date_column_converter,
+        "BillingPeriodEndDate": azure_date_column_converter,
+        "UsageQuantity": safe_float_column,
+        "Quantity": safe_float_column,
+        "ResourceRate": safe_float_column,
+        "PreTaxCost": safe_float_column,
+        "CostInBillingCurrency": safe_float_column,
+        "EffectivePrice": safe_float_column,
+        "UnitPrice": safe_float_column,
+        "PayGPrice": safe_float_column,
+        "Tags": azure_json_column_converter,
+        "AdditionalInfo": azure_json_column_converter,
     }
 
 
@@ -177,25 +191,11 @@ def azure_generate_daily_data(data_frame):
     return data_frame
 
 
-def match_openshift_resources_and_labels(data_frame, cluster_topology, matched_tags):
+def match_openshift_resources_and_labels(data_frame, cluster_topology, matched_tags, matcher=None):
     """Filter a dataframe to the subset that matches an OpenShift source."""
-    nodes = cluster_topology.get("nodes", [])
-    volumes = cluster_topology.get("persistent_volumes", [])
-    matchable_resources = nodes + volumes
+    if matcher is None:
+        matcher = OpenShiftTopologyMatcher(cluster_topology, matched_tags)
     resource_id_df = data_frame["resourceid"]
     if resource_id_df.isna().values.all():
         resource_id_df = data_frame["instanceid"]
-    resource_id_matched = resource_id_df.apply(lambda row: any([value in row for value in matchable_resources]))
-
-    data_frame["resource_id_matched"] = resource_id_matched
-
-    tags = data_frame["tags"]
-    tag_matched = tags.apply(match_openshift_labels, args=(matched_tags, cluster_topology))
-    data_frame["matched_tag"] = tag_matched
-    openshift_matched_data_frame = data_frame[
-        (data_frame["resource_id_matched"] == True) | (data_frame["matched_tag"] != "")  # noqa: E712
-    ]
-
-    openshift_matched_data_frame["uuid"] = openshift_matched_data_frame.apply(lambda _: str(uuid.uuid4()), axis=1)
-
-    return openshift_matched_data_frame
+    return matcher.match(data_frame, resource_id_df, "tags", ("nodes", "persistent_volumes"))
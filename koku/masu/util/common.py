@@ -8,16 +8,23 @@ import datetime
 import gzip
 import json
 import logging
+import os
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from itertools import groupby
 from os import remove
 from tempfile import gettempdir
 from uuid import uuid4
 
+import pandas as pd
 from dateutil import parser
 from dateutil.rrule import DAILY
 from dateutil.rrule import rrule
+from django.conf import settings
+from django.db import connection
 from pytz import UTC
 from tenant_schemas.utils import schema_context
 
@@ -29,6 +36,10 @@ from masu.external import POLL_INGEST
 
 LOG = logging.getLogger(__name__)
 
+# Caps the Trino statements a process runs at once for a tenant, across every summary in flight
+TRINO_TENANT_SEMAPHORES = defaultdict(lambda: threading.BoundedSemaphore(settings.TRINO_TENANT_CONCURRENCY))
+TRINO_TENANT_SEMAPHORES_LOCK = threading.Lock()
+
 
 def extract_uuids_from_string(source_string):
     """
@@ -133,6 +144,140 @@ def safe_float(val):
     return result
 
 
+def safe_float_column(column):
+    """
+    Convert a column of values to floats, using 0f for values that can not be converted.
+    """
+    try:
+        return column.mask(column == "", "0").astype("float64")
+    except (ValueError, TypeError):
+        return column.map(safe_float)
+
+
+def datetime_column(column, datetime_format=None):
+    """
+    Convert a column of date time strings to datetimes.
+
+    Report line items share a small number of distinct hourly or daily
+    timestamps, so each distinct value is parsed once. Pass datetime_format
+    when the report format is known. Values that do not match the format are
+    parsed on their own, and only values that can not be parsed at all become NaT.
+    """
+    codes, distinct_values = pd.factorize(column)
+    datetimes = pd.to_datetime(distinct_values, format=datetime_format, errors="coerce")
+    unparsed = [
+        position
+        for position, value in enumerate(distinct_values)
+        if pd.isna(datetimes[position]) and str(value).strip()
+    ]
+    if unparsed:
+        values = list(datetimes)
+        failed = 0
+        for position in unparsed:
+            try:
+                value = pd.Timestamp(distinct_values[position])
+            except (TypeError, ValueError):
+                failed += 1
+                continue
+            if datetimes.tz is None and value.tz is not None:
+                value = value.tz_convert(None)
+            elif datetimes.tz is not None and value.tz is None:
+                value = value.tz_localize(datetimes.tz)
+            values[position] = value
+        datetimes = pd.DatetimeIndex(values, tz=datetimes.tz)
+        if failed:
+            LOG.warning(f"{failed} distinct values of column {column.name} could not be parsed as datetimes.")
+    datetimes = datetimes.take(codes, allow_fill=True)
+    return pd.Series(datetimes, index=column.index, name=column.name)
+
+
+def map_distinct_values(column, converter):
+    """
+    Apply a single value converter once per distinct value in a column.
+
+    Label and tag columns repeat heavily, so converting the distinct
+    values and mapping the results back is much cheaper than converting
+    every cell.
+    """
+    distinct_values = column.unique()
+    return column.map(dict(zip(distinct_values, map(converter, distinct_values))))
+
+
+def convert_columns(data_frame, converters):
+    """
+    Apply whole-column converters to a data frame read with string dtypes.
+
+    Args:
+        data_frame (DataFrame): The data read from a report file
+        converters (dict): A map of column name to a function taking and returning a Series
+
+    Returns:
+        (DataFrame): The data frame with converted columns
+
+    """
+    for column, converter in converters.items():
+        if column in data_frame:
+            data_frame[column] = converter(data_frame[column])
+    return data_frame
+
+
+def split_csv_daily(file_path, date_column, file_name_format, compress=False, chunksize=None):
+    """
+    Stream a CSV file into one CSV file per usage day.
+
+    The file is read in chunks and each row's day is taken from the first ten
+    characters of date_column, so memory stays bounded by the chunk size and
+    the work is linear in the number of rows. Values are written back exactly
+    as they were read.
+
+    Args:
+        file_path (str): The CSV file to split
+        date_column (str): The column holding an ISO 8601 timestamp for each row
+        file_name_format (str): The daily file name with a {day} placeholder, e.g. "pod_usage.{day}.csv"
+        compress (bool): gzip the daily files and add a .gz suffix
+        chunksize (int): The number of rows to read at a time
+
+    Returns:
+        (list): Dicts with the filename, filepath and ISO date of each daily file
+
+    """
+    directory = os.path.dirname(file_path)
+    chunksize = chunksize or Config.REPORT_PROCESSING_BATCH_SIZE
+    daily_files = {}
+    writers = {}
+    try:
+        with pd.read_csv(file_path, dtype=str, na_filter=False, chunksize=chunksize) as reader:
+            for data_frame in reader:
+                days = data_frame[date_column].str[:10]
+                for day, day_frame in data_frame.groupby(days, sort=False):
+                    if day not in writers:
+                        day_file = file_name_format.format(day=day)
+                        if compress:
+                            day_file = f"{day_file}.gz"
+                        day_filepath = f"{directory}/{day_file}"
+                        writers[day] = gzip.open(day_filepath, "wt") if compress else open(day_filepath, "w")
+                        daily_files[day] = {"filename": day_file, "filepath": day_filepath, "date": day}
+                        day_frame.to_csv(writers[day], index=False, header=True)
+                    else:
+                        day_frame.to_csv(writers[day], index=False, header=False)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return list(daily_files.values())
+
+
+def get_csv_usage_days(file_path, date_column):
+    """
+    Return the sorted ISO dates found in the date_column of a CSV file, or None if it can not be read.
+    """
+    try:
+        dates = pd.read_csv(file_path, usecols=[date_column], dtype=str, na_filter=False)[date_column].str[:10]
+    except Exception as error:
+        LOG.warning(f"Unable to read the usage days of {file_path}. Reason: {str(error)}")
+        return None
+    return sorted(day for day in dates.unique() if day)
+
+
 def safe_dict(val):
     """
     Convert the given value to a dictionary or empyt dict.
@@ -234,6 +379,30 @@ def date_range_pair(start_date, end_date, step=5):
         yield start_date.date(), end_date.date()
 
 
+def run_date_range_pairs_in_parallel(schema, func, start_date, end_date, step=5):
+    """Call func(start, end) for every date_range_pair window, running the windows concurrently.
+
+    At most settings.TRINO_TENANT_CONCURRENCY windows of a schema run at the same time.
+    Every window is run before the first error, if any, is raised.
+
+    """
+    with TRINO_TENANT_SEMAPHORES_LOCK:
+        semaphore = TRINO_TENANT_SEMAPHORES[schema]
+
+    def run_window(start, end):
+        try:
+            with semaphore:
+                return func(start, end)
+        finally:
+            # Django opens a connection per thread and never closes it for threads it did not start
+            connection.close()
+
+    windows = list(date_range_pair(start_date, end_date, step=step))
+    with ThreadPoolExecutor(max_workers=min(len(windows), settings.TRINO_TENANT_CONCURRENCY)) as pool:
+        futures = [pool.submit(run_window, start, end) for start, end in windows]
+    return [future.result() for future in futures]
+
+
 def get_path_prefix(account, provider_type, provider_uuid, start_date, data_type, report_type=None, daily=False):
     """Get the S3 bucket prefix"""
     path = None
@@ -8,13 +8,14 @@ import json
 import logging
 from json.decoder import JSONDecodeError
 
-import ciso8601
 from tenant_schemas.utils import schema_context
 
 from api.models import Provider
 from masu.database.gcp_report_db_accessor import GCPReportDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
-from masu.util.common import safe_float
+from masu.util.common import datetime_column
+from masu.util.common import map_distinct_values
+from masu.util.common import safe_float_column
 from masu.util.common import strip_characters_from_column_name
 
 LOG = logging.getLogger(__name__)
@@ -116,18 +117,31 @@ def gcp_post_processor(data_frame):
     return (data_frame, label_set)
 
 
+def process_gcp_labels_column(column):
+    """Convert a column of GCP label strings to JSON strings."""
+    return map_distinct_values(column, process_gcp_labels)
+
+
+def process_gcp_credits_column(column):
+    """Convert a column of GCP credit strings to JSON strings."""
+    return map_distinct_values(column, process_gcp_credits)
+
+
 def get_column_converters():
-    """Return source specific parquet column converters."""
+    """Return source specific parquet column converters.
+
+    Each converter takes and returns a whole pandas Series of the raw string values.
+    """
     return {
-        "usage_start_time": ciso8601.parse_datetime,
-        "usage_end_time": ciso8601.parse_datetime,
-        "project.labels": process_gcp_labels,
-        "labels": process_gcp_labels,
-        "system_labels": process_gcp_labels,
-        "export_time": ciso8601.parse_datetime,
-        "cost": safe_float,
-        "currency_conversion_rate": safe_float,
-        "usage.amount": safe_float,
-        "usage.amount_in_pricing_units": safe_float,
-        "credits": process_gcp_credits,
+        "usage_start_time": datetime_column,
+        "usage_end_time": datetime_column,
+        "project.labels": process_gcp_labels_column,
+        "labels": process_gcp_labels_column,
+        "system_labels": process_gcp_labels_column,
+        "export_time": datetime_column,
+        "cost": safe_float_column,
+        "currency_conversion_rate": safe_float_column,
+        "usage.amount": safe_float_column,
+        "usage.amount_in_pricing_units": safe_float_column,
+        "credits": process_gcp_credits_column,
     }
@@ -7,6 +7,8 @@ import copy
 import json
 import logging
 import os
+import uuid
+from collections import deque
 from enum import Enum
 
 import ciso8601
@@ -18,7 +20,9 @@ from api.models import Provider
 from masu.config import Config
 from masu.database.provider_auth_db_accessor import ProviderAuthDBAccessor
 from masu.database.provider_db_accessor import ProviderDBAccessor
-from masu.util.common import safe_float
+from masu.util.common import datetime_column
+from masu.util.common import map_distinct_values
+from masu.util.common import safe_float_column
 
 LOG = logging.getLogger(__name__)
 
@@ -396,32 +400,47 @@ def process_openshift_labels_to_json(label_val):
     return json.dumps(process_openshift_labels(label_val))
 
 
+def process_openshift_datetime_column(column):
+    """
+    Convert a column of Metering operator date times to consumable datetimes.
+    """
+    return datetime_column(column.str.replace(" +0000 UTC", "", regex=False), datetime_format="%Y-%m-%d %H:%M:%S")
+
+
+def process_openshift_labels_column(column):
+    """Convert a column of report label strings to JSON strings."""
+    return map_distinct_values(column, process_openshift_labels_to_json)
+
+
 def get_column_converters():
-    """Return source specific parquet column converters."""
+    """Return source specific parquet column converters.
+
+    Each converter takes and returns a whole pandas Series of the raw string values.
+    """
     return {
-        "report_period_start": process_openshift_datetime,
-        "report_period_end": process_openshift_datetime,
-        "interval_start": process_openshift_datetime,
-        "interval_end": process_openshift_datetime,
-        "pod_usage_cpu_core_seconds": safe_float,
-        "pod_request_cpu_core_seconds": safe_float,
-        "pod_limit_cpu_core_seconds": safe_float,
-        "pod_usage_memory_byte_seconds": safe_float,
-        "pod_request_memory_byte_seconds": safe_float,
-        "pod_limit_memory_byte_seconds": safe_float,
-        "node_capacity_cpu_cores": safe_float,
-        "node_capacity_cpu_core_seconds": safe_float,
-        "node_capacity_memory_bytes": safe_float,
-        "node_capacity_memory_byte_seconds": safe_float,
-        "persistentvolumeclaim_capacity_bytes": safe_float,
-        "persistentvolumeclaim_capacity_byte_seconds": safe_float,
-        "volume_request_storage_byte_seconds": safe_float,
-        "persistentvolumeclaim_usage_byte_seconds": safe_float,
-        "pod_labels": process_openshift_labels_to_json,
-        "persistentvolume_labels": process_openshift_labels_to_json,
-        "persistentvolumeclaim_labels": process_openshift_labels_to_json,
-        "node_labels": process_openshift_labels_to_json,
-        "namespace_labels": process_openshift_labels_to_json,
+        "report_period_start": process_openshift_datetime_column,
+        "report_period_end": process_openshift_datetime_column,
+        "interval_start": process_openshift_datetime_column,
+        "interval_end": process_openshift_datetime_column,
+        "pod_usage_cpu_core_seconds": safe_float_column,
+        "pod_request_cpu_core_seconds": safe_float_column,
+        "pod_limit_cpu_core_seconds": safe_float_column,
+        "pod_usage_memory_byte_seconds": safe_float_column,
+        "pod_request_memory_byte_seconds": safe_float_column,
+        "pod_limit_memory_byte_seconds": safe_float_column,
+        "node_capacity_cpu_cores": safe_float_column,
+        "node_capacity_cpu_core_seconds": safe_float_column,
+        "node_capacity_memory_bytes": safe_float_column,
+        "node_capacity_memory_byte_seconds": safe_float_column,
+        "persistentvolumeclaim_capacity_bytes": safe_float_column,
+        "persistentvolumeclaim_capacity_byte_seconds": safe_float_column,
+        "volume_request_storage_byte_seconds": safe_float_column,
+        "persistentvolumeclaim_usage_byte_seconds": safe_float_column,
+        "pod_labels": process_openshift_labels_column,
+        "persistentvolume_labels": process_openshift_labels_column,
+        "persistentvolumeclaim_labels": process_openshift_labels_column,
+        "node_labels": process_openshift_labels_column,
+        "namespace_labels": process_openshift_labels_column,
     }
 
 
@@ -447,20 +466,126 @@ def ocp_generate_daily_data(data_frame, report_type):
 
 def match_openshift_labels(tag_dict, matched_tags, cluster_topology):
     """Match AWS data by OpenShift label associated with OpenShift cluster."""
-    tag_dict = json.loads(tag_dict)
-    cluster_id = cluster_topology.get("cluster_id").lower()
-    cluster_alias = cluster_topology.get("cluster_alias").lower()
-    nodes = [node.lower() for node in cluster_topology.get("nodes", [])]
-    projects = [project.lower() for project in cluster_topology.get("projects", [])]
-    tag_matches = []
-    for key, value in tag_dict.items():
-        tag = json.dumps({key.lower(): value.lower()}).replace("{", "").replace("}", "")
-        if {key.lower(): value.lower()} in matched_tags:
-            tag_matches.append(tag)
-        elif key.lower() == "openshift_project" and value.lower() in projects:
-            return tag
-        elif key.lower() == "openshift_node" and value.lower() in nodes:
-            return tag
-        elif key.lower() == "openshift_cluster" and value.lower() in (cluster_id, cluster_alias):
-            return tag
-    return ",".join(tag_matches)
+    return OpenShiftTopologyMatcher(cluster_topology, matched_tags).match_labels(tag_dict)
+
+
+class SubstringIndex:
+    """Aho-Corasick automaton reporting whether any of a fixed set of strings occurs in a value.
+
+    Building the automaton is linear in the total length of the patterns, and a
+    search is linear in the length of the value regardless of how many patterns
+    there are.
+    """
+
+    def __init__(self, patterns):
+        """Build the automaton for the non-empty patterns."""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [False]
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern):
+        """Add a pattern to the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(False)
+            state = next_state
+        self._output[state] = True
+
+    def _build_failure_links(self):
+        """Compute the failure links breadth first."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] = self._output[next_state] or self._output[self._fail[next_state]]
+
+    def search(self, value):
+        """Return True if any pattern is a substring of value."""
+        if not isinstance(value, str):
+            return False
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in value:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return True
+        return False
+
+
+class OpenShiftTopologyMatcher:
+    """Match cloud line items to an OpenShift cluster.
+
+    The matcher is built once per cluster topology and shared by the AWS and
+    Azure OpenShift on cloud processors. Resource ids are matched with a
+    substring index over the distinct values of a column, and tag strings
+    are matched once per distinct value against pre-lowered topology sets.
+    """
+
+    def __init__(self, cluster_topology, matched_tags):
+        """Pre-compute the lookups for the cluster topology."""
+        self.cluster_topology = cluster_topology
+        self.cluster_ids = {
+            (cluster_topology.get("cluster_id") or "").lower(),
+            (cluster_topology.get("cluster_alias") or "").lower(),
+        }
+        self.nodes = {node.lower() for node in cluster_topology.get("nodes", []) if node}
+        self.projects = {project.lower() for project in cluster_topology.get("projects", []) if project}
+        self.matched_tags = {next(iter(tag.items())) for tag in matched_tags if len(tag) == 1}
+        self._resource_indexes = {}
+
+    def resource_index(self, topology_keys):
+        """Return the substring index over the topology resources listed under topology_keys."""
+        if topology_keys not in self._resource_indexes:
+            resources = [resource for key in topology_keys for resource in self.cluster_topology.get(key, [])]
+            self._resource_indexes[topology_keys] = SubstringIndex(resources)
+        return self._resource_indexes[topology_keys]
+
+    def match_resources(self, column, topology_keys):
+        """Return a boolean Series that is True where a topology resource occurs in the column value."""
+        return map_distinct_values(column, self.resource_index(topology_keys).search).astype(bool)
+
+    def match_labels(self, tag_dict):
+        """Return the matched tags for a JSON tag string."""
+        tag_dict = json.loads(tag_dict)
+        tag_matches = []
+        for key, value in tag_dict.items():
+            key, value = key.lower(), value.lower()
+            tag = json.dumps({key: value}).replace("{", "").replace("}", "")
+            if (key, value) in self.matched_tags:
+                tag_matches.append(tag)
+            elif key == "openshift_project" and value in self.projects:
+                return tag
+            elif key == "openshift_node" and value in self.nodes:
+                return tag
+            elif key == "openshift_cluster" and value in self.cluster_ids:
+                return tag
+        return ",".join(tag_matches)
+
+    def match(self, data_frame, resource_id_df, tag_column, topology_keys):
+        """Filter a dataframe to the subset that matches the cluster by resource id or tag."""
+        data_frame["resource_id_matched"] = self.match_resources(resource_id_df, topology_keys)
+        data_frame["matched_tag"] = map_distinct_values(data_frame[tag_column], self.match_labels)
+        openshift_matched_data_frame = data_frame[
+            (data_frame["resource_id_matched"] == True) | (data_frame["matched_tag"] != "")  # noqa: E712
+        ]
+
+        openshift_matched_data_frame["uuid"] = [str(uuid.uuid4()) for _ in range(len(openshift_matched_data_frame))]
+
+        return openshift_matched_data_frame
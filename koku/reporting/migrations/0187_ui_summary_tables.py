@@ -0,0 +1,119 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+from django.db import migrations
+
+
+UI_SUMMARY_TABLES = (
+    "reporting_aws_compute_summary",
+    "reporting_aws_compute_summary_by_account",
+    "reporting_aws_compute_summary_by_region",
+    "reporting_aws_compute_summary_by_service",
+    "reporting_aws_cost_summary",
+    "reporting_aws_cost_summary_by_account",
+    "reporting_aws_cost_summary_by_region",
+    "reporting_aws_cost_summary_by_service",
+    "reporting_aws_database_summary",
+    "reporting_aws_network_summary",
+    "reporting_aws_storage_summary",
+    "reporting_aws_storage_summary_by_account",
+    "reporting_aws_storage_summary_by_region",
+    "reporting_aws_storage_summary_by_service",
+    "reporting_ocp_cost_summary",
+    "reporting_ocp_cost_summary_by_node",
+    "reporting_ocp_cost_summary_by_project",
+    "reporting_ocp_pod_summary",
+    "reporting_ocp_pod_summary_by_project",
+    "reporting_ocp_volume_summary",
+    "reporting_ocp_volume_summary_by_project",
+)
+
+
+def convert_matview_to_partitioned_table(schema_editor, table_name):
+    """Replace a UI summary materialized view with a table partitioned by usage_start, keeping its rows."""
+    old_table = f"__{table_name}"
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+SELECT indexname, indexdef
+  FROM pg_indexes
+ WHERE schemaname = current_schema
+   AND tablename = %s
+""",
+            [table_name],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            """
+SELECT attname
+  FROM pg_attribute
+ WHERE attrelid = %s::regclass
+   AND attnum > 0
+   AND NOT attisdropped
+   AND attname != 'id'
+ ORDER BY attnum
+""",
+            [table_name],
+        )
+        columns = ", ".join(f'"{row[0]}"' for row in cursor.fetchall())
+
+        for index_name, _ in indexes:
+            cursor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+        cursor.execute(f'ALTER MATERIALIZED VIEW "{table_name}" RENAME TO "{old_table}"')
+        cursor.execute(f'CREATE TABLE "{table_name}" (LIKE "{old_table}") PARTITION BY RANGE (usage_start)')
+        cursor.execute(f'CREATE SEQUENCE "{table_name}_id_seq"')
+        cursor.execute(
+            f"""
+ALTER TABLE "{table_name}"
+      ALTER COLUMN id SET DEFAULT nextval('{table_name}_id_seq'),
+      ALTER COLUMN id SET NOT NULL,
+      ALTER COLUMN usage_start SET NOT NULL,
+      ADD PRIMARY KEY (usage_start, id)
+"""
+        )
+        cursor.execute(f'ALTER SEQUENCE "{table_name}_id_seq" OWNED BY "{table_name}".id')
+
+        # Inserting the tracking rows fires the partition manager trigger that creates the partitions
+        cursor.execute(
+            f"""
+INSERT INTO partitioned_tables (
+    schema_name, table_name, partition_of_table_name, partition_type, partition_col, partition_parameters, active
+)
+SELECT current_schema, '{table_name}_default', '{table_name}', 'range', 'usage_start', '{{"default": true}}', true
+ UNION ALL
+SELECT current_schema,
+       '{table_name}_' || to_char(month_start, 'YYYY_MM'),
+       '{table_name}',
+       'range',
+       'usage_start',
+       jsonb_build_object(
+           'default', false,
+           'from', to_char(month_start, 'YYYY-MM-DD'),
+           'to', to_char(month_start + interval '1 month', 'YYYY-MM-DD')
+       ),
+       true
+  FROM (SELECT DISTINCT date_trunc('month', usage_start)::date AS month_start FROM "{old_table}") AS months
+"""
+        )
+
+        for _, index_def in indexes:
+            # Unique indexes on a partitioned table must include usage_start, the matview ones need not
+            cursor.execute(index_def.replace("CREATE UNIQUE INDEX", "CREATE INDEX"))
+        cursor.execute(f'CREATE INDEX "{table_name}_source" ON "{table_name}" (source_uuid, usage_start)')
+
+        cursor.execute(f'INSERT INTO "{table_name}" ({columns}) SELECT {columns} FROM "{old_table}"')
+        cursor.execute(f'DROP MATERIALIZED VIEW "{old_table}"')
+
+
+def convert_ui_summary_matviews(apps, schema_editor):
+    for table_name in UI_SUMMARY_TABLES:
+        convert_matview_to_partitioned_table(schema_editor, table_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting", "0186_subpartition_cols")]
+
+    # The materialized view definitions are not kept, so reversing leaves the populated tables in place
+    operations = [migrations.RunPython(code=convert_ui_summary_matviews, reverse_code=migrations.RunPython.noop)]
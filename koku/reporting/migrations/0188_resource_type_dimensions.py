@@ -0,0 +1,407 @@
+#
+# Copyright 2021 Red Hat Inc.
+# SPDX-License-Identifier: Apache-2.0
+#
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+# Frozen copy of masu/database/sql/reporting_*_dimension.sql for every source, so later
+# changes to those files do not change what this migration does.
+POPULATE_DIMENSION_TABLES_SQL = """
+INSERT INTO reporting_ocp_cluster_dimension (
+    source_uuid,
+    cluster_id,
+    cluster_alias
+)
+SELECT DISTINCT source_uuid, cluster_id, cluster_alias
+  FROM reporting_ocp_cost_summary
+ WHERE cluster_id IS NOT NULL;
+
+INSERT INTO reporting_ocp_node_dimension (
+    source_uuid,
+    cluster_id,
+    node
+)
+SELECT DISTINCT source_uuid, cluster_id, node
+  FROM reporting_ocp_cost_summary_by_node
+ WHERE cluster_id IS NOT NULL
+   AND node IS NOT NULL;
+
+INSERT INTO reporting_ocp_project_dimension (
+    source_uuid,
+    cluster_id,
+    namespace
+)
+SELECT DISTINCT source_uuid, cluster_id, namespace
+  FROM reporting_ocp_cost_summary_by_project
+ WHERE cluster_id IS NOT NULL
+   AND namespace IS NOT NULL;
+
+INSERT INTO reporting_aws_account_dimension (
+    source_uuid,
+    usage_account_id,
+    account_alias_id
+)
+SELECT DISTINCT source_uuid, usage_account_id, account_alias_id
+  FROM reporting_aws_cost_summary_by_account
+ WHERE usage_account_id IS NOT NULL;
+
+INSERT INTO reporting_aws_region_dimension (
+    source_uuid,
+    usage_account_id,
+    region
+)
+SELECT DISTINCT source_uuid, usage_account_id, region
+  FROM reporting_aws_cost_summary_by_region
+ WHERE usage_account_id IS NOT NULL
+   AND region IS NOT NULL;
+
+INSERT INTO reporting_aws_service_dimension (
+    source_uuid,
+    usage_account_id,
+    product_code
+)
+SELECT DISTINCT source_uuid, usage_account_id, product_code
+  FROM reporting_aws_cost_summary_by_service
+ WHERE usage_account_id IS NOT NULL
+   AND product_code IS NOT NULL;
+
+INSERT INTO reporting_azure_subscription_dimension (
+    source_uuid,
+    subscription_guid
+)
+SELECT DISTINCT source_uuid, subscription_guid
+  FROM reporting_azure_cost_summary_by_account
+ WHERE subscription_guid IS NOT NULL;
+
+INSERT INTO reporting_azure_region_dimension (
+    source_uuid,
+    subscription_guid,
+    resource_location
+)
+SELECT DISTINCT source_uuid, subscription_guid, resource_location
+  FROM reporting_azure_cost_summary_by_location
+ WHERE subscription_guid IS NOT NULL
+   AND resource_location IS NOT NULL;
+
+INSERT INTO reporting_azure_service_dimension (
+    source_uuid,
+    subscription_guid,
+    service_name
+)
+SELECT DISTINCT source_uuid, subscription_guid, service_name
+  FROM reporting_azure_cost_summary_by_service
+ WHERE subscription_guid IS NOT NULL
+   AND service_name IS NOT NULL;
+
+INSERT INTO reporting_gcp_account_dimension (
+    source_uuid,
+    account_id
+)
+SELECT DISTINCT source_uuid, account_id
+  FROM reporting_gcp_cost_summary_by_account
+ WHERE account_id IS NOT NULL;
+
+INSERT INTO reporting_gcp_project_dimension (
+    source_uuid,
+    account_id,
+    project_id
+)
+SELECT DISTINCT source_uuid, account_id, project_id
+  FROM reporting_gcp_cost_summary_by_project
+ WHERE account_id IS NOT NULL
+   AND project_id IS NOT NULL;
+
+INSERT INTO reporting_gcp_region_dimension (
+    source_uuid,
+    account_id,
+    region
+)
+SELECT DISTINCT source_uuid, account_id, region
+  FROM reporting_gcp_cost_summary_by_region
+ WHERE account_id IS NOT NULL
+   AND region IS NOT NULL;
+
+INSERT INTO reporting_gcp_service_dimension (
+    source_uuid,
+    account_id,
+    service_id,
+    service_alias
+)
+SELECT DISTINCT source_uuid, account_id, service_id, service_alias
+  FROM reporting_gcp_cost_summary_by_service
+ WHERE account_id IS NOT NULL
+   AND service_id IS NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting", "0187_ui_summary_tables")]
+
+    operations = [
+        migrations.CreateModel(
+            name="OCPClusterDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("cluster_id", models.TextField()),
+                ("cluster_alias", models.TextField(null=True)),
+            ],
+            options={"db_table": "reporting_ocp_cluster_dimension"},
+        ),
+        migrations.CreateModel(
+            name="OCPNodeDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("cluster_id", models.TextField()),
+                ("node", models.TextField()),
+            ],
+            options={"db_table": "reporting_ocp_node_dimension"},
+        ),
+        migrations.CreateModel(
+            name="OCPProjectDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("cluster_id", models.TextField()),
+                ("namespace", models.TextField()),
+            ],
+            options={"db_table": "reporting_ocp_project_dimension"},
+        ),
+        migrations.CreateModel(
+            name="AWSAccountDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("usage_account_id", models.TextField()),
+                (
+                    "account_alias",
+                    models.ForeignKey(
+                        null=True, on_delete=django.db.models.deletion.SET_NULL, to="reporting.awsaccountalias"
+                    ),
+                ),
+            ],
+            options={"db_table": "reporting_aws_account_dimension"},
+        ),
+        migrations.CreateModel(
+            name="AWSRegionDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("usage_account_id", models.TextField()),
+                ("region", models.TextField()),
+            ],
+            options={"db_table": "reporting_aws_region_dimension"},
+        ),
+        migrations.CreateModel(
+            name="AWSServiceDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("usage_account_id", models.TextField()),
+                ("product_code", models.TextField()),
+            ],
+            options={"db_table": "reporting_aws_service_dimension"},
+        ),
+        migrations.CreateModel(
+            name="AzureSubscriptionDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("subscription_guid", models.TextField()),
+            ],
+            options={"db_table": "reporting_azure_subscription_dimension"},
+        ),
+        migrations.CreateModel(
+            name="AzureRegionDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("subscription_guid", models.TextField()),
+                ("resource_location", models.TextField()),
+            ],
+            options={"db_table": "reporting_azure_region_dimension"},
+        ),
+        migrations.CreateModel(
+            name="AzureServiceDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("subscription_guid", models.TextField()),
+                ("service_name", models.TextField()),
+            ],
+            options={"db_table": "reporting_azure_service_dimension"},
+        ),
+        migrations.CreateModel(
+            name="GCPAccountDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("account_id", models.TextField()),
+            ],
+            options={"db_table": "reporting_gcp_account_dimension"},
+        ),
+        migrations.CreateModel(
+            name="GCPProjectDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("account_id", models.TextField()),
+                ("project_id", models.TextField()),
+            ],
+            options={"db_table": "reporting_gcp_project_dimension"},
+        ),
+        migrations.CreateModel(
+            name="GCPRegionDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("account_id", models.TextField()),
+                ("region", models.TextField()),
+            ],
+            options={"db_table": "reporting_gcp_region_dimension"},
+        ),
+        migrations.CreateModel(
+            name="GCPServiceDimension",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("source_uuid", models.UUIDField(null=True)),
+                ("account_id", models.TextField()),
+                ("service_id", models.TextField()),
+                ("service_alias", models.TextField(null=True)),
+            ],
+            options={"db_table": "reporting_gcp_service_dimension"},
+        ),
+        migrations.AddIndex(
+            model_name="ocpclusterdimension", index=models.Index(fields=["source_uuid"], name="ocp_cluster_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="ocpclusterdimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["cluster_id"], name="ocp_cluster_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ocpclusterdimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["cluster_alias"], name="ocp_cluster_alias_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ocpnodedimension", index=models.Index(fields=["source_uuid"], name="ocp_node_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="ocpnodedimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["node"], name="ocp_node_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ocpprojectdimension", index=models.Index(fields=["source_uuid"], name="ocp_project_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="ocpprojectdimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["namespace"], name="ocp_project_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="awsaccountdimension", index=models.Index(fields=["source_uuid"], name="aws_account_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="awsaccountdimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["usage_account_id"], name="aws_account_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="awsregiondimension", index=models.Index(fields=["source_uuid"], name="aws_region_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="awsregiondimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["region"], name="aws_region_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="awsservicedimension", index=models.Index(fields=["source_uuid"], name="aws_service_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="awsservicedimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["product_code"], name="aws_service_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="azuresubscriptiondimension",
+            index=models.Index(fields=["source_uuid"], name="azure_sub_dim_source"),
+        ),
+        migrations.AddIndex(
+            model_name="azuresubscriptiondimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["subscription_guid"], name="azure_sub_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="azureregiondimension",
+            index=models.Index(fields=["source_uuid"], name="azure_region_dim_source"),
+        ),
+        migrations.AddIndex(
+            model_name="azureregiondimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["resource_location"], name="azure_region_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="azureservicedimension",
+            index=models.Index(fields=["source_uuid"], name="azure_service_dim_source"),
+        ),
+        migrations.AddIndex(
+            model_name="azureservicedimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["service_name"], name="azure_service_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gcpaccountdimension", index=models.Index(fields=["source_uuid"], name="gcp_account_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="gcpaccountdimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["account_id"], name="gcp_account_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gcpprojectdimension", index=models.Index(fields=["source_uuid"], name="gcp_project_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="gcpprojectdimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["project_id"], name="gcp_project_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gcpregiondimension", index=models.Index(fields=["source_uuid"], name="gcp_region_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="gcpregiondimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["region"], name="gcp_region_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gcpservicedimension", index=models.Index(fields=["source_uuid"], name="gcp_service_dim_source")
+        ),
+        migrations.AddIndex(
+            model_name="gcpservicedimension",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["service_alias"], name="gcp_service_dim_like", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.RunSQL(sql=POPULATE_DIMENSION_TABLES_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
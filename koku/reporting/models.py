@@ -16,6 +16,7 @@ from reporting.provider.all.openshift.models import OCPAllDatabaseSummary
 from reporting.provider.all.openshift.models import OCPAllNetworkSummary
 from reporting.provider.all.openshift.models import OCPAllStorageSummary
 from reporting.provider.aws.models import AWSAccountAlias
+from reporting.provider.aws.models import AWSAccountDimension
 from reporting.provider.aws.models import AWSComputeSummary
 from reporting.provider.aws.models import AWSComputeSummaryByAccount
 from reporting.provider.aws.models import AWSComputeSummaryByRegion
@@ -36,6 +37,8 @@ from reporting.provider.aws.models import AWSDatabaseSummary
 from reporting.provider.aws.models import AWSEnabledTagKeys
 from reporting.provider.aws.models import AWSNetworkSummary
 from reporting.provider.aws.models import AWSOrganizationalUnit
+from reporting.provider.aws.models import AWSRegionDimension
+from reporting.provider.aws.models import AWSServiceDimension
 from reporting.provider.aws.models import AWSStorageSummary
 from reporting.provider.aws.models import AWSStorageSummaryByAccount
 from reporting.provider.aws.models import AWSStorageSummaryByRegion
@@ -65,7 +68,10 @@ from reporting.provider.azure.models import AzureDatabaseSummary
 from reporting.provider.azure.models import AzureEnabledTagKeys
 from reporting.provider.azure.models import AzureMeter
 from reporting.provider.azure.models import AzureNetworkSummary
+from reporting.provider.azure.models import AzureRegionDimension
+from reporting.provider.azure.models import AzureServiceDimension
 from reporting.provider.azure.models import AzureStorageSummary
+from reporting.provider.azure.models import AzureSubscriptionDimension
 from reporting.provider.azure.models import AzureTagsSummary
 from reporting.provider.azure.openshift.models import OCPAzureComputeSummary
 from reporting.provider.azure.openshift.models import OCPAzureCostLineItemDailySummary
@@ -78,6 +84,7 @@ from reporting.provider.azure.openshift.models import OCPAzureDatabaseSummary
 from reporting.provider.azure.openshift.models import OCPAzureNetworkSummary
 from reporting.provider.azure.openshift.models import OCPAzureStorageSummary
 from reporting.provider.azure.openshift.models import OCPAzureTagsSummary
+from reporting.provider.gcp.models import GCPAccountDimension
 from reporting.provider.gcp.models import GCPComputeSummary
 from reporting.provider.gcp.models import GCPComputeSummaryByAccount
 from reporting.provider.gcp.models import GCPComputeSummaryByProject
@@ -94,6 +101,9 @@ from reporting.provider.gcp.models import GCPCostSummaryByService
 from reporting.provider.gcp.models import GCPDatabaseSummary
 from reporting.provider.gcp.models import GCPEnabledTagKeys
 from reporting.provider.gcp.models import GCPNetworkSummary
+from reporting.provider.gcp.models import GCPProjectDimension
+from reporting.provider.gcp.models import GCPRegionDimension
+from reporting.provider.gcp.models import GCPServiceDimension
 from reporting.provider.gcp.models import GCPStorageSummary
 from reporting.provider.gcp.models import GCPStorageSummaryByAccount
 from reporting.provider.gcp.models import GCPStorageSummaryByProject
@@ -101,14 +111,17 @@ from reporting.provider.gcp.models import GCPStorageSummaryByRegion
 from reporting.provider.gcp.models import GCPStorageSummaryByService
 from reporting.provider.gcp.models import GCPTagsSummary
 from reporting.provider.ocp.costs.models import CostSummary
+from reporting.provider.ocp.models import OCPClusterDimension
 from reporting.provider.ocp.models import OCPCostSummary
 from reporting.provider.ocp.models import OCPCostSummaryByNode
 from reporting.provider.ocp.models import OCPCostSummaryByProject
 from reporting.provider.ocp.models import OCPEnabledTagKeys
+from reporting.provider.ocp.models import OCPNodeDimension
 from reporting.provider.ocp.models import OCPNodeLabelLineItem
 from reporting.provider.ocp.models import OCPNodeLabelLineItemDaily
 from reporting.provider.ocp.models import OCPPodSummary
 from reporting.provider.ocp.models import OCPPodSummaryByProject
+from reporting.provider.ocp.models import OCPProjectDimension
 from reporting.provider.ocp.models import OCPStorageLineItem
 from reporting.provider.ocp.models import OCPStorageLineItemDaily
 from reporting.provider.ocp.models import OCPStorageVolumeLabelSummary
@@ -121,7 +134,8 @@ from reporting.provider.ocp.models import OCPUsageReportPeriod
 from reporting.provider.ocp.models import OCPVolumeSummary
 from reporting.provider.ocp.models import OCPVolumeSummaryByProject
 
-AWS_MATERIALIZED_VIEWS = (
+# Partitioned summary tables maintained per source, see ReportDBAccessorBase.populate_ui_summary_tables
+AWS_UI_SUMMARY_TABLES = (
     AWSComputeSummary,
     AWSComputeSummaryByAccount,
     AWSComputeSummaryByRegion,
@@ -149,7 +163,7 @@ AZURE_MATERIALIZED_VIEWS = (
     AzureDatabaseSummary,
 )
 
-OCP_MATERIALIZED_VIEWS = (
+OCP_UI_SUMMARY_TABLES = (
     OCPPodSummary,
     OCPPodSummaryByProject,
     OCPVolumeSummary,
@@ -192,11 +206,11 @@ OCP_ON_INFRASTRUCTURE_MATERIALIZED_VIEWS = (
     # OCPAllNetworkSummary,
     # OCPAllStorageSummary,
     # OCPAllCostLineItemProjectDailySummary,
-    OCPCostSummary,
-    OCPCostSummaryByProject,
-    OCPCostSummaryByNode,
 )
 
+# OCP summary tables that also carry infrastructure costs from AWS and Azure sources
+OCP_ON_INFRASTRUCTURE_UI_SUMMARY_TABLES = (OCPCostSummary, OCPCostSummaryByProject, OCPCostSummaryByNode)
+
 GCP_MATERIALIZED_VIEWS = (
     GCPCostSummary,
     GCPCostSummaryByAccount,
@@ -216,3 +230,12 @@ GCP_MATERIALIZED_VIEWS = (
     GCPNetworkSummary,
     GCPDatabaseSummary,
 )
+
+# Distinct resource type values per source, see ReportDBAccessorBase.populate_dimension_tables
+AWS_DIMENSION_TABLES = (AWSAccountDimension, AWSRegionDimension, AWSServiceDimension)
+
+AZURE_DIMENSION_TABLES = (AzureSubscriptionDimension, AzureRegionDimension, AzureServiceDimension)
+
+GCP_DIMENSION_TABLES = (GCPAccountDimension, GCPProjectDimension, GCPRegionDimension, GCPServiceDimension)
+
+OCP_DIMENSION_TABLES = (OCPClusterDimension, OCPNodeDimension, OCPProjectDimension)
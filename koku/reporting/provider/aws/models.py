@@ -359,9 +359,9 @@ class AWSTagsSummary(models.Model):
     account_alias = models.ForeignKey("AWSAccountAlias", on_delete=models.SET_NULL, null=True)
 
 
-# Materialized Views for UI Reporting
+# Summary tables for UI Reporting
 class AWSCostSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost.
 
@@ -389,7 +389,7 @@ class AWSCostSummary(models.Model):
 
 
 class AWSCostSummaryByService(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost by service.
 
@@ -427,7 +427,7 @@ class AWSCostSummaryByService(models.Model):
 
 
 class AWSCostSummaryByAccount(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost by account.
 
@@ -461,7 +461,7 @@ class AWSCostSummaryByAccount(models.Model):
 
 
 class AWSCostSummaryByRegion(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost by region.
 
@@ -499,7 +499,7 @@ class AWSCostSummaryByRegion(models.Model):
 
 
 class AWSComputeSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -537,7 +537,7 @@ class AWSComputeSummary(models.Model):
 
 
 class AWSComputeSummaryByService(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage by service and instance type.
 
@@ -585,7 +585,7 @@ class AWSComputeSummaryByService(models.Model):
 
 
 class AWSComputeSummaryByAccount(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost by service and instance type.
 
@@ -629,7 +629,7 @@ class AWSComputeSummaryByAccount(models.Model):
 
 
 class AWSComputeSummaryByRegion(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost by service and instance type.
 
@@ -677,7 +677,7 @@ class AWSComputeSummaryByRegion(models.Model):
 
 
 class AWSStorageSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of storage usage.
 
@@ -711,7 +711,7 @@ class AWSStorageSummary(models.Model):
 
 
 class AWSStorageSummaryByService(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of storage usage by service.
 
@@ -753,7 +753,7 @@ class AWSStorageSummaryByService(models.Model):
 
 
 class AWSStorageSummaryByAccount(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of storage by account.
 
@@ -793,7 +793,7 @@ class AWSStorageSummaryByAccount(models.Model):
 
 
 class AWSStorageSummaryByRegion(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of total cost by service and instance type.
 
@@ -837,7 +837,7 @@ class AWSStorageSummaryByRegion(models.Model):
 
 
 class AWSNetworkSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of network usage.
 
@@ -877,7 +877,7 @@ class AWSNetworkSummary(models.Model):
 
 
 class AWSDatabaseSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of database usage.
 
@@ -970,3 +970,75 @@ class AWSEnabledTagKeys(models.Model):
 
     key = models.CharField(max_length=253, primary_key=True)
     enabled = models.BooleanField(default=True)
+
+
+class AWSAccountDimension(models.Model):
+    """The distinct AWS accounts of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_aws_cost_summary_by_account, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for AWSAccountDimension."""
+
+        db_table = "reporting_aws_account_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="aws_account_dim_source"),
+            GinIndex(fields=["usage_account_id"], name="aws_account_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    usage_account_id = models.TextField()
+
+    account_alias = models.ForeignKey("AWSAccountAlias", on_delete=models.SET_NULL, null=True)
+
+
+class AWSRegionDimension(models.Model):
+    """The distinct AWS regions of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_aws_cost_summary_by_region, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for AWSRegionDimension."""
+
+        db_table = "reporting_aws_region_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="aws_region_dim_source"),
+            GinIndex(fields=["region"], name="aws_region_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    usage_account_id = models.TextField()
+
+    region = models.TextField()
+
+
+class AWSServiceDimension(models.Model):
+    """The distinct AWS services of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_aws_cost_summary_by_service, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for AWSServiceDimension."""
+
+        db_table = "reporting_aws_service_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="aws_service_dim_source"),
+            GinIndex(fields=["product_code"], name="aws_service_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    usage_account_id = models.TextField()
+
+    product_code = models.TextField()
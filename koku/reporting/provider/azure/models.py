@@ -6,6 +6,7 @@
 from uuid import uuid4
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import JSONField
 
@@ -455,3 +456,73 @@ class AzureEnabledTagKeys(models.Model):
 
     id = models.BigAutoField(primary_key=True)
     key = models.CharField(max_length=253, unique=True)
+
+
+class AzureSubscriptionDimension(models.Model):
+    """The distinct Azure subscriptions of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_azure_cost_summary_by_account, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for AzureSubscriptionDimension."""
+
+        db_table = "reporting_azure_subscription_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="azure_sub_dim_source"),
+            GinIndex(fields=["subscription_guid"], name="azure_sub_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    subscription_guid = models.TextField()
+
+
+class AzureRegionDimension(models.Model):
+    """The distinct Azure regions of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_azure_cost_summary_by_location, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for AzureRegionDimension."""
+
+        db_table = "reporting_azure_region_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="azure_region_dim_source"),
+            GinIndex(fields=["resource_location"], name="azure_region_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    subscription_guid = models.TextField()
+
+    resource_location = models.TextField()
+
+
+class AzureServiceDimension(models.Model):
+    """The distinct Azure services of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_azure_cost_summary_by_service, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for AzureServiceDimension."""
+
+        db_table = "reporting_azure_service_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="azure_service_dim_source"),
+            GinIndex(fields=["service_name"], name="azure_service_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    subscription_guid = models.TextField()
+
+    service_name = models.TextField()
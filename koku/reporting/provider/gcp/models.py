@@ -852,3 +852,99 @@ class GCPDatabaseSummary(models.Model):
     service_id = models.CharField(max_length=256, null=True)
 
     service_alias = models.CharField(max_length=256, null=True, blank=True)
+
+
+class GCPAccountDimension(models.Model):
+    """The distinct GCP accounts of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_gcp_cost_summary_by_account, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for GCPAccountDimension."""
+
+        db_table = "reporting_gcp_account_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="gcp_account_dim_source"),
+            GinIndex(fields=["account_id"], name="gcp_account_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    account_id = models.TextField()
+
+
+class GCPProjectDimension(models.Model):
+    """The distinct GCP projects of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_gcp_cost_summary_by_project, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for GCPProjectDimension."""
+
+        db_table = "reporting_gcp_project_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="gcp_project_dim_source"),
+            GinIndex(fields=["project_id"], name="gcp_project_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    account_id = models.TextField()
+
+    project_id = models.TextField()
+
+
+class GCPRegionDimension(models.Model):
+    """The distinct GCP regions of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_gcp_cost_summary_by_region, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for GCPRegionDimension."""
+
+        db_table = "reporting_gcp_region_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="gcp_region_dim_source"),
+            GinIndex(fields=["region"], name="gcp_region_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    account_id = models.TextField()
+
+    region = models.TextField()
+
+
+class GCPServiceDimension(models.Model):
+    """The distinct GCP services of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_gcp_cost_summary_by_service, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for GCPServiceDimension."""
+
+        db_table = "reporting_gcp_service_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="gcp_service_dim_source"),
+            GinIndex(fields=["service_alias"], name="gcp_service_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    account_id = models.TextField()
+
+    service_id = models.TextField()
+
+    service_alias = models.TextField(null=True)
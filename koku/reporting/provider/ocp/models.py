@@ -615,7 +615,7 @@ class OCPProject(models.Model):
 
 
 class OCPCostSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -655,7 +655,7 @@ class OCPCostSummary(models.Model):
 
 
 class OCPCostSummaryByProject(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -700,7 +700,7 @@ class OCPCostSummaryByProject(models.Model):
 
 
 class OCPCostSummaryByNode(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -742,7 +742,7 @@ class OCPCostSummaryByNode(models.Model):
 
 
 class OCPPodSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -806,7 +806,7 @@ class OCPPodSummary(models.Model):
 
 
 class OCPPodSummaryByProject(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -872,7 +872,7 @@ class OCPPodSummaryByProject(models.Model):
 
 
 class OCPVolumeSummary(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -926,7 +926,7 @@ class OCPVolumeSummary(models.Model):
 
 
 class OCPVolumeSummaryByProject(models.Model):
-    """A MATERIALIZED VIEW specifically for UI API queries.
+    """A partitioned summary table specifically for UI API queries.
 
     This table gives a daily breakdown of compute usage.
 
@@ -979,3 +979,76 @@ class OCPVolumeSummaryByProject(models.Model):
     infrastructure_monthly_cost_json = JSONField(null=True)
 
     supplementary_monthly_cost_json = JSONField(null=True)
+
+
+class OCPClusterDimension(models.Model):
+    """The distinct OpenShift clusters of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_ocp_cost_summary, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for OCPClusterDimension."""
+
+        db_table = "reporting_ocp_cluster_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="ocp_cluster_dim_source"),
+            GinIndex(fields=["cluster_id"], name="ocp_cluster_dim_like", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["cluster_alias"], name="ocp_cluster_alias_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    cluster_id = models.TextField()
+
+    cluster_alias = models.TextField(null=True)
+
+
+class OCPNodeDimension(models.Model):
+    """The distinct OpenShift nodes of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_ocp_cost_summary_by_node, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for OCPNodeDimension."""
+
+        db_table = "reporting_ocp_node_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="ocp_node_dim_source"),
+            GinIndex(fields=["node"], name="ocp_node_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    cluster_id = models.TextField()
+
+    node = models.TextField()
+
+
+class OCPProjectDimension(models.Model):
+    """The distinct OpenShift projects of each source, for resource type lookups.
+
+    Rebuilt per source from reporting_ocp_cost_summary_by_project, see
+    ReportDBAccessorBase.populate_dimension_tables.
+
+    """
+
+    class Meta:
+        """Meta for OCPProjectDimension."""
+
+        db_table = "reporting_ocp_project_dimension"
+        indexes = [
+            models.Index(fields=["source_uuid"], name="ocp_project_dim_source"),
+            GinIndex(fields=["namespace"], name="ocp_project_dim_like", opclasses=["gin_trgm_ops"]),
+        ]
+
+    source_uuid = models.UUIDField(null=True)
+
+    cluster_id = models.TextField()
+
+    namespace = models.TextField()
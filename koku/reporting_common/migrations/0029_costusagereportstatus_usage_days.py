@@ -0,0 +1,17 @@
+# Generated by Django 3.1.13 on 2021-08-02 12:00
+import django.contrib.postgres.fields
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting_common", "0028_costusagereportmanifest_operator_version")]
+
+    operations = [
+        migrations.AddField(
+            model_name="costusagereportstatus",
+            name="usage_days",
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.DateField(), null=True, size=None),
+        )
+    ]
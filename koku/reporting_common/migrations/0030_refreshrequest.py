@@ -0,0 +1,36 @@
+# Generated by Django 3.1.13 on 2021-08-09 12:00
+import django.contrib.postgres.fields
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("reporting_common", "0029_costusagereportstatus_usage_days")]
+
+    operations = [
+        migrations.CreateModel(
+            name="RefreshRequest",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("schema_name", models.CharField(max_length=63)),
+                ("provider_type", models.CharField(max_length=50)),
+                (
+                    "provider_uuids",
+                    django.contrib.postgres.fields.ArrayField(base_field=models.TextField(null=True), size=None),
+                ),
+                (
+                    "manifest_ids",
+                    django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(null=True), size=None),
+                ),
+                ("start_date", models.DateField(null=True)),
+                ("end_date", models.DateField(null=True)),
+                ("requests", models.IntegerField(default=1)),
+            ],
+            options={"db_table": "refresh_request"},
+        ),
+        migrations.AddIndex(
+            model_name="refreshrequest",
+            index=models.Index(fields=["schema_name", "provider_type"], name="refresh_request_schema_idx"),
+        ),
+    ]
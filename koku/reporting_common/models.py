@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 """Models for shared reporting tables."""
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.utils import timezone
 
@@ -43,6 +44,8 @@ class CostUsageReportStatus(models.Model):
     last_completed_datetime = models.DateTimeField(null=True)
     last_started_datetime = models.DateTimeField(null=True)
     etag = models.CharField(max_length=64, null=True)
+    # The days of usage in the report file, null when they were not recorded
+    usage_days = ArrayField(models.DateField(), null=True)
 
 
 class RegionMapping(models.Model):
@@ -61,3 +64,26 @@ class RegionMapping(models.Model):
 
     region = models.CharField(max_length=32, null=False, unique=True)
     region_name = models.CharField(max_length=64, null=False, unique=True)
+
+
+class RefreshRequest(models.Model):
+    """A materialized view refresh request waiting for the next flush of its schema and provider type.
+
+    Each request is its own row so concurrent schedulers only ever insert, the flush
+    takes and deletes every pending row of its schema and provider type in one transaction.
+    """
+
+    class Meta:
+        """Meta for RefreshRequest."""
+
+        db_table = "refresh_request"
+        indexes = [models.Index(fields=["schema_name", "provider_type"], name="refresh_request_schema_idx")]
+
+    schema_name = models.CharField(max_length=63, null=False)
+    provider_type = models.CharField(max_length=50, null=False)
+    provider_uuids = ArrayField(models.TextField(null=True), null=False)
+    manifest_ids = ArrayField(models.IntegerField(null=True), null=False)
+    # A null date means the whole refresh window
+    start_date = models.DateField(null=True)
+    end_date = models.DateField(null=True)
+    requests = models.IntegerField(default=1)